@@ -62,3 +62,5 @@ WORK_SURFACES = [
     ("200m² - 500m²", "200m² - 500m²"),
     ("> 500m²", "> 500m²"),
 ]
+
+SAVED_SEARCHES_TABLE_VERSION = "announcement.saved_searches"
@@ -0,0 +1,25 @@
+"""
+Module for custom admin configurations for the SavedSearch model.
+
+This module contains the SavedSearchAdmin class for customizing
+the Django admin interface for the SavedSearch model.
+"""
+
+from django.contrib import admin
+
+from app.announcement.models.SavedSearch import SavedSearch
+
+
+class SavedSearchAdmin(admin.ModelAdmin):
+    """
+    Custom admin options for SavedSearch model.
+
+    This class provides customizations for the admin interface of
+    the SavedSearch model in the Django admin site.
+    """
+
+    model = SavedSearch
+
+
+# Register the admin class with the SavedSearch model
+admin.site.register(SavedSearch, SavedSearchAdmin)
@@ -8,4 +8,5 @@ from app.announcement.admin.ProjectCategoryAdmin import ProjectCategoryAdmin
 from app.announcement.admin.ProjectExtensionAdmin import ProjectExtensionAdmin
 from app.announcement.admin.ProjectImageAdmin import ProjectImageAdmin
 from app.announcement.admin.PropertyTypeAdmin import PropertyTypeAdmin
+from app.announcement.admin.SavedSearchAdmin import SavedSearchAdmin
 from app.announcement.admin.WorkTypeAdmin import WorkTypeAdmin
@@ -16,3 +16,27 @@ class AnnouncementConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.announcement"
+
+    def ready(self):
+        """
+        Registers the reference tables and media sources and connects the signals of the
+        'app.announcement' application.
+        """
+        from app.announcement import SAVED_SEARCHES_TABLE_VERSION
+        from app.announcement import signals  # noqa: F401
+        from app.announcement.models.Need import Need
+        from app.announcement.models.PieceRenovate import PieceRenovate
+        from app.announcement.models.ProjectExtension import ProjectExtension
+        from app.announcement.models.SavedSearch import SavedSearch
+        from app.announcement.services.ProjectImageRenditionService import (
+            ProjectImageRenditionService,
+        )
+        from app.core.services.MediaGarbageCollector import MediaGarbageCollector
+        from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+        from app.core.signals import track_table_version
+
+        ReferenceDataRegistry.register(Need, parents=["architect_speciality"])
+        ReferenceDataRegistry.register(PieceRenovate)
+        ReferenceDataRegistry.register(ProjectExtension)
+        track_table_version(SAVED_SEARCHES_TABLE_VERSION, SavedSearch)
+        MediaGarbageCollector.register_source(ProjectImageRenditionService.get_file_names)
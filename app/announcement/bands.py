@@ -0,0 +1,55 @@
+"""
+Module providing the numeric bounds of the announcement band choices.
+
+Budgets and surfaces are chosen among display bands such as "40.000dt - 120.000dt" or
+"< 40m²". Their bounds are parsed once so that announcements store them in integer columns
+that range filters can use.
+
+Functions:
+    parse_band: Parses a band label into its lower and upper bounds.
+"""
+
+import re
+
+from app.announcement import BUDGETS
+from app.announcement import TERRAIN_SURFACES
+from app.announcement import WORK_SURFACES
+
+
+NUMBER = re.compile(r"\d[\d.]*")
+
+
+def parse_band(label):
+    """
+    Parses a band label into its bounds.
+
+    Dots are thousands separators. "< X" bands start at 0 and "> X" bands have no upper bound.
+
+    Args:
+        label (str): Band label, such as "40.000dt - 120.000dt", "< 40m²" or "> 500m²".
+
+    Raises:
+        ValueError: If the label holds no number.
+
+    Returns:
+        tuple: (lower, upper) integers, upper being None for open-ended bands.
+    """
+    numbers = [int(number.replace(".", "")) for number in NUMBER.findall(label)]
+    if not numbers:
+        raise ValueError(f"Invalid band {label!r}")
+    label = label.strip()
+    if label.startswith("<"):
+        return 0, numbers[0]
+    if label.startswith(">"):
+        return numbers[0], None
+    return numbers[0], numbers[-1]
+
+
+BAND_BOUNDS = {
+    field: {value: parse_band(value) for value, _ in choices}
+    for field, choices in (
+        ("budget", BUDGETS),
+        ("terrain_surface", TERRAIN_SURFACES),
+        ("work_surface", WORK_SURFACES),
+    )
+}
@@ -5,13 +5,27 @@ This module defines the AnnouncementViewSet class, which is a viewset
 for viewing and editing Announcement instances using Django REST Framework.
 """
 
+from rest_framework import status
 from rest_framework import viewsets
 from rest_framework.decorators import action
-
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from app.announcement import BUDGETS
+from app.announcement import CITIES
+from app.announcement import TERRAIN_SURFACES
+from app.announcement import WORK_SURFACES
+from app.announcement.controllers.utils.announcement_validators import announcement_validators
+from app.announcement.controllers.utils.AnnouncementFilterBackend import AnnouncementFilterBackend
 from app.announcement.models import Announcement
-from app.announcement.serializers import AnnouncementSerializer
+from app.announcement.models.Need import Need
+from app.announcement.models.PieceRenovate import PieceRenovate
+from app.announcement.models.ProjectExtension import ProjectExtension
+from app.announcement.serializers.AnnouncementSerializer import AnnouncementOutputSerializer
 from app.announcement.serializers.AnnouncementSerializer import AnnouncementPOSTSerializer
 from app.announcement.serializers.AnnouncementSerializer import AnnouncementPUTSerializer
+from app.announcement.serializers.AnnouncementSerializer import AnnouncementSerializer
+from app.announcement.serializers.AnnouncementSummarySerializer import AnnouncementSummarySerializer
 from app.announcement.serializers.ArchitectSpecialitySerializer import ArchitectSpecialitySerializer
 from app.announcement.serializers.ArchitecturalStyleSerializer import ArchitecturalStyleSerializer
 from app.announcement.serializers.NeedSerializer import NeedSerializer
@@ -20,18 +34,110 @@ from app.announcement.serializers.ProjectCategorySerializer import ProjectCatego
 from app.announcement.serializers.ProjectExtensionSerializer import ProjectExtensionSerializer
 from app.announcement.serializers.PropertyTypeSerializer import PropertyTypeSerializer
 from app.announcement.serializers.WorkTypeSerializer import WorkTypeSerializer
-from app.announcement.services import AnnouncementService
-
-
-class AnnouncementViewSet(viewsets.ModelViewSet):
+from app.announcement.services.AnnouncementBootstrapService import AnnouncementBootstrapService
+from app.announcement.services.AnnouncementDetailService import AnnouncementDetailService
+from app.announcement.services.AnnouncementFeedService import AnnouncementFeedService
+from app.announcement.services.AnnouncementService import AnnouncementService
+from app.announcement.services.MatchingService import MatchingService
+from app.core.controllers.BoundedUploadMixin import BoundedUploadMixin
+from app.core.controllers.conditional_response import conditional_response
+from app.core.controllers.conditional_response import constant_validators
+from app.core.controllers.conditional_response import reference_data_validators
+from app.core.controllers.OptimizedQuerySetMixin import OptimizedQuerySetMixin
+from app.core.models.ArchitectSpeciality import ArchitectSpeciality
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.core.models.PropertyType import PropertyType
+from app.core.models.WorkType import WorkType
+from app.users.controllers.utils.IsSuperUser import IsSuperUser
+
+
+class AnnouncementViewSet(BoundedUploadMixin, OptimizedQuerySetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Announcement model.
 
-    Provides endpoints for viewing and editing Announcement instances.
+    Provides endpoints for viewing and editing Announcement instances. Listings render the
+    compact AnnouncementSummarySerializer, retrieval the full announcement. The project
+    image uploads of creations and updates are bounded by the BoundedUploadHandler.
     """
 
     queryset = Announcement.objects.all()
     serializer_class = AnnouncementSerializer
+    plan_serializer_class = AnnouncementOutputSerializer
+    filter_backends = [AnnouncementFilterBackend]
+    authenticated_actions = ("get_facets", "get_feed")
+    admin_actions = ("get_matching_architects", "get_matching_announcements")
+    bounded_upload_actions = ("create_announcement", "update_announcement")
+
+    @property
+    def keyset_ordering_field(self):
+        """
+        Returns the field the listing is paginated on.
+
+        Searches are ordered by relevance, other listings by creation date.
+
+        Returns:
+            str: Name of the ordering field or annotation.
+        """
+        if AnnouncementFilterBackend().get_search(self.request):
+            return "search_rank"
+        return "created_at"
+
+    def get_serializer_class(self):
+        """
+        Returns the serializer class of the current action.
+
+        Returns:
+            type: The summary serializer for listings, the action serializer otherwise.
+        """
+        if self.action == "list":
+            return AnnouncementSummarySerializer
+        return super().get_serializer_class()
+
+    def get_plan_serializer_class(self):
+        """
+        Returns the serializer class the query plan of the current action is derived from.
+
+        Returns:
+            type: The summary serializer for listings, the output serializer otherwise.
+        """
+        if self.action == "list":
+            return AnnouncementSummarySerializer
+        return super().get_plan_serializer_class()
+
+    def get_permissions(self):
+        """
+        Returns the permissions of the current action.
+
+        Listing and retrieving announcements stay public. Facet counts and the feed require an
+        authenticated user, matching requires a super user.
+
+        Returns:
+            list: Permission instances of the current action.
+        """
+        if self.action in self.admin_actions:
+            return [IsAuthenticated(), IsSuperUser()]
+        if self.action in self.authenticated_actions:
+            return [IsAuthenticated()]
+        return super().get_permissions()
+
+    @conditional_response(announcement_validators)
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieves an announcement, answering 304 when the client copy is current.
+
+        The rendered announcement is cached under its ETag.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            HttpResponse: The rendered announcement, or a 304 response.
+        """
+        etag, _ = self.response_validators
+        if etag is None:
+            return super().retrieve(request, *args, **kwargs)
+        return AnnouncementDetailService.get_detail(self, request, etag)
 
     @action(
         detail=False,
@@ -65,6 +171,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_path="architect-specialities",
         serializer_class=ArchitectSpecialitySerializer,
     )
+    @conditional_response(reference_data_validators(ArchitectSpeciality))
     def get_architect_specialities(self, request):
         """
         Retrieves all architect specialities.
@@ -84,6 +191,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_path="architect-speciality-needs/(?P<architect_speciality_id>[^/.]+)",
         serializer_class=NeedSerializer,
     )
+    @conditional_response(reference_data_validators(ArchitectSpeciality, Need))
     def get_architect_speciality_needs(self, request, architect_speciality_id):
         """
         Retrieves needs based on architect speciality.
@@ -105,6 +213,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_name="project-categories",
         serializer_class=ProjectCategorySerializer,
     )
+    @conditional_response(reference_data_validators(ProjectCategory))
     def get_project_categories(self, request):
         """
         Retrieves all project categories.
@@ -125,6 +234,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_name="property-types",
         serializer_class=PropertyTypeSerializer,
     )
+    @conditional_response(reference_data_validators(ProjectCategory, PropertyType))
     def get_property_types(self, request, project_category_id):
         """
         Retrieves property types based on project category.
@@ -146,6 +256,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_name="work-types",
         serializer_class=WorkTypeSerializer,
     )
+    @conditional_response(reference_data_validators(WorkType))
     def get_announcement_work_types(self, request):
         """
         Retrieves all announcement work types.
@@ -166,6 +277,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_name="renovation-pieces",
         serializer_class=PieceRenovateSerializer,
     )
+    @conditional_response(reference_data_validators(PieceRenovate))
     def get_renovation_pieces(self, request):
         """
         Retrieves all renovation pieces.
@@ -185,6 +297,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_path="cities",
         url_name="cities",
     )
+    @conditional_response(constant_validators(CITIES))
     def get_cities(self, request):
         """
         Retrieves predefined cities choices.
@@ -204,6 +317,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_path="terrain-surfaces",
         url_name="terrain-surfaces",
     )
+    @conditional_response(constant_validators(TERRAIN_SURFACES))
     def get_terrain_surfaces(self, request):
         """
         Retrieves predefined terrain surfaces choices.
@@ -223,6 +337,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_path="work-surfaces",
         url_name="work-surfaces",
     )
+    @conditional_response(constant_validators(WORK_SURFACES))
     def get_work_surfaces(self, request):
         """
         Retrieves predefined work surfaces choices.
@@ -242,6 +357,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_path="budgets",
         url_name="budgets",
     )
+    @conditional_response(constant_validators(BUDGETS))
     def get_budgets(self, request):
         """
         Retrieves predefined budgets choices.
@@ -262,6 +378,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_name="architectural-styles",
         serializer_class=ArchitecturalStyleSerializer,
     )
+    @conditional_response(reference_data_validators(ArchitecturalStyle))
     def get_architectural_styles(self, request):
         """
         Retrieves all architectural styles.
@@ -282,6 +399,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
         url_name="project-extensions",
         serializer_class=ProjectExtensionSerializer,
     )
+    @conditional_response(reference_data_validators(ProjectExtension))
     def get_project_extensions(self, request):
         """
         Retrieves all project extensions.
@@ -293,3 +411,105 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
             Response: Response containing list of project extensions.
         """
         return AnnouncementService.get_project_extensions()
+
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[],
+        url_path="announcement-bootstrap",
+        url_name="announcement-bootstrap",
+    )
+    def get_bootstrap(self, request):
+        """
+        Retrieves all the reference data of the announcement wizard in one document.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            HttpResponse: Pre-rendered document with a strong ETag, or a 304 response.
+        """
+        return AnnouncementBootstrapService.get_bootstrap(request)
+
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated],
+        url_path="facets",
+        url_name="announcement-facets",
+    )
+    def get_facets(self, request):
+        """
+        Retrieves the facet counts of the announcements matching the request filters.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            Response: Counts per value of every filter dimension.
+        """
+        queryset = self.filter_queryset(Announcement.objects.all())
+        facets = AnnouncementFilterBackend().get_facets(queryset)
+        return Response(facets, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated],
+        url_path="feed",
+        url_name="announcement-feed",
+    )
+    def get_feed(self, request):
+        """
+        Retrieves the announcements matching the authenticated architect, newest first.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            Response: A keyset-paginated page of matched announcements and their scores.
+        """
+        return AnnouncementFeedService.get_feed(request)
+
+    @action(
+        detail=True,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated, IsSuperUser],
+        url_path="matching-architects",
+        url_name="matching-architects",
+    )
+    def get_matching_architects(self, request, pk=None):
+        """
+        Retrieves the architects best matching an announcement.
+
+        Args:
+            request (Request): HTTP request object.
+            pk (int): ID of the announcement.
+
+        Returns:
+            Response: Architect ids and scores, best first.
+        """
+        announcement = self.get_object()
+        limit = self.paginator.get_page_size(request)
+        return MatchingService.get_matching_architects(announcement, limit)
+
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated, IsSuperUser],
+        url_path="matching-announcements/(?P<architect_id>[^/.]+)",
+        url_name="matching-announcements",
+    )
+    def get_matching_announcements(self, request, architect_id):
+        """
+        Retrieves the recent announcements best matching an architect.
+
+        Args:
+            request (Request): HTTP request object.
+            architect_id (int): ID of the architect.
+
+        Returns:
+            Response: Announcement ids and scores, best first.
+        """
+        limit = self.paginator.get_page_size(request)
+        return MatchingService.get_matching_announcements(int(architect_id), limit)
@@ -0,0 +1,80 @@
+"""
+Module for SavedSearch ViewSet.
+
+This module defines the SavedSearchViewSet class, which is a viewset
+for managing the saved searches of architects using Django REST Framework.
+"""
+
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+
+from app.announcement.models.SavedSearch import SavedSearch
+from app.announcement.serializers.SavedSearchSerializer import SavedSearchSerializer
+from app.announcement.services.SavedSearchService import SavedSearchService
+
+
+class SavedSearchViewSet(viewsets.ModelViewSet):
+    """
+    ViewSet for SavedSearch model.
+
+    Provides endpoints for the authenticated architect to manage their saved searches and read
+    the announcements matching them.
+    """
+
+    queryset = SavedSearch.objects.all()
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated]
+
+    @action(detail=False, methods=["GET"], url_path="saved-searches")
+    def get_saved_searches(self, request):
+        """
+        Retrieves the saved searches of the authenticated architect.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            Response: Response containing list of saved searches.
+        """
+        return SavedSearchService.get_saved_searches(request)
+
+    @action(detail=False, methods=["POST"], url_path="saved-searches")
+    def create_saved_search(self, request):
+        """
+        Creates a saved search for the authenticated architect.
+
+        Args:
+            request (Request): HTTP request object containing the criteria.
+
+        Returns:
+            Response: Response containing the created saved search.
+        """
+        return SavedSearchService.create_saved_search(request)
+
+    @action(detail=True, methods=["DELETE"], url_path="saved-searches")
+    def delete_saved_search(self, request, pk=None):
+        """
+        Deletes a saved search of the authenticated architect.
+
+        Args:
+            request (Request): HTTP request object.
+            pk (int): ID of the saved search.
+
+        Returns:
+            Response: Response indicating whether the saved search was deleted.
+        """
+        return SavedSearchService.delete_saved_search(request, pk)
+
+    @action(detail=False, methods=["GET"], url_path="saved-searches/matches")
+    def get_saved_search_matches(self, request):
+        """
+        Retrieves the announcements that matched the saved searches of the architect.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            Response: A keyset-paginated page of notifications, newest first.
+        """
+        return SavedSearchService.get_saved_search_matches(request)
@@ -0,0 +1,20 @@
+"""
+Module for the AnnouncementFeedPagination class.
+
+This module provides the keyset pagination of the announcement feed of an architect, read
+from the AnnouncementMatch feed index.
+"""
+
+from app.core.controllers.KeysetCursorPagination import KeysetCursorPagination
+
+
+class AnnouncementFeedPagination(KeysetCursorPagination):
+    """
+    Keyset pagination of AnnouncementMatch rows, newest announcements first.
+
+    The ordering matches the (architect, announcement_created_at, announcement) index, so each
+    page is a single index range scan.
+    """
+
+    ordering_field = "announcement_created_at"
+    tiebreak_field = "announcement_id"
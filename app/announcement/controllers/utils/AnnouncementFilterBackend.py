@@ -0,0 +1,265 @@
+"""
+Module for the AnnouncementFilterBackend class.
+
+This module provides the filter engine of announcement listings and the facet counts of a
+filtered announcement set.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db.models import Count
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from app.announcement import BUDGETS
+from app.announcement import CITIES
+from app.announcement import TERRAIN_SURFACES
+from app.announcement import WORK_SURFACES
+from app.announcement.bands import BAND_BOUNDS
+from app.announcement.models.Need import Need
+from app.announcement.services.AnnouncementSearchService import AnnouncementSearchService
+from app.core.models.ArchitectSpeciality import ArchitectSpeciality
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.core.models.PropertyType import PropertyType
+from app.core.models.WorkType import WorkType
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+
+
+class AnnouncementFilterBackend(BaseFilterBackend):
+    """
+    Filter backend for announcements.
+
+    Every dimension accepts several values, either repeated or comma-separated, and matches
+    announcements having any of them. Dimensions are combined with AND. created_after and
+    created_before accept ISO dates or datetimes. q runs a full-text search on the description
+    and address, combined with the other filters. <band>_min and <band>_max match the
+    announcements whose budget or surface band overlaps the requested range.
+
+    Attributes:
+        search_param (str): Query parameter holding the full-text search.
+        ranked_actions (tuple): Actions annotating search results with their rank and headline.
+        choice_filters (dict): Choice-valued fields and their choices.
+        range_filters (tuple): Band fields filtered through their numeric bounds.
+        reference_filters (dict): Foreign key or many-to-many fields and their related models.
+    """
+
+    search_param = "q"
+    ranked_actions = ("list",)
+    choice_filters = {
+        "city": CITIES,
+        "budget": BUDGETS,
+        "terrain_surface": TERRAIN_SURFACES,
+        "work_surface": WORK_SURFACES,
+    }
+    range_filters = tuple(BAND_BOUNDS)
+    reference_filters = {
+        "project_category": ProjectCategory,
+        "property_type": PropertyType,
+        "work_type": WorkType,
+        "architect_speciality": ArchitectSpeciality,
+        "architectural_style": ArchitecturalStyle,
+        "needs": Need,
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filters announcements with the query parameters of the request.
+
+        Args:
+            request (Request): HTTP request object.
+            queryset (QuerySet): Announcement queryset.
+            view (APIView): View being filtered.
+
+        Raises:
+            ValidationError: If a parameter holds an unknown value.
+
+        Returns:
+            QuerySet: The filtered queryset.
+        """
+        errors = {}
+        conditions = Q()
+
+        for name, choices in self.choice_filters.items():
+            values = self.get_values(request, name)
+            if not values:
+                continue
+            allowed = {value for value, _ in choices}
+            unknown = [value for value in values if value not in allowed]
+            if unknown:
+                errors[name] = [f'Invalid choices "{", ".join(unknown)}".']
+            conditions &= Q(**{f"{name}__in": values})
+
+        for name in self.range_filters:
+            lower = self.get_integer(request, f"{name}_min", errors)
+            if lower is not None:
+                conditions &= Q(**{f"{name}_max__gte": lower}) | Q(
+                    **{f"{name}_max__isnull": True, f"{name}_min__isnull": False}
+                )
+            upper = self.get_integer(request, f"{name}_max", errors)
+            if upper is not None:
+                conditions &= Q(**{f"{name}_min__lte": upper})
+
+        has_many_valued_filter = False
+        for name, model in self.reference_filters.items():
+            values = self.get_values(request, name)
+            if not values:
+                continue
+            try:
+                ids = {int(value) for value in values}
+            except ValueError:
+                errors[name] = ["Expected a list of ids."]
+                continue
+            unknown = ids - ReferenceDataRegistry.in_bulk(model, ids).keys()
+            if unknown:
+                errors[name] = [f'Invalid pks "{", ".join(map(str, sorted(unknown)))}".']
+            conditions &= Q(**{f"{name}__in": ids})
+            has_many_valued_filter |= name == "needs"
+
+        for name, lookup in (("created_after", "gte"), ("created_before", "lte")):
+            value = request.query_params.get(name)
+            if not value:
+                continue
+            moment = self.parse_moment(value, end_of_day=lookup == "lte")
+            if moment is None:
+                errors[name] = ["Expected an ISO date or datetime."]
+                continue
+            conditions &= Q(**{f"created_at__{lookup}": moment})
+
+        search = self.get_search(request)
+        if len(search) > settings.ANNOUNCEMENT_SEARCH_MAX_LENGTH:
+            errors[self.search_param] = [
+                f"Ensure this field has no more than "
+                f"{settings.ANNOUNCEMENT_SEARCH_MAX_LENGTH} characters."
+            ]
+
+        if errors:
+            raise ValidationError(errors)
+        queryset = queryset.filter(conditions)
+        if search:
+            queryset = AnnouncementSearchService.search(
+                queryset,
+                search,
+                ranked=getattr(view, "action", None) in self.ranked_actions,
+            )
+        if has_many_valued_filter:
+            queryset = queryset.distinct()
+        return queryset
+
+    def get_facets(self, queryset):
+        """
+        Counts the announcements of a queryset per value of every dimension in one query.
+
+        Args:
+            queryset (QuerySet): Filtered announcement queryset.
+
+        Returns:
+            dict: For each dimension, a list of {"value", "count"} dicts.
+        """
+        dimensions = {
+            name: [value for value, _ in choices] for name, choices in self.choice_filters.items()
+        }
+        dimensions.update(
+            {
+                name: [row.pk for row in ReferenceDataRegistry.all(model)]
+                for name, model in self.reference_filters.items()
+            }
+        )
+
+        aggregates = {
+            f"{name}_{index}": Count("id", filter=Q(**{name: value}), distinct=True)
+            for name, values in dimensions.items()
+            for index, value in enumerate(values)
+        }
+        counts = queryset.order_by().aggregate(**aggregates) if aggregates else {}
+
+        return {
+            name: [
+                {"value": value, "count": counts[f"{name}_{index}"]}
+                for index, value in enumerate(values)
+            ]
+            for name, values in dimensions.items()
+        }
+
+    def get_search(self, request):
+        """
+        Reads the full-text search of a request.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            str: The search, empty when the request does not search.
+        """
+        return request.query_params.get(self.search_param, "").strip()
+
+    def get_integer(self, request, name, errors):
+        """
+        Reads a non-negative integer query parameter.
+
+        Args:
+            request (Request): HTTP request object.
+            name (str): Name of the query parameter.
+            errors (dict): Validation errors, completed when the value is invalid.
+
+        Returns:
+            int or None: The value, or None when it is missing or invalid.
+        """
+        value = request.query_params.get(name, "").strip()
+        if not value:
+            return None
+        if not value.isdigit():
+            errors[name] = ["A valid integer is required."]
+            return None
+        return int(value)
+
+    def get_values(self, request, name):
+        """
+        Reads the values of a multi-valued query parameter.
+
+        Args:
+            request (Request): HTTP request object.
+            name (str): Name of the query parameter.
+
+        Returns:
+            list: Non-empty values, repeated parameters and comma-separated values combined.
+        """
+        return [
+            value.strip()
+            for raw in request.query_params.getlist(name)
+            for value in raw.split(",")
+            if value.strip()
+        ]
+
+    def parse_moment(self, value, end_of_day=False):
+        """
+        Parses an ISO date or datetime into an aware datetime.
+
+        Args:
+            value (str): ISO date or datetime.
+            end_of_day (bool): For dates, return the end of the day instead of its start.
+
+        Returns:
+            datetime or None: The parsed datetime, or None when the value is invalid.
+        """
+        try:
+            moment = parse_datetime(value)
+            if moment is None:
+                date = parse_date(value)
+                if date is None:
+                    return None
+                moment = datetime.datetime.combine(
+                    date,
+                    datetime.time.max if end_of_day else datetime.time.min,
+                )
+        except ValueError:
+            return None
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return moment
@@ -0,0 +1,54 @@
+"""
+Module providing the conditional GET validators of announcement details.
+"""
+
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.Need import Need
+from app.announcement.models.PieceRenovate import PieceRenovate
+from app.announcement.models.ProjectExtension import ProjectExtension
+from app.core.controllers.conditional_response import make_etag
+from app.core.models.ArchitectSpeciality import ArchitectSpeciality
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.core.models.PropertyType import PropertyType
+from app.core.models.WorkType import WorkType
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+
+
+RENDERED_REFERENCE_TABLES = [
+    ArchitectSpeciality,
+    ArchitecturalStyle,
+    Need,
+    PieceRenovate,
+    ProjectCategory,
+    ProjectExtension,
+    PropertyType,
+    WorkType,
+]
+
+
+def announcement_validators(view, request, *args, **kwargs):
+    """
+    Computes the validators of an announcement detail without loading the announcement.
+
+    The ETag changes with the announcement and client updated_at, which are touched whenever
+    the pieces, images, needs or extensions of the announcement or the user of the client
+    change, and with the versions of the reference tables rendered in the announcement.
+
+    Args:
+        view (APIView): View serving the announcement.
+        request (Request): HTTP request object.
+
+    Returns:
+        tuple: (ETag, Last-Modified datetime), both None when the announcement does not exist.
+    """
+    timestamps = (
+        Announcement.objects.filter(pk=kwargs["pk"])
+        .values_list("updated_at", "client__updated_at")
+        .first()
+    )
+    if timestamps is None:
+        return None, None
+    versions = [ReferenceDataRegistry.version(model) for model in RENDERED_REFERENCE_TABLES]
+    last_modified = max(timestamp for timestamp in timestamps if timestamp is not None)
+    return make_etag(kwargs["pk"], timestamps, versions), last_modified
@@ -0,0 +1,46 @@
+"""
+Management command generating the renditions of project images.
+
+Usage:
+    python manage.py process_project_images [--force]
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.announcement.services.ProjectImageRenditionService import ProjectImageRenditionService
+
+
+class Command(BaseCommand):
+    """
+    Generates the renditions of the project images the background worker has not processed,
+    such as images uploaded before renditions existed.
+    """
+
+    help = "Generates the thumbnail, medium and large renditions of project images."
+
+    def add_arguments(self, parser):
+        """
+        Declares the options of the command.
+
+        Args:
+            parser (ArgumentParser): Parser of the command line.
+        """
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate the renditions of images already processed.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ProjectImageRenditionService.batch_size,
+            help="Number of images loaded per query.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Processes the images and reports their number.
+        """
+        ProjectImageRenditionService.batch_size = options["batch_size"]
+        count = ProjectImageRenditionService.process(force=options["force"])
+        self.stdout.write(self.style.SUCCESS(f"Processed {count} project images."))
@@ -0,0 +1,46 @@
+"""
+Management command rebuilding the AnnouncementMatch table.
+
+Usage:
+    python manage.py rebuild_announcement_matches
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.announcement.services.AnnouncementFeedService import AnnouncementFeedService
+from app.announcement.services.MatchingService import MatchingService
+from app.users.models.Architect import Architect
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the AnnouncementMatch table from scratch.
+
+    The table is emptied and refilled in bulk inside one transaction, so readers keep seeing
+    the previous rows until the rebuild commits.
+    """
+
+    help = "Rebuilds the architect and announcement match table from scratch."
+
+    def add_arguments(self, parser):
+        """
+        Declares the options of the command.
+
+        Args:
+            parser (ArgumentParser): Parser of the command line.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MatchingService.batch_size,
+            help="Number of rows read or written per query.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Rebuilds the table, drops the cached feed pages and reports the number of rows written.
+        """
+        MatchingService.batch_size = options["batch_size"]
+        count = MatchingService.rebuild_matches()
+        AnnouncementFeedService.invalidate(Architect.objects.values_list("id", flat=True))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} announcement matches."))
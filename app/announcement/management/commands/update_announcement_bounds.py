@@ -0,0 +1,36 @@
+"""
+Management command computing the numeric band bounds of announcements.
+
+Usage:
+    python manage.py update_announcement_bounds
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.announcement.bands import BAND_BOUNDS
+from app.announcement.models.Announcement import Announcement
+
+
+class Command(BaseCommand):
+    """
+    Backfills the budget and surface bound columns of announcements.
+
+    Bounds only depend on the band value, so announcements are updated with one query per band
+    value instead of being saved one by one.
+    """
+
+    help = "Computes the numeric budget and surface bounds of announcements."
+
+    def handle(self, *args, **options):
+        """
+        Updates the bounds and reports the number of rows updated per band field.
+        """
+        with transaction.atomic():
+            for field, bounds in BAND_BOUNDS.items():
+                count = 0
+                for value, (lower, upper) in bounds.items():
+                    count += Announcement.objects.filter(**{field: value}).update(
+                        **{f"{field}_min": lower, f"{field}_max": upper}
+                    )
+                self.stdout.write(self.style.SUCCESS(f"Updated {count} {field} bounds."))
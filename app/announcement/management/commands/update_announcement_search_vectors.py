@@ -0,0 +1,48 @@
+"""
+Management command computing the full-text search documents of announcements.
+
+Usage:
+    python manage.py update_announcement_search_vectors [--only-missing]
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.announcement.services.AnnouncementSearchService import AnnouncementSearchService
+
+
+class Command(BaseCommand):
+    """
+    Backfills the search_vector column of announcements.
+
+    Announcements are updated in batches of primary keys, each batch in its own transaction,
+    so the command can be interrupted and run again.
+    """
+
+    help = "Computes the full-text search documents of announcements."
+
+    def add_arguments(self, parser):
+        """
+        Declares the options of the command.
+
+        Args:
+            parser (ArgumentParser): Parser of the command line.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=AnnouncementSearchService.batch_size,
+            help="Number of announcements updated per query.",
+        )
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="Only update announcements without a search document.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Updates the search documents and reports the number of announcements updated.
+        """
+        AnnouncementSearchService.batch_size = options["batch_size"]
+        count = AnnouncementSearchService.backfill(only_missing=options["only_missing"])
+        self.stdout.write(self.style.SUCCESS(f"Updated {count} announcement search documents."))
@@ -5,12 +5,15 @@ This module contains the Announcement class, which represents an announcement
 for a construction or renovation project in the application.
 """
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from app.announcement import BUDGETS
 from app.announcement import CITIES
 from app.announcement import TERRAIN_SURFACES
 from app.announcement import WORK_SURFACES
+from app.announcement.bands import BAND_BOUNDS
 from app.announcement.models.Need import Need
 from app.announcement.models.ProjectExtension import ProjectExtension
 from app.core.models import BaseModel
@@ -48,6 +51,14 @@ class Announcement(BaseModel):
         selected from predefined choices.
         project_extensions (ManyToManyField): Extensions or additional features
         planned for the project.
+        search_vector (SearchVectorField): Full-text search document of the description and
+        address, maintained by the AnnouncementSearchService.
+        budget_min, budget_max (PositiveIntegerField): Bounds of the budget band, set on save.
+        terrain_surface_min, terrain_surface_max (PositiveIntegerField): Bounds of the terrain
+        surface band, set on save.
+        work_surface_min, work_surface_max (PositiveIntegerField): Bounds of the work surface
+        band, set on save.
+        Upper bounds are null for open-ended bands.
 
     """
 
@@ -92,6 +103,41 @@ class Announcement(BaseModel):
         ProjectExtension,
         related_name="project_extensions_announcements",
     )
+    search_vector = SearchVectorField(null=True, editable=False)
+    budget_min = models.PositiveIntegerField(null=True, editable=False)
+    budget_max = models.PositiveIntegerField(null=True, editable=False)
+    terrain_surface_min = models.PositiveIntegerField(null=True, editable=False)
+    terrain_surface_max = models.PositiveIntegerField(null=True, editable=False)
+    work_surface_min = models.PositiveIntegerField(null=True, editable=False)
+    work_surface_max = models.PositiveIntegerField(null=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        """
+        Save the announcement, with the numeric bounds of its saved band fields.
+        """
+        update_fields = kwargs.get("update_fields")
+        bounds_fields = []
+        for field in BAND_BOUNDS:
+            if update_fields is None or field in update_fields:
+                bounds_fields.extend(self.set_band_bounds(field))
+        if update_fields is not None and bounds_fields:
+            kwargs["update_fields"] = {*update_fields, *bounds_fields}
+        super().save(*args, **kwargs)
+
+    def set_band_bounds(self, field):
+        """
+        Set the numeric bounds of a band field from its value.
+
+        Args:
+            field (str): Name of the band field.
+
+        Returns:
+            list: Names of the bound fields that were set.
+        """
+        lower, upper = BAND_BOUNDS[field].get(getattr(self, field), (None, None))
+        setattr(self, f"{field}_min", lower)
+        setattr(self, f"{field}_max", upper)
+        return [f"{field}_min", f"{field}_max"]
 
     def __str__(self):
         """
@@ -106,8 +152,42 @@ class Announcement(BaseModel):
         """
         Meta class for Announcement model.
 
-        Defines display names in the Django admin and plural form of the model name.
+        Defines display names in the Django admin and plural form of the model name, the
+        composite indexes backing the filtered, newest-first announcement listings, the
+        full-text search index, and the indexes of the band bounds range filters.
         """
 
         verbose_name = "Announcement"
         verbose_name_plural = "Announcements"
+        indexes = [
+            models.Index(fields=["city", "-created_at", "-id"], name="announcement_city_idx"),
+            models.Index(fields=["budget", "-created_at", "-id"], name="announcement_budget_idx"),
+            models.Index(
+                fields=["architect_speciality", "-created_at", "-id"],
+                name="announcement_speciality_idx",
+            ),
+            models.Index(
+                fields=["project_category", "property_type", "-created_at"],
+                name="announcement_category_idx",
+            ),
+            models.Index(
+                fields=["work_type", "-created_at"],
+                name="announcement_work_type_idx",
+            ),
+            models.Index(
+                fields=["architectural_style", "-created_at"],
+                name="announcement_style_idx",
+                condition=models.Q(architectural_style__isnull=False),
+            ),
+            models.Index(fields=["-created_at", "-id"], name="announcement_created_idx"),
+            GinIndex(fields=["search_vector"], name="announcement_search_idx"),
+            models.Index(fields=["budget_max", "budget_min"], name="announcement_budget_range_idx"),
+            models.Index(
+                fields=["terrain_surface_max", "terrain_surface_min"],
+                name="announcement_terrain_range_idx",
+            ),
+            models.Index(
+                fields=["work_surface_max", "work_surface_min"],
+                name="announcement_work_range_idx",
+            ),
+        ]
@@ -0,0 +1,69 @@
+"""
+Module defining the AnnouncementMatch model.
+
+This module contains the AnnouncementMatch class, which stores the materialized score of an
+announcement for an architect, so that architect lead feeds are read with an index range scan.
+"""
+
+from django.db import models
+
+from app.announcement.models.Announcement import Announcement
+from app.users.models.Architect import Architect
+
+
+class AnnouncementMatch(models.Model):
+    """
+    Model representing the match score between an architect and an announcement.
+
+    Rows are maintained by the matching tasks from the announcement and architect preference
+    signals, and rebuilt with the rebuild_announcement_matches management command.
+
+    Attributes:
+        architect (ForeignKey): Architect the announcement is matched with.
+        announcement (ForeignKey): Matched announcement.
+        score (PositiveSmallIntegerField): Match score computed by the MatchingService.
+        announcement_created_at (DateTimeField): Creation date of the announcement, copied to
+        order the feed of an architect without joining the announcements.
+    """
+
+    architect = models.ForeignKey(
+        Architect,
+        on_delete=models.CASCADE,
+        related_name="announcement_matches",
+    )
+    announcement = models.ForeignKey(
+        Announcement,
+        on_delete=models.CASCADE,
+        related_name="matches",
+    )
+    score = models.PositiveSmallIntegerField()
+    announcement_created_at = models.DateTimeField()
+
+    class Meta:
+        """
+        Meta class for AnnouncementMatch model.
+
+        Provides unique constraint to prevent duplicate entries, and the index backing the
+        newest-first feed of an architect.
+        """
+
+        unique_together = (
+            "architect",
+            "announcement",
+        )
+        indexes = [
+            models.Index(
+                fields=["architect", "-announcement_created_at", "-announcement"],
+                name="announcement_match_feed_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Return a string representation of the announcement match.
+
+        Returns:
+            str: String representation of the match, including its architect, announcement and
+            score.
+        """
+        return f"{self.architect} - {self.announcement} ({self.score})"
@@ -8,6 +8,7 @@ representing different aspects of a project in the application.
 from django.db import models
 
 from app.announcement.models import Announcement
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
 
 
 class ProjectImage(models.Model):
@@ -15,16 +16,26 @@ class ProjectImage(models.Model):
     Model representing an image associated with a project.
 
     Attributes:
-        image (ImageField): Image file uploaded for the project, stored in 'images/' directory.
+        image (ImageField): Image file uploaded for the project, stored in the content-addressed
+        storage.
+        width (PositiveIntegerField): Width of the uploaded image, once processed.
+        height (PositiveIntegerField): Height of the uploaded image, once processed.
+        renditions (JSONField): Resized copies of the image, keyed by size name then format,
+        each entry holding the storage name and dimensions of the file.
+        processed_at (DateTimeField): When the renditions were generated, None until then.
     """
 
-    image = models.ImageField(upload_to="images/ProjectImage/")
+    image = models.ImageField(storage=ContentAddressedStorage())
     announcement = models.ForeignKey(
         Announcement,
         related_name="project_images",
         on_delete=models.CASCADE,
         null=True,
     )
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    renditions = models.JSONField(default=dict, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
 
     def __str__(self):
         """
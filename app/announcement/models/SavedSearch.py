@@ -0,0 +1,72 @@
+"""
+Module defining the SavedSearch model.
+
+This module contains the SavedSearch class, which represents the announcement criteria an
+architect wants to be notified about.
+"""
+
+from django.db import models
+
+from app.announcement import BUDGETS
+from app.announcement import CITIES
+from app.core.models import BaseModel
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.users.models.Architect import Architect
+
+
+class SavedSearch(BaseModel):
+    """
+    Model representing the saved announcement criteria of an architect.
+
+    Empty criteria match every value.
+
+    Attributes:
+        architect (ForeignKey): Architect owning the saved search.
+        name (CharField): Name of the saved search.
+        city (CharField): City of the announcements, selected from predefined choices.
+        budget (CharField): Budget range of the announcements, selected from predefined
+        choices.
+        project_category (ForeignKey): Category of the announcements.
+        architectural_style (ForeignKey): Architectural style of the announcements.
+    """
+
+    architect = models.ForeignKey(
+        Architect,
+        on_delete=models.CASCADE,
+        related_name="saved_searches",
+    )
+    name = models.CharField(max_length=255, default="")
+    city = models.CharField(max_length=50, choices=CITIES, blank=True, default="")
+    budget = models.CharField(max_length=50, choices=BUDGETS, blank=True, default="")
+    project_category = models.ForeignKey(
+        ProjectCategory,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    architectural_style = models.ForeignKey(
+        ArchitecturalStyle,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        """
+        Meta class for SavedSearch model.
+
+        Defines display names in the Django admin and plural form of the model name.
+        """
+
+        verbose_name = "Saved search"
+        verbose_name_plural = "Saved searches"
+
+    def __str__(self):
+        """
+        Return a string representation of the saved search.
+
+        Returns:
+            str: String representation of the saved search, including its name and architect.
+        """
+        return f"{self.name} ({self.architect})"
@@ -0,0 +1,73 @@
+"""
+Module defining the SavedSearchMatch model.
+
+This module contains the SavedSearchMatch class, the notification queue of announcements
+matching saved searches.
+"""
+
+from django.db import models
+
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.SavedSearch import SavedSearch
+from app.core.models import BaseModel
+from app.users.models.Architect import Architect
+
+
+class SavedSearchMatch(BaseModel):
+    """
+    Model representing a new announcement matching a saved search.
+
+    Rows are queued in batches by the percolate_saved_searches task and read newest first by
+    the architect owning the saved search.
+
+    Attributes:
+        architect (ForeignKey): Architect owning the saved search, copied to list the
+        notifications of an architect without joining the saved searches.
+        saved_search (ForeignKey): Matched saved search.
+        announcement (ForeignKey): Announcement matching the saved search.
+    """
+
+    architect = models.ForeignKey(
+        Architect,
+        on_delete=models.CASCADE,
+        related_name="saved_search_matches",
+    )
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        on_delete=models.CASCADE,
+        related_name="matches",
+    )
+    announcement = models.ForeignKey(
+        Announcement,
+        on_delete=models.CASCADE,
+        related_name="saved_search_matches",
+    )
+
+    class Meta:
+        """
+        Meta class for SavedSearchMatch model.
+
+        Provides unique constraint to prevent duplicate notifications, and the index backing
+        the newest-first listing of the notifications of an architect.
+        """
+
+        unique_together = (
+            "saved_search",
+            "announcement",
+        )
+        indexes = [
+            models.Index(
+                fields=["architect", "-created_at", "-id"],
+                name="saved_search_match_feed_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Return a string representation of the saved search match.
+
+        Returns:
+            str: String representation of the match, including its saved search and
+            announcement.
+        """
+        return f"{self.saved_search} - {self.announcement}"
@@ -1 +1,4 @@
 from app.announcement.models.Announcement import Announcement
+from app.announcement.models.AnnouncementMatch import AnnouncementMatch
+from app.announcement.models.SavedSearch import SavedSearch
+from app.announcement.models.SavedSearchMatch import SavedSearchMatch
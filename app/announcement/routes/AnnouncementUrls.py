@@ -9,6 +9,36 @@ from app.announcement.controllers.AnnouncementViewSet import AnnouncementViewSet
 
 
 announcement_urlpatterns = [
+    path(
+        "announcements/",
+        AnnouncementViewSet.as_view({"get": "list"}),
+        name="announcements",
+    ),
+    path(
+        "announcements/facets/",
+        AnnouncementViewSet.as_view({"get": "get_facets"}),
+        name="announcement-facets",
+    ),
+    path(
+        "announcements/feed/",
+        AnnouncementViewSet.as_view({"get": "get_feed"}),
+        name="announcement-feed",
+    ),
+    path(
+        "announcements/<int:pk>/",
+        AnnouncementViewSet.as_view({"get": "retrieve"}),
+        name="announcement-detail",
+    ),
+    path(
+        "announcements/<int:pk>/matching-architects/",
+        AnnouncementViewSet.as_view({"get": "get_matching_architects"}),
+        name="matching-architects",
+    ),
+    path(
+        "matching-announcements/<int:architect_id>/",
+        AnnouncementViewSet.as_view({"get": "get_matching_announcements"}),
+        name="matching-announcements",
+    ),
     path(
         "create-announcement/",
         AnnouncementViewSet.as_view({"post": "create_announcement"}),
@@ -79,4 +109,9 @@ announcement_urlpatterns = [
         AnnouncementViewSet.as_view({"get": "get_project_extensions"}),
         name="project-extensions",
     ),
+    path(
+        "announcement-bootstrap/",
+        AnnouncementViewSet.as_view({"get": "get_bootstrap"}),
+        name="announcement-bootstrap",
+    ),
 ]
@@ -0,0 +1,27 @@
+"""
+exposed URLS for announcement app
+viewset : SavedSearchViewSet
+"""
+
+from django.urls import path
+
+from app.announcement.controllers.SavedSearchViewSet import SavedSearchViewSet
+
+
+saved_search_urlpatterns = [
+    path(
+        "saved-searches/",
+        SavedSearchViewSet.as_view({"get": "get_saved_searches", "post": "create_saved_search"}),
+        name="saved-searches",
+    ),
+    path(
+        "saved-searches/matches/",
+        SavedSearchViewSet.as_view({"get": "get_saved_search_matches"}),
+        name="saved-search-matches",
+    ),
+    path(
+        "saved-searches/<int:pk>/",
+        SavedSearchViewSet.as_view({"delete": "delete_saved_search"}),
+        name="saved-search-delete",
+    ),
+]
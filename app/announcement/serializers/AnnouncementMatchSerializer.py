@@ -0,0 +1,35 @@
+"""
+Serializer module for AnnouncementMatch model.
+
+This module defines a serializer class for the AnnouncementMatch model.
+"""
+
+from rest_framework import serializers
+
+from app.announcement.models.AnnouncementMatch import AnnouncementMatch
+from app.announcement.serializers.AnnouncementSummarySerializer import (
+    AnnouncementOwnerListSerializer,
+)
+from app.announcement.serializers.AnnouncementSummarySerializer import AnnouncementSummarySerializer
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
+
+
+class AnnouncementMatchSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """
+    Serializer class for AnnouncementMatch model.
+
+    Renders an entry of the announcement feed of an architect.
+    """
+
+    announcement = AnnouncementSummarySerializer()
+
+    class Meta:
+        """
+        Meta class for AnnouncementMatchSerializer.
+
+        Specifies the model to be serialized and the fields to be included in the serialization.
+        """
+
+        model = AnnouncementMatch
+        list_serializer_class = AnnouncementOwnerListSerializer
+        fields = ["score", "announcement"]
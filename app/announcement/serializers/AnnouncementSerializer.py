@@ -27,6 +27,9 @@ from app.core.models.ArchitecturalStyle import ArchitecturalStyle
 from app.core.models.ProjectCategory import ProjectCategory
 from app.core.models.PropertyType import PropertyType
 from app.core.models.WorkType import WorkType
+from app.core.serializers.BoundedImageField import BoundedImageField
+from app.core.serializers.BulkPrimaryKeyRelatedField import BulkPrimaryKeyRelatedField
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
 from app.users.serializers.ClientSerializer import ClientSerializer
 
 
@@ -40,28 +43,24 @@ class AnnouncementPOSTSerializer(serializers.ModelSerializer):
     """
 
     client = ClientSerializer()
-    architect_speciality = serializers.PrimaryKeyRelatedField(
-        queryset=ArchitectSpeciality.objects.all()
-    )
-    architectural_style = serializers.PrimaryKeyRelatedField(
-        queryset=ArchitecturalStyle.objects.all()
-    )
-    needs = serializers.PrimaryKeyRelatedField(queryset=Need.objects.all(), many=True)
-    project_category = serializers.PrimaryKeyRelatedField(queryset=ProjectCategory.objects.all())
-    property_type = serializers.PrimaryKeyRelatedField(queryset=PropertyType.objects.all())
-    work_type = serializers.PrimaryKeyRelatedField(queryset=WorkType.objects.all())
+    architect_speciality = BulkPrimaryKeyRelatedField(queryset=ArchitectSpeciality.objects.all())
+    architectural_style = BulkPrimaryKeyRelatedField(queryset=ArchitecturalStyle.objects.all())
+    needs = BulkPrimaryKeyRelatedField(queryset=Need.objects.all(), many=True)
+    project_category = BulkPrimaryKeyRelatedField(queryset=ProjectCategory.objects.all())
+    property_type = BulkPrimaryKeyRelatedField(queryset=PropertyType.objects.all())
+    work_type = BulkPrimaryKeyRelatedField(queryset=WorkType.objects.all())
     pieces_renovate = serializers.ListField(
         child=serializers.DictField(
             child=serializers.IntegerField(required=True),
             allow_empty=False,
         )
     )
-    project_extensions = serializers.PrimaryKeyRelatedField(
+    project_extensions = BulkPrimaryKeyRelatedField(
         queryset=ProjectExtension.objects.all(),
         many=True,
     )
     project_images = serializers.ListField(
-        child=serializers.ImageField(required=False),
+        child=BoundedImageField(required=False),
         required=False,
     )
 
@@ -102,28 +101,28 @@ class AnnouncementPUTSerializer(serializers.ModelSerializer):
 
     """
 
-    architect_speciality = serializers.PrimaryKeyRelatedField(
-        queryset=ArchitectSpeciality.objects.all()
-    )
-    architectural_style = serializers.PrimaryKeyRelatedField(
-        queryset=ArchitecturalStyle.objects.all()
-    )
-    needs = serializers.PrimaryKeyRelatedField(queryset=Need.objects.all(), many=True)
-    project_category = serializers.PrimaryKeyRelatedField(queryset=ProjectCategory.objects.all())
-    property_type = serializers.PrimaryKeyRelatedField(queryset=PropertyType.objects.all())
-    work_type = serializers.PrimaryKeyRelatedField(queryset=WorkType.objects.all())
+    architect_speciality = BulkPrimaryKeyRelatedField(queryset=ArchitectSpeciality.objects.all())
+    architectural_style = BulkPrimaryKeyRelatedField(queryset=ArchitecturalStyle.objects.all())
+    needs = BulkPrimaryKeyRelatedField(queryset=Need.objects.all(), many=True)
+    project_category = BulkPrimaryKeyRelatedField(queryset=ProjectCategory.objects.all())
+    property_type = BulkPrimaryKeyRelatedField(queryset=PropertyType.objects.all())
+    work_type = BulkPrimaryKeyRelatedField(queryset=WorkType.objects.all())
     pieces_renovate = serializers.ListField(
         child=serializers.DictField(
             child=serializers.IntegerField(required=True),
             allow_empty=False,
         )
     )
-    project_extensions = serializers.PrimaryKeyRelatedField(
+    project_extensions = BulkPrimaryKeyRelatedField(
         queryset=ProjectExtension.objects.all(),
         many=True,
     )
     project_images = serializers.ListField(
-        child=serializers.ImageField(required=False),
+        child=BoundedImageField(required=False),
+        required=False,
+    )
+    kept_project_images = serializers.ListField(
+        child=serializers.IntegerField(),
         required=False,
     )
 
@@ -151,10 +150,11 @@ class AnnouncementPUTSerializer(serializers.ModelSerializer):
             "architectural_style",
             "project_extensions",
             "project_images",
+            "kept_project_images",
         ]
 
 
-class AnnouncementOutputSerializer(serializers.ModelSerializer):
+class AnnouncementOutputSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for retrieving Announcement instances.
 
@@ -249,5 +249,5 @@ class AnnouncementSerializer(serializers.ModelSerializer):
         Returns:
             dict: The external representation of the announcement.
         """
-        serializer = AnnouncementOutputSerializer(instance)
+        serializer = AnnouncementOutputSerializer(instance, context=self.context)
         return serializer.data
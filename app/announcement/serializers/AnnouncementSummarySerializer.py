@@ -0,0 +1,198 @@
+"""
+Serializer module for the compact representation of Announcement instances.
+
+This module defines the AnnouncementSummarySerializer class, which renders announcements as
+cards in lists and feeds: reference rows as ids and labels, and the first project image as
+thumbnail. The nested blocks of the full representation are opt-in, with the expand query
+parameter.
+"""
+
+from django.core.files.storage import default_storage
+from django.db import models
+
+from rest_framework import serializers
+
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.ProjectImage import ProjectImage
+from app.announcement.serializers.AnnouncementPieceRenovateSerializer import (
+    AnnouncementPieceRenovateSerializer,
+)
+from app.announcement.serializers.NeedSerializer import NeedSerializer
+from app.announcement.serializers.ProjectExtensionSerializer import ProjectExtensionSerializer
+from app.announcement.serializers.ProjectImageSerializer import ProjectImageSerializer
+from app.core.models.ArchitectSpeciality import ArchitectSpeciality
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.core.models.PropertyType import PropertyType
+from app.core.models.WorkType import WorkType
+from app.core.serializers.ReferenceLabelField import ReferenceLabelField
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
+from app.users.serializers.ClientSerializer import ClientSerializer
+
+
+THUMBNAIL_RENDITION = "thumbnail"
+THUMBNAIL_FORMAT = "webp"
+
+
+def load_thumbnails(announcements):
+    """
+    Sets the first_image attribute of announcements with one query.
+
+    The thumbnail rendition of the first image is used once generated, the original image
+    until then.
+
+    Args:
+        announcements (list): Announcement instances, those already holding first_image are
+        left untouched.
+    """
+    pending = {
+        announcement.pk: announcement
+        for announcement in announcements
+        if not hasattr(announcement, "first_image")
+    }
+    if not pending:
+        return
+    first_images = {}
+    rows = (
+        ProjectImage.objects.filter(announcement_id__in=pending)
+        .order_by("announcement_id", "id")
+        .values_list("announcement_id", "image", "renditions")
+    )
+    for announcement_id, image, renditions in rows:
+        if announcement_id in first_images:
+            continue
+        thumbnail = (renditions or {}).get(THUMBNAIL_RENDITION)
+        first_images[announcement_id] = thumbnail["files"][THUMBNAIL_FORMAT] if thumbnail else image
+    for announcement_id, announcement in pending.items():
+        announcement.first_image = first_images.get(announcement_id)
+
+
+class ThumbnailField(serializers.Field):
+    """
+    Read-only field rendering a stored image name as its URL.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the field as read-only and optional.
+        """
+        kwargs["read_only"] = True
+        kwargs["required"] = False
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """
+        Renders the URL of a stored image.
+
+        Args:
+            value (str): Name of the image in the default storage.
+
+        Returns:
+            str or None: Absolute URL when the request is known, relative URL otherwise.
+        """
+        if not value:
+            return None
+        url = default_storage.url(value)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+
+
+class AnnouncementSummaryListSerializer(serializers.ListSerializer):
+    """
+    List serializer loading the thumbnails of a page of announcements with one query, unless
+    a sparse fieldset drops them.
+    """
+
+    def to_representation(self, data):
+        """
+        Renders a list of announcements.
+
+        Args:
+            data (iterable): Announcement instances or queryset.
+
+        Returns:
+            list: The rendered announcements.
+        """
+        announcements = list(data.all() if isinstance(data, models.Manager) else data)
+        if "thumbnail" in self.child.fields:
+            load_thumbnails(announcements)
+        return super().to_representation(announcements)
+
+
+class AnnouncementOwnerListSerializer(serializers.ListSerializer):
+    """
+    List serializer for rows rendering their announcement as a summary, loading the
+    thumbnails of the page with one query.
+    """
+
+    def to_representation(self, data):
+        """
+        Renders a list of rows having an announcement.
+
+        Args:
+            data (iterable): Instances with an announcement attribute, or queryset.
+
+        Returns:
+            list: The rendered rows.
+        """
+        rows = list(data.all() if isinstance(data, models.Manager) else data)
+        announcement = self.child.fields.get("announcement")
+        if announcement is not None and "thumbnail" in announcement.fields:
+            load_thumbnails([row.announcement for row in rows])
+        return super().to_representation(rows)
+
+
+class AnnouncementSummarySerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """
+    Serializer for the compact representation of Announcement instances.
+
+    Reference rows are read from the foreign key columns without joins and labelled from the
+    ReferenceDataRegistry. Announcements returned by a full-text search also carry the
+    highlighted excerpt of their description, HTML-escaped with the matches wrapped in <mark>
+    elements.
+    """
+
+    architect_speciality = ReferenceLabelField(ArchitectSpeciality)
+    project_category = ReferenceLabelField(ProjectCategory)
+    property_type = ReferenceLabelField(PropertyType)
+    work_type = ReferenceLabelField(WorkType, label_field="header")
+    architectural_style = ReferenceLabelField(ArchitecturalStyle)
+    thumbnail = ThumbnailField(source="first_image")
+    search_headline = serializers.CharField(read_only=True, required=False)
+
+    class Meta:
+        """
+        Meta class for AnnouncementSummarySerializer.
+
+        Specifies the model to be serialized, the fields to be included in the serialization
+        and the nested blocks clients can expand.
+        """
+
+        model = Announcement
+        list_serializer_class = AnnouncementSummaryListSerializer
+        fields = [
+            "id",
+            "architect_speciality",
+            "project_category",
+            "property_type",
+            "work_type",
+            "architectural_style",
+            "city",
+            "terrain_surface",
+            "work_surface",
+            "budget",
+            "created_at",
+            "thumbnail",
+            "search_headline",
+        ]
+        expandable_fields = {
+            "description": (serializers.CharField, {"read_only": True}),
+            "client": (ClientSerializer, {"read_only": True}),
+            "needs": (NeedSerializer, {"many": True, "read_only": True}),
+            "pieces_renovate": (
+                AnnouncementPieceRenovateSerializer,
+                {"many": True, "read_only": True},
+            ),
+            "project_extensions": (ProjectExtensionSerializer, {"many": True, "read_only": True}),
+            "project_images": (ProjectImageSerializer, {"many": True, "read_only": True}),
+        }
@@ -8,13 +8,19 @@ This module defines a serializer class for the ProjectImage model.
 from rest_framework import serializers
 
 from app.announcement.models.ProjectImage import ProjectImage
+from app.core.serializers.RenditionsField import RenditionsField
 
 
 class ProjectImageSerializer(serializers.ModelSerializer):
     """
     Serializer class for ProjectImage model.
+
+    Renditions are empty until the background worker has processed the upload; clients fall
+    back to the original image meanwhile.
     """
 
+    renditions = RenditionsField()
+
     class Meta:
         """
         Meta class for ProjectImageSerializer.
@@ -23,4 +29,4 @@ class ProjectImageSerializer(serializers.ModelSerializer):
         """
 
         model = ProjectImage
-        fields = ["id", "image"]
+        fields = ["id", "image", "width", "height", "renditions"]
@@ -0,0 +1,35 @@
+"""
+Serializer module for SavedSearchMatch model.
+
+This module defines a serializer class for the SavedSearchMatch model.
+"""
+
+from rest_framework import serializers
+
+from app.announcement.models.SavedSearchMatch import SavedSearchMatch
+from app.announcement.serializers.AnnouncementSummarySerializer import (
+    AnnouncementOwnerListSerializer,
+)
+from app.announcement.serializers.AnnouncementSummarySerializer import AnnouncementSummarySerializer
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
+
+
+class SavedSearchMatchSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """
+    Serializer class for SavedSearchMatch model.
+
+    Renders a saved search notification of an architect.
+    """
+
+    announcement = AnnouncementSummarySerializer()
+
+    class Meta:
+        """
+        Meta class for SavedSearchMatchSerializer.
+
+        Specifies the model to be serialized and the fields to be included in the serialization.
+        """
+
+        model = SavedSearchMatch
+        list_serializer_class = AnnouncementOwnerListSerializer
+        fields = ["id", "saved_search", "created_at", "announcement"]
@@ -0,0 +1,49 @@
+"""
+Serializer module for SavedSearch model.
+
+This module defines a serializer class for the SavedSearch model.
+"""
+
+from rest_framework import serializers
+
+from app.announcement.models.SavedSearch import SavedSearch
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.core.serializers.BulkPrimaryKeyRelatedField import BulkPrimaryKeyRelatedField
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the SavedSearch model.
+
+    This serializer handles the representation of SavedSearch instances, the architect being
+    taken from the authenticated user.
+    """
+
+    project_category = BulkPrimaryKeyRelatedField(
+        queryset=ProjectCategory.objects.all(),
+        required=False,
+        allow_null=True,
+    )
+    architectural_style = BulkPrimaryKeyRelatedField(
+        queryset=ArchitecturalStyle.objects.all(),
+        required=False,
+        allow_null=True,
+    )
+
+    class Meta:
+        """
+        Meta class for SavedSearchSerializer.
+
+        Specifies the model to be serialized and the fields to be included in the serialization.
+        """
+
+        model = SavedSearch
+        fields = [
+            "id",
+            "name",
+            "city",
+            "budget",
+            "project_category",
+            "architectural_style",
+        ]
@@ -0,0 +1,211 @@
+"""
+Module: announcement bootstrap Service
+
+This module defines the AnnouncementBootstrapService class that serves, in a single document,
+all the reference data needed by the announcement creation wizard.
+
+Classes:
+    BootstrapDocument: Pre-rendered bootstrap document for one version of the reference data.
+    AnnouncementBootstrapService: Service class building and serving the bootstrap document.
+
+"""
+
+import gzip
+import hashlib
+import json
+import re
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+
+from djangorestframework_camel_case.util import camelize
+from rest_framework.utils import encoders
+
+from app.announcement import BUDGETS
+from app.announcement import CITIES
+from app.announcement import TERRAIN_SURFACES
+from app.announcement import WORK_SURFACES
+from app.announcement.models.Need import Need
+from app.announcement.models.PieceRenovate import PieceRenovate
+from app.announcement.models.ProjectExtension import ProjectExtension
+from app.announcement.serializers.ArchitectSpecialitySerializer import ArchitectSpecialitySerializer
+from app.announcement.serializers.ArchitecturalStyleSerializer import ArchitecturalStyleSerializer
+from app.announcement.serializers.NeedSerializer import NeedSerializer
+from app.announcement.serializers.PieceRenovateSerializer import PieceRenovateSerializer
+from app.announcement.serializers.ProjectCategorySerializer import ProjectCategorySerializer
+from app.announcement.serializers.ProjectExtensionSerializer import ProjectExtensionSerializer
+from app.announcement.serializers.PropertyTypeSerializer import PropertyTypeSerializer
+from app.announcement.serializers.WorkTypeSerializer import WorkTypeSerializer
+from app.core.models.ArchitectSpeciality import ArchitectSpeciality
+from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+from app.core.models.ProjectCategory import ProjectCategory
+from app.core.models.PropertyType import PropertyType
+from app.core.models.WorkType import WorkType
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+
+
+class BootstrapDocument:
+    """
+    Bootstrap document rendered for one version of the reference data.
+
+    Attributes:
+        versions (tuple): Versions of the reference tables the document was built from.
+        content (bytes): JSON document.
+        gzip_content (bytes): Gzip-compressed JSON document.
+        etag (str): Strong ETag of the JSON document.
+        gzip_etag (str): Strong ETag of the compressed document.
+    """
+
+    def __init__(self, versions, data):
+        """
+        Renders and compresses the document.
+
+        Args:
+            versions (tuple): Versions of the reference tables.
+            data (dict): Document data, with snake_case keys.
+        """
+        self.versions = versions
+        self.content = json.dumps(
+            camelize(data),
+            cls=encoders.JSONEncoder,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        self.gzip_content = gzip.compress(self.content, mtime=0)
+        digest = hashlib.sha256(self.content).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+
+class AnnouncementBootstrapService:
+    """
+    Service class serving the announcement wizard reference data as one document.
+
+    The document is rendered once per version of the reference tables and kept in memory.
+    """
+
+    tables = [
+        ArchitectSpeciality,
+        Need,
+        ProjectCategory,
+        PropertyType,
+        WorkType,
+        PieceRenovate,
+        ArchitecturalStyle,
+        ProjectExtension,
+    ]
+    accepts_gzip = re.compile(r"\bgzip\b")
+    _document = None
+
+    @classmethod
+    def get_bootstrap(cls, request):
+        """
+        Serves the bootstrap document, compressed when the client accepts gzip.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            HttpResponse: The document, or a 304 response when the client copy is current.
+        """
+        document = cls.get_document()
+        use_gzip = bool(cls.accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
+        etag = document.gzip_etag if use_gzip else document.etag
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                document.gzip_content if use_gzip else document.content,
+                content_type="application/json",
+            )
+            if use_gzip:
+                response["Content-Encoding"] = "gzip"
+        response["ETag"] = etag
+        response["Vary"] = "Accept-Encoding"
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    @classmethod
+    def get_document(cls):
+        """
+        Returns the bootstrap document of the current reference data, rendering it when needed.
+
+        Returns:
+            BootstrapDocument: The current document.
+        """
+        versions = tuple(ReferenceDataRegistry.version(model) for model in cls.tables)
+        document = cls._document
+        if document is None or document.versions != versions:
+            document = BootstrapDocument(versions, cls.build_data())
+            cls._document = document
+        return document
+
+    @classmethod
+    def build_data(cls):
+        """
+        Builds the bootstrap data from the reference data registry.
+
+        Returns:
+            dict: Nested taxonomy and choice lists.
+        """
+        architect_specialities = []
+        for speciality in ReferenceDataRegistry.all(ArchitectSpeciality):
+            needs = ReferenceDataRegistry.filter_by(Need, "architect_speciality", speciality.id)
+            architect_specialities.append(
+                {
+                    **ArchitectSpecialitySerializer(speciality).data,
+                    "needs": NeedSerializer(needs, many=True).data,
+                }
+            )
+
+        project_categories = []
+        for category in ReferenceDataRegistry.all(ProjectCategory):
+            property_types = ReferenceDataRegistry.filter_by(
+                PropertyType,
+                "project_category",
+                category.id,
+            )
+            project_categories.append(
+                {
+                    **ProjectCategorySerializer(category).data,
+                    "property_types": PropertyTypeSerializer(property_types, many=True).data,
+                }
+            )
+
+        return {
+            "architect_specialities": architect_specialities,
+            "project_categories": project_categories,
+            "work_types": WorkTypeSerializer(
+                ReferenceDataRegistry.all(WorkType),
+                many=True,
+            ).data,
+            "renovation_pieces": PieceRenovateSerializer(
+                ReferenceDataRegistry.all(PieceRenovate),
+                many=True,
+            ).data,
+            "architectural_styles": ArchitecturalStyleSerializer(
+                ReferenceDataRegistry.all(ArchitecturalStyle),
+                many=True,
+            ).data,
+            "project_extensions": ProjectExtensionSerializer(
+                ReferenceDataRegistry.all(ProjectExtension),
+                many=True,
+            ).data,
+            "cities": cls._choices(CITIES),
+            "terrain_surfaces": cls._choices(TERRAIN_SURFACES),
+            "work_surfaces": cls._choices(WORK_SURFACES),
+            "budgets": cls._choices(BUDGETS),
+        }
+
+    @classmethod
+    def _choices(cls, choices):
+        """
+        Formats a choice list like the individual choice endpoints do.
+
+        Args:
+            choices (list): (value, display name) pairs.
+
+        Returns:
+            list: Dicts holding the value and display name of each choice.
+        """
+        return [{"value": value, "display_name": display_name} for value, display_name in choices]
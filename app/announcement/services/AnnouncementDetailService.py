@@ -0,0 +1,103 @@
+"""
+Module: announcement detail Service
+
+This module defines the AnnouncementDetailService class that serves announcement details from
+a cache of rendered payloads.
+
+Classes:
+    AnnouncementDetailService: Service class caching the rendered announcement details.
+
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+from app.core.services.SingleFlightCache import SingleFlightCache
+
+
+class AnnouncementDetailService:
+    """
+    Service class serving announcement details as cached JSON documents.
+
+    Payloads are keyed by the ETag of the announcement, which changes with its updated_at, the
+    updated_at of its client and the versions of the reference tables it renders. The signals
+    touching the announcement when its pieces, images, needs or extensions change, and the
+    client when its user is saved, therefore make the previous payload unreachable, and it
+    expires after ANNOUNCEMENT_DETAIL_CACHE_TIMEOUT.
+
+    Attributes:
+        serializer_version (int): Version of the detail representation, to bump whenever the
+        fields of AnnouncementOutputSerializer or of its nested serializers change.
+        renderer_class (type): Renderer of the cached payloads.
+    """
+
+    serializer_version = 1
+    renderer_class = CamelCaseJSONRenderer
+
+    @classmethod
+    def get_detail(cls, view, request, etag):
+        """
+        Serves the detail of an announcement, rendering it on cache misses.
+
+        Concurrent misses on the same payload render it once.
+
+        Args:
+            view (AnnouncementViewSet): View serving the announcement.
+            request (Request): HTTP request object.
+            etag (str): ETag of the announcement.
+
+        Raises:
+            Http404: If the announcement does not exist.
+
+        Returns:
+            HttpResponse: The rendered announcement.
+        """
+        content = SingleFlightCache.get_or_set(
+            cls.get_cache_key(request, etag, view.get_fieldset()),
+            lambda: cls.render(view),
+            settings.ANNOUNCEMENT_DETAIL_CACHE_TIMEOUT,
+        )
+        return HttpResponse(content, content_type="application/json")
+
+    @classmethod
+    def render(cls, view):
+        """
+        Renders the detail of the announcement of a view.
+
+        Args:
+            view (AnnouncementViewSet): View serving the announcement.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        serializer = view.get_serializer(view.get_object())
+        return cls.renderer_class().render(serializer.data)
+
+    @classmethod
+    def get_cache_key(cls, request, etag, fieldset):
+        """
+        Builds the cache key of a rendered announcement.
+
+        The host is part of the key since image URLs are absolute.
+
+        Args:
+            request (Request): HTTP request object.
+            etag (str): ETag of the announcement.
+            fieldset (dict): Field selection of the request.
+
+        Returns:
+            str: The cache key.
+        """
+        digest = hashlib.md5(
+            json.dumps(
+                [etag, request.build_absolute_uri("/"), fieldset, cls.serializer_version],
+                sort_keys=True,
+            ).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f"announcement_detail:{digest}"
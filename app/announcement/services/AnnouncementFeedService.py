@@ -0,0 +1,137 @@
+"""
+Module: announcement feed Service
+
+This module defines the AnnouncementFeedService class that serves the announcement feed of an
+architect from the AnnouncementMatch table.
+
+The first page of each feed is the page polled by architects, so it is kept in the cache until
+the matches or the announcements it shows change.
+
+Classes:
+    AnnouncementFeedService: Service class serving and invalidating architect feeds.
+
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from app.announcement.controllers.utils.AnnouncementFeedPagination import AnnouncementFeedPagination
+from app.announcement.models.AnnouncementMatch import AnnouncementMatch
+from app.announcement.serializers.AnnouncementMatchSerializer import AnnouncementMatchSerializer
+from app.core.services.QueryPlanner import QueryPlanner
+from app.users.models.Architect import Architect
+
+
+class AnnouncementFeedService:
+    """
+    Service class serving the announcement feed of architects.
+    """
+
+    cache_key_prefix = "announcement_feed"
+
+    @classmethod
+    def get_feed(cls, request):
+        """
+        Retrieves a page of the announcements matching the architect of the current user.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Raises:
+            NotFound: If the cursor of the request is invalid.
+            ValidationError: If the request selects unknown fields.
+
+        Returns:
+            Response: Matched announcements and scores, newest first, with navigation links.
+        """
+        try:
+            architect_id = (
+                Architect.objects.filter(user=request.user).values_list("id", flat=True).first()
+            )
+            if architect_id is None:
+                return Response(
+                    {"message": "Only architects have an announcement feed"},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            paginator = AnnouncementFeedPagination()
+            page_size = paginator.get_page_size(request)
+            fieldset = AnnouncementMatchSerializer.get_fieldset(request)
+            first_page = not request.query_params.get(paginator.cursor_query_param)
+            cache_key = cls.get_cache_key(architect_id)
+            if first_page:
+                cached = cache.get(cache_key)
+                if cached is not None and cached["variant"] == (page_size, fieldset):
+                    return Response(cached["data"], status=status.HTTP_200_OK)
+
+            queryset = QueryPlanner.optimize(
+                AnnouncementMatch.objects.filter(architect_id=architect_id),
+                AnnouncementMatchSerializer,
+                **fieldset,
+                columns=[paginator.ordering_field],
+            )
+            page = paginator.paginate_queryset(queryset, request)
+            serializer = AnnouncementMatchSerializer(
+                page,
+                many=True,
+                context={"request": request, **fieldset},
+            )
+            data = paginator.get_paginated_response(serializer.data).data
+            if first_page:
+                cache.set(
+                    cache_key,
+                    {"variant": (page_size, fieldset), "data": data},
+                    settings.ANNOUNCEMENT_FEED_CACHE_TIMEOUT,
+                )
+            return Response(data, status=status.HTTP_200_OK)
+        except (NotFound, ValidationError):
+            raise
+        except Exception:
+            raise APIException("Error retrieving announcement feed")
+
+    @classmethod
+    def get_cache_key(cls, architect_id):
+        """
+        Returns the cache key of the first feed page of an architect.
+
+        Args:
+            architect_id (int): Id of the architect.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"{cls.cache_key_prefix}:{architect_id}"
+
+    @classmethod
+    def invalidate(cls, architect_ids):
+        """
+        Drops the cached first feed pages of architects once the current transaction commits.
+
+        Args:
+            architect_ids (iterable): Ids of the architects.
+        """
+        keys = [cls.get_cache_key(architect_id) for architect_id in set(architect_ids)]
+        if keys:
+            transaction.on_commit(lambda: cache.delete_many(keys))
+
+    @classmethod
+    def invalidate_announcements(cls, announcement_ids):
+        """
+        Drops the cached first feed pages of the architects matched with announcements.
+
+        Args:
+            announcement_ids (iterable): Ids of the announcements.
+        """
+        cls.invalidate(
+            AnnouncementMatch.objects.filter(announcement_id__in=announcement_ids).values_list(
+                "architect_id",
+                flat=True,
+            )
+        )
@@ -0,0 +1,175 @@
+"""
+Module: announcement search Service
+
+This module defines the AnnouncementSearchService class that maintains the full-text search
+document of announcements and searches them.
+
+The search document concatenates, for every configured text search configuration, the
+description (weight A) and the address (weight B) of an announcement. It is stored in the
+search_vector column, backed by a GIN index, so that searches never scan the descriptions.
+
+Search results are ranked with an exact numeric rank, so that keyset pagination cursors hold
+the same value the database compares them with. Their headline is an excerpt of the
+HTML-escaped description, in which only the <mark> elements around the matched words are
+markup.
+
+Classes:
+    AnnouncementSearchService: Service class for announcement full-text search.
+
+"""
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.contrib.postgres.search import SearchVector
+from django.db.models import DecimalField
+from django.db.models import F
+from django.db.models import Value
+from django.db.models.functions import Cast
+from django.db.models.functions import Replace
+
+from app.announcement.models.Announcement import Announcement
+
+
+class AnnouncementSearchService:
+    """
+    Service class maintaining and querying the announcement search documents.
+
+    Attributes:
+        indexed_fields (dict): Indexed text fields and their weights.
+        batch_size (int): Number of announcements updated per query by the backfill.
+        rank_field (DecimalField): Exact type the float search ranks are rounded to.
+        html_entities (list): Characters escaped in headlines and their entities, ampersand
+        first.
+    """
+
+    indexed_fields = {"description": "A", "address": "B"}
+    batch_size = 1000
+    rank_field = DecimalField(max_digits=12, decimal_places=6)
+    html_entities = [
+        ("&", "&amp;"),
+        ("<", "&lt;"),
+        (">", "&gt;"),
+        ('"', "&quot;"),
+        ("'", "&#x27;"),
+    ]
+
+    @classmethod
+    def get_vector(cls):
+        """
+        Builds the expression computing the search document of an announcement.
+
+        Returns:
+            CombinedSearchVector: The search document expression.
+        """
+        vector = None
+        for config in settings.ANNOUNCEMENT_SEARCH_CONFIGS:
+            for field, weight in cls.indexed_fields.items():
+                part = SearchVector(field, weight=weight, config=config)
+                vector = part if vector is None else vector + part
+        return vector
+
+    @classmethod
+    def get_query(cls, text):
+        """
+        Builds the search query matching a user search in any configured language.
+
+        Args:
+            text (str): Search typed by the user, in web search syntax.
+
+        Returns:
+            SearchQuery: The combined query.
+        """
+        query = None
+        for config in settings.ANNOUNCEMENT_SEARCH_CONFIGS:
+            part = SearchQuery(text, config=config, search_type="websearch")
+            query = part if query is None else query | part
+        return query
+
+    @classmethod
+    def get_escaped_text(cls, field):
+        """
+        Builds the expression HTML-escaping a text field, as django.utils.html.escape does.
+
+        Args:
+            field (str): Name of the text field.
+
+        Returns:
+            Func: The escaped text expression.
+        """
+        expression = F(field)
+        for character, entity in cls.html_entities:
+            expression = Replace(expression, Value(character), Value(entity))
+        return expression
+
+    @classmethod
+    def search(cls, queryset, text, ranked=True):
+        """
+        Restricts an announcement queryset to the announcements matching a search.
+
+        Args:
+            queryset (QuerySet): Announcement queryset.
+            text (str): Search typed by the user.
+            ranked (bool): Annotate the search_rank and search_headline of each announcement.
+            The rank is a Decimal and the headline is HTML, the description being escaped.
+
+        Returns:
+            QuerySet: The matching announcements.
+        """
+        query = cls.get_query(text)
+        queryset = queryset.filter(search_vector=query)
+        if not ranked:
+            return queryset
+        return queryset.annotate(
+            search_rank=Cast(SearchRank(F("search_vector"), query), cls.rank_field),
+            search_headline=SearchHeadline(
+                cls.get_escaped_text("description"),
+                query,
+                config=settings.ANNOUNCEMENT_SEARCH_CONFIGS[0],
+                start_sel="<mark>",
+                stop_sel="</mark>",
+                max_words=35,
+                min_words=15,
+            ),
+        )
+
+    @classmethod
+    def update_search_vectors(cls, announcement_ids):
+        """
+        Recomputes the search documents of announcements in the database.
+
+        Args:
+            announcement_ids (iterable): Ids of the announcements.
+
+        Returns:
+            int: Number of announcements updated.
+        """
+        return Announcement.objects.filter(pk__in=list(announcement_ids)).update(
+            search_vector=cls.get_vector()
+        )
+
+    @classmethod
+    def backfill(cls, only_missing=False):
+        """
+        Recomputes the search documents of all announcements, in batches of primary keys.
+
+        Args:
+            only_missing (bool): Only update announcements without a search document.
+
+        Returns:
+            int: Number of announcements updated.
+        """
+        queryset = Announcement.objects.order_by("pk")
+        if only_missing:
+            queryset = queryset.filter(search_vector__isnull=True)
+        count = 0
+        last_id = 0
+        while True:
+            ids = list(
+                queryset.filter(pk__gt=last_id).values_list("pk", flat=True)[: cls.batch_size]
+            )
+            if not ids:
+                return count
+            count += cls.update_search_vectors(ids)
+            last_id = ids[-1]
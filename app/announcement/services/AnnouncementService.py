@@ -35,11 +35,14 @@ from app.announcement.serializers.ProjectCategorySerializer import ProjectCatego
 from app.announcement.serializers.ProjectExtensionSerializer import ProjectExtensionSerializer
 from app.announcement.serializers.PropertyTypeSerializer import PropertyTypeSerializer
 from app.announcement.serializers.WorkTypeSerializer import WorkTypeSerializer
+from app.announcement.tasks import schedule_image_processing
 from app.core.models.ArchitectSpeciality import ArchitectSpeciality
 from app.core.models.ArchitecturalStyle import ArchitecturalStyle
 from app.core.models.ProjectCategory import ProjectCategory
 from app.core.models.PropertyType import PropertyType
 from app.core.models.WorkType import WorkType
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+from app.core.services.StoredFileService import StoredFileService
 from app.users import USER_TYPE_CHOICES
 from app.users.models import Client
 from app.users.models.ArchimatchUser import ArchimatchUser
@@ -72,6 +75,13 @@ class AnnouncementService:
             project_images_data = validated_data.pop("project_images", [])
             client_data = validated_data.pop("client", None)
 
+            pieces_renovate, errors = cls._resolve_pieces_renovate(pieces_renovate_data)
+            if errors:
+                return Response(
+                    {"pieces_renovate": errors},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
             with transaction.atomic():
                 if client_data:
                     user_data = client_data.pop("user")
@@ -89,24 +99,39 @@ class AnnouncementService:
                     client=client_instance,
                     **validated_data,
                 )
-                announcement.needs.set(needs_data)
-
-                for piece_data in pieces_renovate_data:
-                    piece_renovate_id = piece_data["piece_renovate"]
-                    piece_renovate = PieceRenovate.objects.get(pk=piece_renovate_id)
-                    AnnouncementPieceRenovate.objects.create(
-                        announcement=announcement,
-                        piece_renovate=piece_renovate,
-                        number=piece_data["number"],
-                    )
 
-                announcement.project_extensions.set(project_extensions_data)
+                cls._bulk_create_through_rows(announcement, "needs", needs_data)
+                cls._bulk_create_through_rows(
+                    announcement,
+                    "project_extensions",
+                    project_extensions_data,
+                )
+                announcement_pieces = AnnouncementPieceRenovate.objects.bulk_create(
+                    [
+                        AnnouncementPieceRenovate(
+                            announcement=announcement,
+                            piece_renovate=piece_renovate,
+                            number=number,
+                        )
+                        for piece_renovate, number in pieces_renovate
+                    ]
+                )
+                project_images = ProjectImage.objects.bulk_create(
+                    [
+                        ProjectImage(
+                            announcement=announcement,
+                            image=image,
+                        )
+                        for image in project_images_data
+                    ]
+                )
+                StoredFileService.track(project_images)
+                schedule_image_processing([image.pk for image in project_images])
 
-                for image in project_images_data:
-                    ProjectImage.objects.create(
-                        announcement=announcement,
-                        image=image,
-                    )
+            cls._cache_related(announcement, "needs", needs_data)
+            cls._cache_related(announcement, "project_extensions", project_extensions_data)
+            cls._cache_related(announcement, "pieces_renovate", announcement_pieces)
+            cls._cache_related(announcement, "project_images", project_images)
 
             return Response(
                 {
@@ -122,6 +147,10 @@ class AnnouncementService:
     def update_announcement(cls, instance, data):
         """
         Updating existing announcement
+
+        Only the fields, relations and images that differ from the stored announcement are
+        written. Existing images listed in kept_project_images are kept as they are, the other
+        existing images are replaced by the uploaded project_images.
         """
         serializer = AnnouncementPUTSerializer(instance, data=data)
         if not serializer.is_valid():
@@ -137,34 +166,60 @@ class AnnouncementService:
             pieces_renovate_data = validated_data.pop("pieces_renovate", [])
             project_extensions_data = validated_data.pop("project_extensions")
             project_images_data = validated_data.pop("project_images", [])
+            kept_project_images_data = validated_data.pop("kept_project_images", [])
 
-            instance.needs.set(needs_data)
-
-            AnnouncementPieceRenovate.objects.filter(announcement=instance).delete()
-            for piece_data in pieces_renovate_data:
-                piece_renovate_id = piece_data["piece_renovate"]
-                piece_renovate = PieceRenovate.objects.get(pk=piece_renovate_id)
-                AnnouncementPieceRenovate.objects.create(
-                    announcement=instance,
-                    piece_renovate=piece_renovate,
-                    number=piece_data["number"],
+            pieces_renovate, errors = cls._resolve_pieces_renovate(pieces_renovate_data)
+            if errors:
+                return Response(
+                    {"pieces_renovate": errors},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            instance.project_extensions.set(project_extensions_data)
+            with transaction.atomic():
+                current_images = {image.id: image for image in instance.project_images.all()}
+                unknown_images = [
+                    str(image_id)
+                    for image_id in kept_project_images_data
+                    if image_id not in current_images
+                ]
+                if unknown_images:
+                    return Response(
+                        {
+                            "kept_project_images": [
+                                f'Invalid pks "{", ".join(unknown_images)}" - objects do not '
+                                "belong to this announcement."
+                            ]
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
 
-            ProjectImage.objects.filter(announcement=instance).delete()
-            for image in project_images_data:
-                ProjectImage.objects.create(
-                    announcement=instance,
-                    image=image,
+                changed_relations = [
+                    cls._sync_through_rows(instance, "needs", needs_data),
+                    cls._sync_through_rows(instance, "project_extensions", project_extensions_data),
+                ]
+                announcement_pieces, pieces_changed = cls._sync_pieces_renovate(
+                    instance,
+                    pieces_renovate,
+                )
+                project_images, images_changed = cls._sync_project_images(
+                    instance,
+                    current_images,
+                    kept_project_images_data,
+                    project_images_data,
                 )
 
-            for (
-                attr,
-                value,
-            ) in validated_data.items():
-                setattr(instance, attr, value)
-            instance.save()
+                update_fields = [
+                    field_name
+                    for field_name, value in validated_data.items()
+                    if cls._set_if_changed(instance, field_name, value)
+                ]
+                if update_fields or pieces_changed or images_changed or any(changed_relations):
+                    instance.save(update_fields=update_fields + ["updated_at"])
+
+            cls._cache_related(instance, "needs", needs_data)
+            cls._cache_related(instance, "project_extensions", project_extensions_data)
+            cls._cache_related(instance, "pieces_renovate", announcement_pieces)
+            cls._cache_related(instance, "project_images", project_images)
 
             return Response(
                 {
@@ -176,6 +231,211 @@ class AnnouncementService:
         except Exception:
             raise APIException("Error updating announcement")
 
+    @classmethod
+    def _resolve_pieces_renovate(cls, pieces_renovate_data):
+        """
+        Resolves the submitted renovation pieces with a single query.
+
+        Args:
+            pieces_renovate_data (list): Dicts holding a piece_renovate id and a number.
+
+        Returns:
+            tuple: List of (PieceRenovate, number) pairs and a list of error messages, empty
+            when every piece exists and is submitted once.
+        """
+        piece_ids = [piece_data["piece_renovate"] for piece_data in pieces_renovate_data]
+        pieces = ReferenceDataRegistry.in_bulk(PieceRenovate, piece_ids)
+
+        errors = []
+        missing = [str(piece_id) for piece_id in piece_ids if piece_id not in pieces]
+        if missing:
+            errors.append(f'Invalid pks "{", ".join(missing)}" - objects do not exist.')
+        if len(set(piece_ids)) != len(piece_ids):
+            errors.append("Each renovation piece can only be submitted once.")
+        if errors:
+            return [], errors
+
+        return [
+            (pieces[piece_data["piece_renovate"]], piece_data["number"])
+            for piece_data in pieces_renovate_data
+        ], []
+
+    @classmethod
+    def _bulk_create_through_rows(cls, announcement, field_name, related_objects):
+        """
+        Links objects to an announcement through a many-to-many field with one INSERT.
+
+        Args:
+            announcement (Announcement): Announcement being linked.
+            field_name (str): Name of the many-to-many field on Announcement.
+            related_objects (list): Objects to link.
+
+        Returns:
+            list: The created through rows.
+        """
+        field = Announcement._meta.get_field(field_name)
+        through = field.remote_field.through
+        return through.objects.bulk_create(
+            [
+                through(
+                    **{
+                        field.m2m_field_name(): announcement,
+                        field.m2m_reverse_field_name(): related_object,
+                    }
+                )
+                for related_object in related_objects
+            ]
+        )
+
+    @classmethod
+    def _cache_related(cls, instance, name, related_objects):
+        """
+        Stores in-memory related objects as if they had been prefetched.
+
+        Serializers reading the relation then use these objects instead of querying them back.
+
+        Args:
+            instance (Model): Instance owning the relation.
+            name (str): Name of the many-valued relation.
+            related_objects (list): Current objects of the relation.
+        """
+        queryset = getattr(instance, name).all()
+        queryset._result_cache = list(related_objects)
+        queryset._prefetch_done = True
+        if not hasattr(instance, "_prefetched_objects_cache"):
+            instance._prefetched_objects_cache = {}
+        instance._prefetched_objects_cache[name] = queryset
+
+    @classmethod
+    def _sync_through_rows(cls, announcement, field_name, related_objects):
+        """
+        Makes the links of a many-to-many field match the submitted objects.
+
+        Args:
+            announcement (Announcement): Announcement being updated.
+            field_name (str): Name of the many-to-many field on Announcement.
+            related_objects (list): Objects the announcement must be linked to.
+
+        Returns:
+            bool: True when links were added or removed.
+        """
+        field = Announcement._meta.get_field(field_name)
+        through = field.remote_field.through
+        source_name = field.m2m_field_name()
+        target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+        rows = through.objects.filter(**{source_name: announcement})
+        current_ids = set(rows.values_list(target_attname, flat=True))
+        submitted = {related_object.pk: related_object for related_object in related_objects}
+
+        removed_ids = current_ids - submitted.keys()
+        if removed_ids:
+            rows.filter(**{f"{target_attname}__in": removed_ids}).delete()
+        added = [
+            related_object for pk, related_object in submitted.items() if pk not in current_ids
+        ]
+        if added:
+            cls._bulk_create_through_rows(announcement, field_name, added)
+        return bool(removed_ids or added)
+
+    @classmethod
+    def _sync_pieces_renovate(cls, announcement, pieces_renovate):
+        """
+        Makes the renovation pieces of an announcement match the submitted ones.
+
+        Args:
+            announcement (Announcement): Announcement being updated.
+            pieces_renovate (list): (PieceRenovate, number) pairs.
+
+        Returns:
+            tuple: The resulting AnnouncementPieceRenovate rows and whether any row changed.
+        """
+        current = {
+            piece.piece_renovate_id: piece
+            for piece in AnnouncementPieceRenovate.objects.filter(announcement=announcement)
+        }
+        submitted_ids = {piece_renovate.id for piece_renovate, _ in pieces_renovate}
+
+        removed_ids = [row.id for piece_id, row in current.items() if piece_id not in submitted_ids]
+        added, updated, rows = [], [], []
+        for piece_renovate, number in pieces_renovate:
+            row = current.get(piece_renovate.id)
+            if row is None:
+                row = AnnouncementPieceRenovate(
+                    announcement=announcement,
+                    piece_renovate=piece_renovate,
+                    number=number,
+                )
+                added.append(row)
+            else:
+                row.piece_renovate = piece_renovate
+                if row.number != number:
+                    row.number = number
+                    updated.append(row)
+            rows.append(row)
+
+        if removed_ids:
+            AnnouncementPieceRenovate.objects.filter(id__in=removed_ids).delete()
+        if updated:
+            AnnouncementPieceRenovate.objects.bulk_update(updated, ["number"])
+        if added:
+            AnnouncementPieceRenovate.objects.bulk_create(added)
+        return rows, bool(removed_ids or updated or added)
+
+    @classmethod
+    def _sync_project_images(cls, announcement, current_images, kept_ids, uploaded_images):
+        """
+        Keeps the listed images of an announcement and replaces the others by the uploads,
+        whose renditions are generated in the background.
+
+        Args:
+            announcement (Announcement): Announcement being updated.
+            current_images (dict): Current ProjectImage instances keyed by id.
+            kept_ids (list): Ids of the current images to keep.
+            uploaded_images (list): Newly uploaded image files.
+
+        Returns:
+            tuple: The resulting ProjectImage instances and whether any image changed.
+        """
+        kept_ids = set(kept_ids)
+        removed_ids = [image_id for image_id in current_images if image_id not in kept_ids]
+        if removed_ids:
+            ProjectImage.objects.filter(id__in=removed_ids).delete()
+        added = ProjectImage.objects.bulk_create(
+            [ProjectImage(announcement=announcement, image=image) for image in uploaded_images]
+        )
+        StoredFileService.track(added)
+        schedule_image_processing([image.pk for image in added])
+        kept = [image for image_id, image in current_images.items() if image_id in kept_ids]
+        return kept + added, bool(removed_ids or added)
+
+    @classmethod
+    def _set_if_changed(cls, instance, field_name, value):
+        """
+        Assigns a validated value to an instance field when it differs from the stored one.
+
+        Foreign keys are compared on their column so the related objects are not loaded.
+
+        Args:
+            instance (Model): Instance being updated.
+            field_name (str): Name of the model field.
+            value: Validated value.
+
+        Returns:
+            bool: True when the field was changed.
+        """
+        field = instance._meta.get_field(field_name)
+        if field.is_relation:
+            current = getattr(instance, field.attname)
+            new = value.pk if value is not None else None
+        else:
+            current = getattr(instance, field_name)
+            new = value
+        if current == new:
+            return False
+        setattr(instance, field_name, value)
+        return True
+
     @classmethod
     def get_architect_specialities(cls):
         """
@@ -185,7 +445,7 @@ class AnnouncementService:
             Response: Response containing list of architect specialities.
         """
         try:
-            architect_specialities = ArchitectSpeciality.objects.all()
+            architect_specialities = ReferenceDataRegistry.all(ArchitectSpeciality)
             serializer = ArchitectSpecialitySerializer(
                 architect_specialities,
                 many=True,
@@ -209,12 +469,16 @@ class AnnouncementService:
             Response: Response containing list of needs related to the architect speciality.
         """
         try:
-            if not ArchitectSpeciality.objects.filter(id=architect_speciality_id).exists():
+            if ReferenceDataRegistry.get(ArchitectSpeciality, architect_speciality_id) is None:
                 return Response(
                     {"message": "No architect speciality found with the given ID"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            needs = Need.objects.filter(architect_speciality_id=architect_speciality_id)
+            needs = ReferenceDataRegistry.filter_by(
+                Need,
+                "architect_speciality",
+                architect_speciality_id,
+            )
             serializer = NeedSerializer(needs, many=True)
             return Response(
                 serializer.data,
@@ -232,7 +496,7 @@ class AnnouncementService:
         Response: Response containing list of project categories.
         """
         try:
-            project_categories = ProjectCategory.objects.all()
+            project_categories = ReferenceDataRegistry.all(ProjectCategory)
             serializer = ProjectCategorySerializer(project_categories, many=True)
             return Response(
                 serializer.data,
@@ -253,12 +517,16 @@ class AnnouncementService:
             Response: Response containing list of property types related to the project category.
         """
         try:
-            if not ProjectCategory.objects.filter(id=project_category_id).exists():
+            if ReferenceDataRegistry.get(ProjectCategory, project_category_id) is None:
                 return Response(
                     {"message": "No project category found with the given ID"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            property_types = PropertyType.objects.filter(project_category_id=project_category_id)
+            property_types = ReferenceDataRegistry.filter_by(
+                PropertyType,
+                "project_category",
+                project_category_id,
+            )
             serializer = PropertyTypeSerializer(property_types, many=True)
             return Response(
                 serializer.data,
@@ -276,7 +544,7 @@ class AnnouncementService:
             Response: Response containing list of announcement work types.
         """
         try:
-            announcement_work_types = WorkType.objects.all()
+            announcement_work_types = ReferenceDataRegistry.all(WorkType)
             serializer = WorkTypeSerializer(announcement_work_types, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception:
@@ -291,7 +559,7 @@ class AnnouncementService:
             Response: Response containing list of renovation pieces.
         """
         try:
-            renovation_pieces = PieceRenovate.objects.all()
+            renovation_pieces = ReferenceDataRegistry.all(PieceRenovate)
             serializer = PieceRenovateSerializer(renovation_pieces, many=True)
             return Response(
                 serializer.data,
@@ -383,7 +651,7 @@ class AnnouncementService:
             Response: Response containing list of architectural styles.
         """
         try:
-            architectural_styles = ArchitecturalStyle.objects.all()
+            architectural_styles = ReferenceDataRegistry.all(ArchitecturalStyle)
             serializer = ArchitecturalStyleSerializer(
                 architectural_styles,
                 many=True,
@@ -407,7 +675,7 @@ class AnnouncementService:
             Response: Response containing list of project extensions.
         """
         try:
-            project_extensions = ProjectExtension.objects.all()
+            project_extensions = ReferenceDataRegistry.all(ProjectExtension)
             serializer = ProjectExtensionSerializer(project_extensions, many=True)
             return Response(
                 serializer.data,
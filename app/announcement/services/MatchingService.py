@@ -0,0 +1,436 @@
+"""
+Module: matching Service
+
+This module defines the MatchingService class that matches architects with announcements.
+
+Architect preferences are encoded as integer bitsets: for each dimension, bit `id` of an
+architect's bitset is set when the architect accepts the value `id`. The reverse index keeps,
+for each speciality and each dimension value, the bitset of the architects (by position)
+accepting it, so candidates of an announcement are selected with a few AND/OR operations.
+
+Classes:
+    ArchitectProfile: Preference bitsets of one architect.
+    ArchitectMatchIndex: Profiles of all architects and their reverse bitset index.
+    MatchingService: Service class ranking architects and announcements, and maintaining the
+    materialized AnnouncementMatch table.
+
+"""
+
+import itertools
+import threading
+
+from django.db import transaction
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.AnnouncementMatch import AnnouncementMatch
+from app.core.models.TableVersion import TableVersion
+from app.users import ARCHITECT_PREFERENCES_TABLE_VERSION
+from app.users.models.Architect import Architect
+
+
+def iter_bits(bitset):
+    """
+    Yields the positions of the set bits of an integer, lowest first.
+
+    Args:
+        bitset (int): Bitset to walk.
+
+    Yields:
+        int: Position of a set bit.
+    """
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+class ArchitectProfile:
+    """
+    Preference bitsets of one architect.
+
+    Attributes:
+        architect_id (int): Id of the architect.
+        architect_speciality_id (int): Speciality of the architect.
+        preferences (dict): Bitset of the accepted ids per dimension, 0 for no preference.
+    """
+
+    def __init__(self, architect_id, architect_speciality_id):
+        """
+        Initializes a profile without preferences.
+
+        Args:
+            architect_id (int): Id of the architect.
+            architect_speciality_id (int): Speciality of the architect.
+        """
+        self.architect_id = architect_id
+        self.architect_speciality_id = architect_speciality_id
+        self.preferences = dict.fromkeys(MatchingService.dimensions, 0)
+
+
+class ArchitectMatchIndex:
+    """
+    Profiles of all architects and their reverse bitset index.
+
+    Attributes:
+        version (int): TableVersion of the architect preferences the index was built from.
+        profiles (list): ArchitectProfile instances, indexed by position.
+        by_id (dict): Profiles keyed by architect id.
+        by_speciality (dict): Bitset of architect positions per speciality id.
+        by_value (dict): Per dimension, bitset of architect positions accepting each value id.
+        without_preference (dict): Per dimension, bitset of architects accepting any value.
+    """
+
+    def __init__(self, version):
+        """
+        Loads the architects and their preferences.
+
+        Args:
+            version (int): Current TableVersion of the architect preferences.
+        """
+        self.version = version
+        self.profiles = [
+            ArchitectProfile(architect_id, architect_speciality_id)
+            for architect_id, architect_speciality_id in Architect.objects.order_by(
+                "id"
+            ).values_list("id", "architect_speciality_id")
+        ]
+        self.by_id = {profile.architect_id: profile for profile in self.profiles}
+        positions = {
+            profile.architect_id: position for position, profile in enumerate(self.profiles)
+        }
+
+        self.by_speciality = {}
+        for position, profile in enumerate(self.profiles):
+            bit = 1 << position
+            self.by_speciality[profile.architect_speciality_id] = (
+                self.by_speciality.get(profile.architect_speciality_id, 0) | bit
+            )
+
+        self.by_value = {}
+        self.without_preference = {}
+        for dimension, relation in MatchingService.dimensions.items():
+            field = Architect._meta.get_field(relation)
+            through = field.remote_field.through
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+            index = self.by_value[dimension] = {}
+            with_preference = 0
+            for architect_id, value_id in through.objects.values_list(source, target):
+                position = positions.get(architect_id)
+                if position is None:
+                    continue
+                self.by_id[architect_id].preferences[dimension] |= 1 << value_id
+                index[value_id] = index.get(value_id, 0) | (1 << position)
+                with_preference |= 1 << position
+            self.without_preference[dimension] = ((1 << len(self.profiles)) - 1) & ~with_preference
+
+
+class MatchingService:
+    """
+    Service class ranking architects for announcements and announcements for architects.
+
+    An architect is a candidate for an announcement when they share its speciality. Candidates
+    are scored with the weights of the dimensions they accept; an architect without preference
+    in a dimension accepts every value of it.
+
+    Attributes:
+        dimensions (dict): Announcement foreign keys and the matching Architect preferences.
+        weights (dict): Score of each dimension.
+        candidate_limit (int): Number of most recent announcements scored for an architect.
+        batch_size (int): Number of AnnouncementMatch rows read or written per query.
+    """
+
+    dimensions = {
+        "project_category_id": "project_categories",
+        "property_type_id": "property_types",
+        "work_type_id": "work_types",
+        "architectural_style_id": "architectural_styles",
+    }
+    weights = {
+        "project_category_id": 4,
+        "property_type_id": 3,
+        "work_type_id": 2,
+        "architectural_style_id": 1,
+    }
+    candidate_limit = 1000
+    batch_size = 1000
+    _index = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_index(cls):
+        """
+        Returns the match index of the current architect preferences, rebuilding it when needed.
+
+        Returns:
+            ArchitectMatchIndex: The current index.
+        """
+        label = ARCHITECT_PREFERENCES_TABLE_VERSION
+        version = TableVersion.current([label])[label]
+        index = cls._index
+        if index is None or index.version != version:
+            with cls._lock:
+                index = cls._index
+                if index is None or index.version != version:
+                    index = ArchitectMatchIndex(version)
+                    cls._index = index
+        return index
+
+    @classmethod
+    def score(cls, profile, attributes):
+        """
+        Scores an announcement for an architect.
+
+        Args:
+            profile (ArchitectProfile): Preferences of the architect.
+            attributes (dict): Announcement foreign key ids keyed by dimension.
+
+        Returns:
+            int: The score, 0 when the specialities differ.
+        """
+        if profile.architect_speciality_id != attributes["architect_speciality_id"]:
+            return 0
+        score = 0
+        for dimension, weight in cls.weights.items():
+            accepted = profile.preferences[dimension]
+            value_id = attributes[dimension]
+            if not accepted or (value_id is not None and accepted >> value_id & 1):
+                score += weight
+        return score
+
+    @classmethod
+    def rank_architects(cls, attributes):
+        """
+        Ranks the architects matching an announcement.
+
+        Args:
+            attributes (dict): Announcement foreign key ids keyed by dimension, plus
+            architect_speciality_id.
+
+        Returns:
+            list: (architect id, score) pairs, best first.
+        """
+        index = cls.get_index()
+        candidates = index.by_speciality.get(attributes["architect_speciality_id"], 0)
+        accepted = {
+            dimension: (
+                index.by_value[dimension].get(attributes[dimension], 0)
+                | index.without_preference[dimension]
+            )
+            & candidates
+            for dimension in cls.weights
+        }
+
+        ranking = []
+        for position in iter_bits(candidates):
+            score = sum(
+                weight
+                for dimension, weight in cls.weights.items()
+                if accepted[dimension] >> position & 1
+            )
+            ranking.append((index.profiles[position].architect_id, score))
+        ranking.sort(key=lambda item: (-item[1], item[0]))
+        return ranking
+
+    @classmethod
+    def rank_announcements(cls, architect_id, limit=None):
+        """
+        Ranks the most recent announcements matching an architect.
+
+        Args:
+            architect_id (int): Id of the architect.
+            limit (int): Maximum number of announcements to return.
+
+        Returns:
+            list: (announcement id, score) pairs, best first, most recent first on ties.
+        """
+        profile = cls.get_index().by_id.get(architect_id)
+        if profile is None:
+            return []
+        fields = ["id", "architect_speciality_id", *cls.dimensions]
+        rows = (
+            Announcement.objects.filter(architect_speciality_id=profile.architect_speciality_id)
+            .order_by("-created_at", "-id")
+            .values(*fields)[: cls.candidate_limit]
+        )
+        ranking = [(row["id"], cls.score(profile, row)) for row in rows]
+        ranking.sort(key=lambda item: -item[1])
+        return ranking[:limit] if limit else ranking
+
+    @classmethod
+    def refresh_announcement_matches(cls, announcement_ids):
+        """
+        Recomputes the AnnouncementMatch rows of announcements.
+
+        Args:
+            announcement_ids (iterable): Ids of the announcements, deleted ones included.
+
+        Returns:
+            set: Ids of the architects matched with the announcements before or after.
+        """
+        announcement_ids = list(announcement_ids)
+        rows = Announcement.objects.filter(pk__in=announcement_ids).values(*cls._match_fields())
+        with transaction.atomic():
+            previous = AnnouncementMatch.objects.filter(announcement_id__in=announcement_ids)
+            architect_ids = set(previous.values_list("architect_id", flat=True))
+            previous.delete()
+            matches = [match for row in rows for match in cls._match_rows(row)]
+            cls._save_matches(matches)
+        return architect_ids | {match.architect_id for match in matches}
+
+    @classmethod
+    def refresh_architect_matches(cls, architect_ids):
+        """
+        Recomputes the AnnouncementMatch rows of architects.
+
+        Args:
+            architect_ids (iterable): Ids of the architects, deleted ones included.
+        """
+        architect_ids = list(architect_ids)
+        index = cls.get_index()
+        with transaction.atomic():
+            AnnouncementMatch.objects.filter(architect_id__in=architect_ids).delete()
+            for architect_id in architect_ids:
+                profile = index.by_id.get(architect_id)
+                if profile is None:
+                    continue
+                rows = Announcement.objects.filter(
+                    architect_speciality_id=profile.architect_speciality_id
+                ).values(*cls._match_fields())
+                cls._save_matches(
+                    AnnouncementMatch(
+                        architect_id=architect_id,
+                        announcement_id=row["id"],
+                        score=score,
+                        announcement_created_at=row["created_at"],
+                    )
+                    for row in rows.iterator(cls.batch_size)
+                    if (score := cls.score(profile, row))
+                )
+
+    @classmethod
+    def rebuild_matches(cls):
+        """
+        Rebuilds the whole AnnouncementMatch table from the announcements and preferences.
+
+        Returns:
+            int: Number of rows written.
+        """
+        rows = Announcement.objects.order_by("id").values(*cls._match_fields())
+        with transaction.atomic():
+            AnnouncementMatch.objects.all().delete()
+            return cls._save_matches(
+                match for row in rows.iterator(cls.batch_size) for match in cls._match_rows(row)
+            )
+
+    @classmethod
+    def _match_fields(cls):
+        """
+        Lists the announcement fields read to score it.
+
+        Returns:
+            list: Field names to pass to values().
+        """
+        return ["id", "created_at", "architect_speciality_id", *cls.dimensions]
+
+    @classmethod
+    def _match_rows(cls, row):
+        """
+        Builds the unsaved AnnouncementMatch rows of an announcement.
+
+        Architects sharing the speciality of the announcement but accepting none of its values
+        get no row.
+
+        Args:
+            row (dict): Announcement values read with _match_fields.
+
+        Returns:
+            list: AnnouncementMatch instances.
+        """
+        return [
+            AnnouncementMatch(
+                architect_id=architect_id,
+                announcement_id=row["id"],
+                score=score,
+                announcement_created_at=row["created_at"],
+            )
+            for architect_id, score in cls.rank_architects(row)
+            if score
+        ]
+
+    @classmethod
+    def _save_matches(cls, matches):
+        """
+        Inserts AnnouncementMatch rows in batches.
+
+        Args:
+            matches (iterable): Unsaved AnnouncementMatch instances, possibly a generator.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        matches = iter(matches)
+        count = 0
+        while batch := list(itertools.islice(matches, cls.batch_size)):
+            AnnouncementMatch.objects.bulk_create(batch)
+            count += len(batch)
+        return count
+
+    @classmethod
+    def get_matching_architects(cls, announcement, limit):
+        """
+        Retrieves the best matching architects of an announcement.
+
+        Args:
+            announcement (Announcement): The announcement.
+            limit (int): Maximum number of architects to return.
+
+        Returns:
+            Response: Response containing architect ids and scores.
+        """
+        try:
+            attributes = {
+                "architect_speciality_id": announcement.architect_speciality_id,
+                **{dimension: getattr(announcement, dimension) for dimension in cls.dimensions},
+            }
+            ranking = cls.rank_architects(attributes)[:limit]
+            return Response(
+                [{"architect": architect_id, "score": score} for architect_id, score in ranking],
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error retrieving matching architects")
+
+    @classmethod
+    def get_matching_announcements(cls, architect_id, limit):
+        """
+        Retrieves the best matching announcements of an architect.
+
+        Args:
+            architect_id (int): Id of the architect.
+            limit (int): Maximum number of announcements to return.
+
+        Returns:
+            Response: Response containing announcement ids and scores.
+        """
+        try:
+            if architect_id not in cls.get_index().by_id:
+                return Response(
+                    {"message": "No architect found with the given ID"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            ranking = cls.rank_announcements(architect_id, limit)
+            return Response(
+                [
+                    {"announcement": announcement_id, "score": score}
+                    for announcement_id, score in ranking
+                ],
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error retrieving matching announcements")
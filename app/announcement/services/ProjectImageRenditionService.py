@@ -0,0 +1,191 @@
+"""
+Module: project image rendition Service
+
+This module defines the ProjectImageRenditionService class that generates the resized copies
+of uploaded project images, served to clients instead of the originals.
+
+Classes:
+    ProjectImageRenditionService: Service class generating project image renditions.
+
+"""
+
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from PIL import Image
+
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.ProjectImage import ProjectImage
+from app.core.services.ImageRenditionService import ImageRenditionService
+
+
+class ProjectImageRenditionService(ImageRenditionService):
+    """
+    Service class generating the renditions of project images.
+
+    Each size of PROJECT_IMAGE_RENDITIONS is encoded in every format of
+    PROJECT_IMAGE_RENDITION_FORMATS. Sizes larger than the original reuse the files of the
+    largest size it fits in, since images are never upscaled.
+
+    Attributes:
+        upload_to (str): Storage directory of the renditions.
+        batch_size (int): Number of images loaded per query.
+    """
+
+    upload_to = "images/ProjectImage/renditions/"
+    batch_size = 100
+
+    @classmethod
+    def process(cls, image_ids=None, force=False):
+        """
+        Generates the renditions of project images.
+
+        Args:
+            image_ids (iterable): Ids of the images to process, every image when None.
+            force (bool): Regenerate the renditions of images already processed.
+
+        Returns:
+            int: Number of images processed.
+        """
+        queryset = ProjectImage.objects.order_by("pk")
+        if image_ids is not None:
+            queryset = queryset.filter(pk__in=image_ids)
+        if not force:
+            queryset = queryset.filter(processed_at__isnull=True)
+
+        count = 0
+        for project_image in queryset.iterator(chunk_size=cls.batch_size):
+            if cls.process_image(project_image):
+                count += 1
+        return count
+
+    @classmethod
+    def process_image(cls, project_image):
+        """
+        Generates and records the renditions of one project image.
+
+        Files that cannot be decoded are marked as processed without renditions. The results
+        are written with an update query, which leaves images deleted meanwhile, such as the
+        images replaced by an announcement edit, deleted: their renditions are then removed.
+        The announcement is touched, as the image save signal would.
+
+        Args:
+            project_image (ProjectImage): Image to process.
+
+        Returns:
+            bool: False when the image was deleted before its renditions were recorded.
+        """
+        previous = project_image.renditions or {}
+        image = cls.open(project_image.image)
+
+        if image is None:
+            project_image.width = project_image.height = None
+            project_image.renditions = {}
+        else:
+            project_image.width, project_image.height = image.size
+            stem = os.path.splitext(os.path.basename(project_image.image.name))[0]
+            project_image.renditions = cls.render(image, f"{project_image.pk}-{stem}")
+        project_image.processed_at = timezone.now()
+        updated = ProjectImage.objects.filter(pk=project_image.pk).update(
+            width=project_image.width,
+            height=project_image.height,
+            renditions=project_image.renditions,
+            processed_at=project_image.processed_at,
+        )
+        if not updated:
+            cls.delete_files(project_image.renditions, keep=previous)
+            cls.delete_files(previous)
+            return False
+        Announcement.objects.filter(pk=project_image.announcement_id).update(
+            updated_at=project_image.processed_at
+        )
+        cls.delete_files(previous, keep=project_image.renditions)
+        return True
+
+    @classmethod
+    def render(cls, image, stem):
+        """
+        Encodes and stores the renditions of an image.
+
+        Args:
+            image (Image): Normalized image.
+            stem (str): Prefix of the rendition file names.
+
+        Returns:
+            dict: Rendition entries keyed by size name.
+        """
+        renditions = {}
+        previous = None
+        for size_name, edge in sorted(
+            settings.PROJECT_IMAGE_RENDITIONS.items(),
+            key=lambda item: item[1],
+        ):
+            resized = image.copy()
+            resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            if previous is not None and previous["width"] == resized.width:
+                renditions[size_name] = previous
+                continue
+            previous = renditions[size_name] = {
+                "width": resized.width,
+                "height": resized.height,
+                "files": {
+                    extension: cls.save(resized, f"{stem}-{size_name}.{extension}", options)
+                    for extension, options in settings.PROJECT_IMAGE_RENDITION_FORMATS.items()
+                },
+            }
+        return renditions
+
+    @classmethod
+    def save(cls, image, name, options):
+        """
+        Encodes an image and stores it.
+
+        Args:
+            image (Image): Image to encode.
+            name (str): File name of the rendition.
+            options (dict): Pillow format name and encoder options.
+
+        Returns:
+            str: Storage name of the rendition.
+        """
+        content = ContentFile(cls.encode(image, options))
+        return default_storage.save(f"{cls.upload_to}{name}", content)
+
+    @classmethod
+    def get_file_names(cls):
+        """
+        Lists the rendition files of every project image, for the orphaned media collector.
+
+        Yields:
+            str: Storage name of each rendition file.
+        """
+        renditions = (
+            ProjectImage.objects.exclude(renditions={})
+            .order_by()
+            .values_list("renditions", flat=True)
+            .iterator(chunk_size=cls.batch_size)
+        )
+        for entries in renditions:
+            for entry in entries.values():
+                yield from entry["files"].values()
+
+    @classmethod
+    def delete_files(cls, renditions, keep=None):
+        """
+        Deletes the files of rendition entries.
+
+        Args:
+            renditions (dict): Rendition entries keyed by size name.
+            keep (dict): Rendition entries whose files must be kept.
+        """
+        kept = {
+            file_name for entry in (keep or {}).values() for file_name in entry["files"].values()
+        }
+        for entry in renditions.values():
+            for file_name in entry["files"].values():
+                if file_name not in kept:
+                    default_storage.delete(file_name)
@@ -0,0 +1,148 @@
+"""
+Module: saved search percolator
+
+This module defines the SavedSearchPercolator class that matches new announcements against
+the saved searches of architects.
+
+Instead of running every saved search against every new announcement, saved searches are kept
+in a reverse index mapping each criterion value to the ids of the saved searches requiring
+it. The saved searches matching an announcement are the intersection, over the criteria, of
+the searches requiring its value and the searches leaving the criterion empty.
+
+Classes:
+    SavedSearchIndex: Reverse index of all saved searches.
+    SavedSearchPercolator: Service class matching announcements and queueing notifications.
+
+"""
+
+import threading
+
+from app.announcement import SAVED_SEARCHES_TABLE_VERSION
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.SavedSearch import SavedSearch
+from app.announcement.models.SavedSearchMatch import SavedSearchMatch
+from app.core.models.TableVersion import TableVersion
+
+
+class SavedSearchIndex:
+    """
+    Reverse index of all saved searches.
+
+    Attributes:
+        version (int): TableVersion of the saved searches the index was built from.
+        architects (dict): Architect id of each saved search.
+        by_value (dict): Per criterion, sets of saved search ids keyed by required value.
+        without_criterion (dict): Per criterion, set of saved search ids leaving it empty.
+    """
+
+    def __init__(self, version):
+        """
+        Loads the saved searches.
+
+        Args:
+            version (int): Current TableVersion of the saved searches.
+        """
+        self.version = version
+        self.architects = {}
+        self.by_value = {criterion: {} for criterion in SavedSearchPercolator.criteria}
+        self.without_criterion = {criterion: set() for criterion in SavedSearchPercolator.criteria}
+
+        rows = SavedSearch.objects.values("id", "architect_id", *SavedSearchPercolator.criteria)
+        for row in rows.iterator():
+            self.architects[row["id"]] = row["architect_id"]
+            for criterion in SavedSearchPercolator.criteria:
+                value = row[criterion]
+                if value in (None, ""):
+                    self.without_criterion[criterion].add(row["id"])
+                else:
+                    self.by_value[criterion].setdefault(value, set()).add(row["id"])
+
+
+class SavedSearchPercolator:
+    """
+    Service class matching announcements against saved searches.
+
+    Attributes:
+        criteria (tuple): Announcement columns saved searches can require a value for.
+        batch_size (int): Number of SavedSearchMatch rows written per query.
+    """
+
+    criteria = ("city", "budget", "project_category_id", "architectural_style_id")
+    batch_size = 1000
+    _index = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_index(cls):
+        """
+        Returns the index of the current saved searches, rebuilding it when needed.
+
+        Returns:
+            SavedSearchIndex: The current index.
+        """
+        label = SAVED_SEARCHES_TABLE_VERSION
+        version = TableVersion.current([label])[label]
+        index = cls._index
+        if index is None or index.version != version:
+            with cls._lock:
+                index = cls._index
+                if index is None or index.version != version:
+                    index = SavedSearchIndex(version)
+                    cls._index = index
+        return index
+
+    @classmethod
+    def percolate(cls, index, attributes):
+        """
+        Finds the saved searches matching an announcement.
+
+        Args:
+            index (SavedSearchIndex): Index of the saved searches, shared by a whole dispatch.
+            attributes (dict): Announcement values keyed by criterion.
+
+        Returns:
+            set: Ids of the matching saved searches.
+        """
+        matches = None
+        for criterion in cls.criteria:
+            accepted = index.by_value[criterion].get(attributes[criterion], set())
+            accepted = accepted | index.without_criterion[criterion]
+            matches = accepted if matches is None else matches & accepted
+            if not matches:
+                return set()
+        return matches
+
+    @classmethod
+    def dispatch(cls, announcement_ids):
+        """
+        Queues the notifications of the saved searches matching announcements.
+
+        Every announcement is matched against the same snapshot of the index, so saved
+        searches created meanwhile are consistently left to the next dispatch.
+
+        Args:
+            announcement_ids (iterable): Ids of the new announcements.
+
+        Returns:
+            int: Number of notifications queued.
+        """
+        index = cls.get_index()
+        rows = Announcement.objects.filter(pk__in=list(announcement_ids)).values(
+            "id",
+            *cls.criteria,
+        )
+        matches = [
+            SavedSearchMatch(
+                architect_id=index.architects[saved_search_id],
+                saved_search_id=saved_search_id,
+                announcement_id=row["id"],
+            )
+            for row in rows
+            for saved_search_id in sorted(cls.percolate(index, row))
+        ]
+        SavedSearchMatch.objects.bulk_create(
+            matches,
+            batch_size=cls.batch_size,
+            ignore_conflicts=True,
+        )
+        return len(matches)
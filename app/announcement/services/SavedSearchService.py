@@ -0,0 +1,179 @@
+"""
+Module: saved search Service
+
+This module defines the SavedSearchService class that manages the saved searches of architects
+and serves the notifications queued for them.
+
+Classes:
+    SavedSearchService: Service class for saved searches and their notifications.
+
+"""
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from app.announcement.models.SavedSearch import SavedSearch
+from app.announcement.models.SavedSearchMatch import SavedSearchMatch
+from app.announcement.serializers.SavedSearchMatchSerializer import SavedSearchMatchSerializer
+from app.announcement.serializers.SavedSearchSerializer import SavedSearchSerializer
+from app.core.controllers.KeysetCursorPagination import KeysetCursorPagination
+from app.core.services.QueryPlanner import QueryPlanner
+from app.users.models.Architect import Architect
+
+
+class SavedSearchService:
+    """
+    Service class for the saved searches of the authenticated architect.
+    """
+
+    @classmethod
+    def get_saved_searches(cls, request):
+        """
+        Retrieves the saved searches of the architect of the current user.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Returns:
+            Response: Response containing the list of saved searches.
+        """
+        try:
+            architect_id = cls.get_architect_id(request.user)
+            if architect_id is None:
+                return cls.architect_required()
+            saved_searches = SavedSearch.objects.filter(architect_id=architect_id).order_by("id")
+            return Response(
+                SavedSearchSerializer(saved_searches, many=True).data,
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error retrieving saved searches")
+
+    @classmethod
+    def create_saved_search(cls, request):
+        """
+        Creates a saved search for the architect of the current user.
+
+        Args:
+            request (Request): HTTP request object containing the criteria.
+
+        Returns:
+            Response: Response containing the created saved search or validation errors.
+        """
+        architect_id = cls.get_architect_id(request.user)
+        if architect_id is None:
+            return cls.architect_required()
+        serializer = SavedSearchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            saved_search = serializer.save(architect_id=architect_id)
+            return Response(
+                {
+                    "message": "Saved search created successfully",
+                    "data": SavedSearchSerializer(saved_search).data,
+                },
+                status=status.HTTP_201_CREATED,
+            )
+        except Exception:
+            raise APIException("Error creating saved search")
+
+    @classmethod
+    def delete_saved_search(cls, request, saved_search_id):
+        """
+        Deletes a saved search of the architect of the current user.
+
+        Args:
+            request (Request): HTTP request object.
+            saved_search_id (int): ID of the saved search.
+
+        Returns:
+            Response: Response indicating whether the saved search was deleted.
+        """
+        try:
+            architect_id = cls.get_architect_id(request.user)
+            if architect_id is None:
+                return cls.architect_required()
+            saved_search = SavedSearch.objects.filter(
+                pk=saved_search_id,
+                architect_id=architect_id,
+            ).first()
+            if saved_search is None:
+                return Response(
+                    {"message": "No saved search found with the given ID"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            saved_search.delete()
+            return Response(
+                {"message": "Saved search deleted successfully"},
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error deleting saved search")
+
+    @classmethod
+    def get_saved_search_matches(cls, request):
+        """
+        Retrieves the announcements that matched the saved searches of the current architect.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Raises:
+            NotFound: If the cursor of the request is invalid.
+            ValidationError: If the request selects unknown fields.
+
+        Returns:
+            Response: A keyset-paginated page of notifications, newest first.
+        """
+        try:
+            architect_id = cls.get_architect_id(request.user)
+            if architect_id is None:
+                return cls.architect_required()
+            fieldset = SavedSearchMatchSerializer.get_fieldset(request)
+            queryset = QueryPlanner.optimize(
+                SavedSearchMatch.objects.filter(architect_id=architect_id),
+                SavedSearchMatchSerializer,
+                **fieldset,
+            )
+            paginator = KeysetCursorPagination()
+            page = paginator.paginate_queryset(queryset, request)
+            serializer = SavedSearchMatchSerializer(
+                page,
+                many=True,
+                context={"request": request, **fieldset},
+            )
+            return paginator.get_paginated_response(serializer.data)
+        except (NotFound, ValidationError):
+            raise
+        except Exception:
+            raise APIException("Error retrieving saved search matches")
+
+    @classmethod
+    def get_architect_id(cls, user):
+        """
+        Returns the id of the architect profile of a user.
+
+        Args:
+            user (ArchimatchUser): Authenticated user.
+
+        Returns:
+            int or None: Id of the architect, None when the user is not an architect.
+        """
+        return Architect.objects.filter(user=user).values_list("id", flat=True).first()
+
+    @classmethod
+    def architect_required(cls):
+        """
+        Builds the response returned to users without an architect profile.
+
+        Returns:
+            Response: A 403 response.
+        """
+        return Response(
+            {"message": "Only architects have saved searches"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
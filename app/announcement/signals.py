@@ -0,0 +1,210 @@
+"""
+Module defining the signal receivers of the announcement application.
+
+Changes to the rows rendered inside an announcement (renovation pieces, images, needs and
+extensions) touch the announcement updated_at, and changes to the user of a client touch the
+client updated_at, which validate conditional requests.
+
+Changes to the matched fields of announcements and to the preferences of architects schedule
+the refresh of the AnnouncementMatch table. New announcements are matched against saved
+searches, and changes to existing ones drop the cached feed pages showing them. Changes to
+the searched fields recompute the full-text search document. Uploaded project images are
+queued for the generation of their renditions.
+"""
+
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from app.announcement.models.Announcement import Announcement
+from app.announcement.models.AnnouncementPieceRenovate import AnnouncementPieceRenovate
+from app.announcement.models.ProjectImage import ProjectImage
+from app.announcement.services.AnnouncementFeedService import AnnouncementFeedService
+from app.announcement.services.AnnouncementSearchService import AnnouncementSearchService
+from app.announcement.tasks import schedule_image_processing
+from app.announcement.tasks import schedule_match_refresh
+from app.announcement.tasks import schedule_percolation
+from app.users.models.ArchimatchUser import ArchimatchUser
+from app.users.models.Architect import Architect
+from app.users.models.Client import Client
+from app.users.serializers.ArchimatchUserSerializer import ArchimatchUserSerializer
+
+
+MATCHED_ANNOUNCEMENT_FIELDS = {
+    "architect_speciality",
+    "project_category",
+    "property_type",
+    "work_type",
+    "architectural_style",
+}
+SEARCHED_ANNOUNCEMENT_FIELDS = {"description", "address"}
+
+
+def touch_announcements(announcement_ids):
+    """
+    Sets the updated_at of announcements to the current time.
+
+    Args:
+        announcement_ids (iterable): Ids of the announcements to touch.
+    """
+    announcement_ids = [pk for pk in announcement_ids if pk is not None]
+    if announcement_ids:
+        Announcement.objects.filter(pk__in=announcement_ids).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=AnnouncementPieceRenovate)
+@receiver(post_delete, sender=AnnouncementPieceRenovate)
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+def touch_announcement_on_child_change(sender, instance, **kwargs):
+    """
+    Touches the announcement of a saved or deleted renovation piece or image.
+
+    Args:
+        sender (Model): Model of the changed row.
+        instance (Model): The changed row.
+    """
+    touch_announcements([instance.announcement_id])
+
+
+@receiver(post_save, sender=ArchimatchUser)
+def touch_client_on_user_change(sender, instance, update_fields=None, **kwargs):
+    """
+    Touches the client profile of a saved user, whose fields are rendered in announcements.
+
+    Saves limited to fields that announcements do not render, such as the last_login update
+    of a sign-in, leave the client untouched.
+
+    Args:
+        sender (Model): ArchimatchUser model.
+        instance (ArchimatchUser): The saved user.
+        update_fields (frozenset): Fields written by the save, None for all of them.
+    """
+    if update_fields is not None and not update_fields & set(ArchimatchUserSerializer.Meta.fields):
+        return
+    Client.objects.filter(user=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=ProjectImage)
+def process_project_image_on_upload(sender, instance, created, **kwargs):
+    """
+    Schedules the generation of the renditions of a new project image.
+
+    Images created in bulk do not send this signal and are scheduled by their creator.
+
+    Args:
+        sender (Model): ProjectImage model.
+        instance (ProjectImage): The saved image.
+        created (bool): True when the image was created.
+    """
+    if created:
+        schedule_image_processing([instance.pk])
+
+
+@receiver(m2m_changed, sender=Announcement.needs.through)
+@receiver(m2m_changed, sender=Announcement.project_extensions.through)
+def touch_announcement_on_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Touches the announcements whose needs or extensions were changed.
+
+    Args:
+        sender (Model): Through model of the relation.
+        instance (Model): Announcement, or related object when changed from the reverse side.
+        action (str): Kind of change.
+        reverse (bool): True when the relation was changed from the related object.
+        pk_set (set): Primary keys added or removed.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        touch_announcements([instance.pk])
+    elif pk_set:
+        touch_announcements(pk_set)
+
+
+@receiver(post_save, sender=Announcement)
+def refresh_matches_on_announcement_save(sender, instance, created, update_fields, **kwargs):
+    """
+    Schedules the refresh of the matches of a saved announcement, and its matching against
+    saved searches when it is new, or drops the cached feed pages showing it otherwise.
+
+    Args:
+        sender (Model): Announcement model.
+        instance (Announcement): The saved announcement.
+        created (bool): True when the announcement was created.
+        update_fields (frozenset): Fields saved, None when all fields were saved.
+    """
+    if created or update_fields is None or MATCHED_ANNOUNCEMENT_FIELDS & update_fields:
+        schedule_match_refresh(announcement_ids=[instance.pk])
+    if created:
+        schedule_percolation([instance.pk])
+    else:
+        AnnouncementFeedService.invalidate_announcements([instance.pk])
+
+
+@receiver(post_save, sender=Announcement)
+def update_search_vector_on_announcement_save(sender, instance, created, update_fields, **kwargs):
+    """
+    Recomputes the search document of a saved announcement when its searched fields changed.
+
+    Args:
+        sender (Model): Announcement model.
+        instance (Announcement): The saved announcement.
+        created (bool): True when the announcement was created.
+        update_fields (frozenset): Fields saved, None when all fields were saved.
+    """
+    if created or update_fields is None or SEARCHED_ANNOUNCEMENT_FIELDS & update_fields:
+        AnnouncementSearchService.update_search_vectors([instance.pk])
+
+
+@receiver(pre_delete, sender=Announcement)
+def invalidate_feeds_on_announcement_delete(sender, instance, **kwargs):
+    """
+    Drops the cached feed pages showing a deleted announcement.
+
+    Args:
+        sender (Model): Announcement model.
+        instance (Announcement): The announcement being deleted.
+    """
+    AnnouncementFeedService.invalidate_announcements([instance.pk])
+
+
+@receiver(post_save, sender=Architect)
+def refresh_matches_on_architect_save(sender, instance, created, update_fields, **kwargs):
+    """
+    Schedules the refresh of the matches of a saved architect.
+
+    Args:
+        sender (Model): Architect model.
+        instance (Architect): The saved architect.
+        created (bool): True when the architect was created.
+        update_fields (frozenset): Fields saved, None when all fields were saved.
+    """
+    if created or update_fields is None or "architect_speciality" in update_fields:
+        schedule_match_refresh(architect_ids=[instance.pk])
+
+
+@receiver(m2m_changed, sender=Architect.project_categories.through)
+@receiver(m2m_changed, sender=Architect.property_types.through)
+@receiver(m2m_changed, sender=Architect.work_types.through)
+@receiver(m2m_changed, sender=Architect.architectural_styles.through)
+def refresh_matches_on_preference_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Schedules the refresh of the matches of architects whose preferences were changed.
+
+    Args:
+        sender (Model): Through model of the preference.
+        instance (Model): Architect, or preference value when changed from the reverse side.
+        action (str): Kind of change.
+        reverse (bool): True when the relation was changed from the preference value.
+        pk_set (set): Primary keys added or removed.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        schedule_match_refresh(architect_ids=[instance.pk])
+    elif pk_set:
+        schedule_match_refresh(architect_ids=pk_set)
@@ -0,0 +1,152 @@
+"""
+Module defining the background tasks of the announcement application.
+
+The AnnouncementMatch table is refreshed, new announcements are matched against saved
+searches and the renditions of uploaded project images are generated by a background worker
+(python manage.py process_tasks). Changes made during a transaction are collected and
+scheduled as one task per kind once the transaction commits.
+
+Functions:
+    schedule_match_refresh: Collects the announcements and architects whose matches changed.
+    schedule_percolation: Collects the new announcements to match against saved searches.
+    schedule_image_processing: Collects the uploaded project images to generate renditions of.
+    refresh_announcement_matches: Task recomputing the matches of announcements.
+    refresh_architect_matches: Task recomputing the matches of architects.
+    percolate_saved_searches: Task queueing the saved search notifications of announcements.
+    process_project_images: Task generating the renditions of project images.
+"""
+
+import threading
+
+from django.db import transaction
+
+from background_task import background
+
+from app.announcement.services.AnnouncementFeedService import AnnouncementFeedService
+from app.announcement.services.MatchingService import MatchingService
+from app.announcement.services.ProjectImageRenditionService import ProjectImageRenditionService
+from app.announcement.services.SavedSearchPercolator import SavedSearchPercolator
+
+
+_pending = threading.local()
+
+
+@background(schedule=0)
+def refresh_announcement_matches(announcement_ids):
+    """
+    Recomputes the AnnouncementMatch rows of announcements and drops the affected feed pages.
+
+    Args:
+        announcement_ids (list): Ids of the announcements.
+    """
+    architect_ids = MatchingService.refresh_announcement_matches(announcement_ids)
+    AnnouncementFeedService.invalidate(architect_ids)
+
+
+@background(schedule=0)
+def refresh_architect_matches(architect_ids):
+    """
+    Recomputes the AnnouncementMatch rows of architects and drops their feed pages.
+
+    Args:
+        architect_ids (list): Ids of the architects.
+    """
+    MatchingService.refresh_architect_matches(architect_ids)
+    AnnouncementFeedService.invalidate(architect_ids)
+
+
+@background(schedule=0)
+def percolate_saved_searches(announcement_ids):
+    """
+    Queues the notifications of the saved searches matching new announcements.
+
+    Args:
+        announcement_ids (list): Ids of the announcements.
+    """
+    SavedSearchPercolator.dispatch(announcement_ids)
+
+
+@background(schedule=0)
+def process_project_images(image_ids):
+    """
+    Generates the renditions of uploaded project images.
+
+    Args:
+        image_ids (list): Ids of the images.
+    """
+    ProjectImageRenditionService.process(image_ids)
+
+
+def schedule_match_refresh(announcement_ids=(), architect_ids=()):
+    """
+    Schedules the refresh of the matches of announcements and architects after commit.
+
+    Ids collected during a transaction are scheduled together by the first commit callback.
+    Ids collected in a rolled back transaction are refreshed with the next commit, which is
+    harmless since the tasks recompute the rows from the database.
+
+    Args:
+        announcement_ids (iterable): Ids of the changed announcements.
+        architect_ids (iterable): Ids of the changed architects.
+    """
+    pending = _get_pending()
+    pending["announcements"].update(pk for pk in announcement_ids if pk is not None)
+    pending["architects"].update(pk for pk in architect_ids if pk is not None)
+    transaction.on_commit(_flush_pending)
+
+
+def schedule_percolation(announcement_ids):
+    """
+    Schedules the matching of new announcements against saved searches after commit.
+
+    Args:
+        announcement_ids (iterable): Ids of the new announcements.
+    """
+    _get_pending()["percolations"].update(pk for pk in announcement_ids if pk is not None)
+    transaction.on_commit(_flush_pending)
+
+
+def schedule_image_processing(image_ids):
+    """
+    Schedules the generation of the renditions of uploaded project images after commit.
+
+    Args:
+        image_ids (iterable): Ids of the uploaded images.
+    """
+    _get_pending()["images"].update(pk for pk in image_ids if pk is not None)
+    transaction.on_commit(_flush_pending)
+
+
+def _get_pending():
+    """
+    Returns the ids waiting for a commit in the current thread.
+
+    Returns:
+        dict: Sets of ids keyed by kind of task.
+    """
+    if not hasattr(_pending, "ids"):
+        _pending.ids = {
+            "announcements": set(),
+            "architects": set(),
+            "percolations": set(),
+            "images": set(),
+        }
+    return _pending.ids
+
+
+def _flush_pending():
+    """
+    Schedules the tasks of the ids collected in the current thread.
+    """
+    tasks = {
+        "announcements": refresh_announcement_matches,
+        "architects": refresh_architect_matches,
+        "percolations": percolate_saved_searches,
+        "images": process_project_images,
+    }
+    pending = _get_pending()
+    for kind, task in tasks.items():
+        ids = sorted(pending[kind])
+        pending[kind].clear()
+        if ids:
+            task(ids)
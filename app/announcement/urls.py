@@ -14,6 +14,7 @@ from django.urls import path
 from rest_framework import routers
 
 from app.announcement.routes.AnnouncementUrls import announcement_urlpatterns
+from app.announcement.routes.SavedSearchUrls import saved_search_urlpatterns
 
 
 router = routers.DefaultRouter()
@@ -21,4 +22,5 @@ router = routers.DefaultRouter()
 urlpatterns = [
     path("", include(router.urls)),
     *announcement_urlpatterns,
+    *saved_search_urlpatterns,
 ]
@@ -22,9 +22,10 @@ from app.architect_request.serializers.ArchitectRequestSerializer import (
 )
 from app.architect_request.serializers.ArchitectRequestSerializer import ArchitectRequestSerializer
 from app.architect_request.services.ArchitectRequestService import ArchitectRequestService
+from app.core.controllers.OptimizedQuerySetMixin import OptimizedQuerySetMixin
 
 
-class ArchitectRequestViewSet(viewsets.ModelViewSet):
+class ArchitectRequestViewSet(OptimizedQuerySetMixin, viewsets.ModelViewSet):
     """
     Viewset for the ArchitectRequest model.
 
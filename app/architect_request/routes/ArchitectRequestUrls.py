@@ -9,6 +9,11 @@ from app.architect_request.controllers.ArchitectRequestViewSet import ArchitectR
 
 
 architect_request_urlpatterns = [
+    path(
+        "architect-requests/",
+        ArchitectRequestViewSet.as_view({"get": "list"}),
+        name="architect-requests",
+    ),
     path(
         "create-architect-request/",
         ArchitectRequestViewSet.as_view({"post": "create_architect_request"}),
@@ -17,6 +17,7 @@ from app.core.models.ArchitecturalStyle import ArchitecturalStyle
 from app.core.models.ProjectCategory import ProjectCategory
 from app.core.models.PropertyType import PropertyType
 from app.core.models.WorkType import WorkType
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
 from app.users.models.Admin import Admin
 
 
@@ -62,7 +63,7 @@ class ArchitectRequestInputSerializer(serializers.ModelSerializer):
         ]
 
 
-class ArchitectRequestSerializer(serializers.ModelSerializer):
+class ArchitectRequestSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for the ArchitectRequest model.
 
@@ -0,0 +1 @@
+BLOGS_TABLE_VERSION = "cms.blogs"
@@ -16,3 +16,20 @@ class CmsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.cms"
+
+    def ready(self):
+        """
+        Connects the signals versioning the published blogs and generating the renditions of
+        their images, and registers the renditions as a media source.
+        """
+        from app.cms import BLOGS_TABLE_VERSION
+        from app.cms import signals  # noqa: F401
+        from app.cms.models import Block
+        from app.cms.models import Blog
+        from app.cms.models import SliderImage
+        from app.cms.services.CmsImageRenditionService import CmsImageRenditionService
+        from app.core.services.MediaGarbageCollector import MediaGarbageCollector
+        from app.core.signals import track_table_version
+
+        track_table_version(BLOGS_TABLE_VERSION, Blog, Block, SliderImage)
+        MediaGarbageCollector.register_source(CmsImageRenditionService.get_file_names)
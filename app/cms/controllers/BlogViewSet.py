@@ -11,12 +11,18 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from app.cms import BLOGS_TABLE_VERSION
 from app.cms.controllers.utils.ManageBlogPermission import ManageBlogPermission
 from app.cms.models import Blog
+from app.cms.serializers.BlogSerializer import BlogOutputSerializer
 from app.cms.serializers.BlogSerializer import BlogSerializer
+from app.core.controllers.conditional_response import conditional_response
+from app.core.controllers.conditional_response import table_version_validators
+from app.core.controllers.OptimizedQuerySetMixin import OptimizedQuerySetMixin
+from app.core.services.QueryPlanner import QueryPlanner
 
 
-class BlogViewSet(viewsets.ModelViewSet):
+class BlogViewSet(OptimizedQuerySetMixin, viewsets.ModelViewSet):
     """
     A ViewSet for handling Blog instances.
 
@@ -27,6 +33,7 @@ class BlogViewSet(viewsets.ModelViewSet):
 
     queryset = Blog.objects.all()
     serializer_class = BlogSerializer
+    plan_serializer_class = BlogOutputSerializer
     permission_classes = [
         IsAuthenticated,
         ManageBlogPermission,
@@ -38,6 +45,7 @@ class BlogViewSet(viewsets.ModelViewSet):
         permission_classes=[permissions.AllowAny],
         name="get-blogs",
     )
+    @conditional_response(table_version_validators(BLOGS_TABLE_VERSION))
     def get_blogs(self, request):
         """
         Custom action to retrieve all blogs.
@@ -48,6 +56,6 @@ class BlogViewSet(viewsets.ModelViewSet):
         Returns:
             Response: Serialized data containing all Blog instances.
         """
-        blogs = Blog.objects.all()
+        blogs = QueryPlanner.optimize(Blog.objects.all(), BlogOutputSerializer)
         serializer = BlogSerializer(blogs, many=True)
         return Response(serializer.data)
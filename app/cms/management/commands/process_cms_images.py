@@ -0,0 +1,47 @@
+"""
+Management command generating the renditions of CMS images.
+
+Usage:
+    python manage.py process_cms_images [--force]
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.cms.services.CmsImageRenditionService import CmsImageRenditionService
+
+
+class Command(BaseCommand):
+    """
+    Generates the renditions of the blog cover photos, block images and slider images the
+    background worker has not processed, such as images uploaded before renditions existed.
+    """
+
+    help = "Generates the responsive renditions and placeholders of CMS images."
+
+    def add_arguments(self, parser):
+        """
+        Declares the options of the command.
+
+        Args:
+            parser (ArgumentParser): Parser of the command line.
+        """
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate the renditions of images already processed.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=CmsImageRenditionService.batch_size,
+            help="Number of rows loaded per query.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Processes the images and reports their number per model.
+        """
+        CmsImageRenditionService.batch_size = options["batch_size"]
+        counts = CmsImageRenditionService.process_all(force=options["force"])
+        for model_name, count in counts.items():
+            self.stdout.write(self.style.SUCCESS(f"Processed {count} {model_name} images."))
@@ -5,9 +5,11 @@ Module defining the Block model for representing blocks within a blog post.
 from django.db import models
 
 from app.cms.models.Blog import Blog
+from app.cms.models.ResponsiveImage import ResponsiveImage
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
 
 
-class Block(models.Model):
+class Block(ResponsiveImage):
     """
     Model representing a block within a blog post.
 
@@ -16,8 +18,8 @@ class Block(models.Model):
         blog (ForeignKey): Blog to which the block belongs, related_name is 'blocks'.
         block_type (CharField): Type of the block, selected from BLOG_BLOCK_TYPES.
         content (TextField): Optional content of the block.
-        image (ImageField): Optional image associated with the block, stored in 'BlockImages/'
-          directory.
+        image (ImageField): Optional image associated with the block, stored in the
+          content-addressed storage, with renditions generated from it.
     """
 
     BLOG_BLOCK_TYPES = [
@@ -39,9 +41,9 @@ class Block(models.Model):
     )
     content = models.TextField(blank=True, null=True)
     image = models.ImageField(
-        upload_to="BlockImages/",
         blank=True,
         null=True,
+        storage=ContentAddressedStorage(),
     )
 
     def __str__(self):
@@ -4,17 +4,21 @@ Module defining the Blog model for representing blog posts.
 
 from django.db import models
 
+from app.cms.models.ResponsiveImage import ResponsiveImage
 
-class Blog(models.Model):
+
+class Blog(ResponsiveImage):
     """
     Model representing a blog post.
 
     Attributes:
         title (CharField): Title of the blog post, maximum length of 255 characters.
         cover_photo (ImageField): Optional cover photo for the blog post, stored in
-        'BlogsCoverPhotos/' directory.
+        'BlogsCoverPhotos/' directory, with renditions generated from it.
     """
 
+    responsive_image_field = "cover_photo"
+
     title = models.CharField(max_length=255)
     cover_photo = models.ImageField(
         upload_to="BlogsCoverPhotos/",
@@ -0,0 +1,37 @@
+"""
+Module defining the ResponsiveImage abstract model for CMS rows holding an image.
+"""
+
+from django.db import models
+
+
+class ResponsiveImage(models.Model):
+    """
+    Abstract model recording the renditions generated for the image of a CMS row.
+
+    Attributes:
+        responsive_image_field (str): Name of the image field the renditions are generated
+        from.
+        width (PositiveIntegerField): Width of the image, once processed.
+        height (PositiveIntegerField): Height of the image, once processed.
+        renditions (JSONField): Resized copies of the image keyed by format, each a list of
+        entries holding the storage name, dimensions and size in bytes of a file, by
+        increasing width.
+        placeholder (TextField): Data URI of a tiny blurred copy of the image, shown while the
+        renditions load.
+        processed_image (CharField): Storage name of the image the renditions were generated
+        from, which differs from the image until the background worker processed it.
+    """
+
+    responsive_image_field = "image"
+
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    renditions = models.JSONField(default=dict, blank=True, editable=False)
+    placeholder = models.TextField(default="", blank=True, editable=False)
+    processed_image = models.CharField(max_length=255, default="", blank=True, editable=False)
+
+    class Meta:
+        """Meta class to specify that this model is abstract."""
+
+        abstract = True
@@ -5,22 +5,24 @@ Module defining the SliderImage model for representing images within slider bloc
 from django.db import models
 
 from app.cms.models.Block import Block
+from app.cms.models.ResponsiveImage import ResponsiveImage
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
 
 
-class SliderImage(models.Model):
+class SliderImage(ResponsiveImage):
     """
     Model representing an image within a slider block of a blog post.
 
     Attributes:
-        image (ImageField): Image file for the slider image, stored in 'BlockSliderImages/'
-         directory.
+        image (ImageField): Image file for the slider image, stored in the content-addressed
+         storage, with renditions generated from it.
         block (ForeignKey): Block to which the slider image belongs, related_name is
         'slider_images'.
 
 
     """
 
-    image = models.ImageField(upload_to="BlockSliderImages/")
+    image = models.ImageField(storage=ContentAddressedStorage())
     block = models.ForeignKey(
         Block,
         related_name="block_slider_images",
@@ -1,3 +1,4 @@
 from app.cms.models.Block import Block
 from app.cms.models.Blog import Blog
+from app.cms.models.ResponsiveImage import ResponsiveImage
 from app.cms.models.SliderImage import SliderImage
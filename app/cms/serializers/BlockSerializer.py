@@ -5,6 +5,7 @@ Serializers for handling Block model instances.
 from rest_framework import serializers
 
 from app.cms.models import Block
+from app.core.serializers.SrcsetField import SrcsetField
 
 from .SliderImageSerializer import SliderImageSerializer
 
@@ -16,9 +17,23 @@ class BlockSerializer(serializers.ModelSerializer):
     This serializer handles the serialization and deserialization of Block instances,
     including fields such as id, block_type, content, image, and slider_images.
 
+    Image blocks also render the dimensions, srcset and placeholder of their image.
+
+    Attributes:
+        IMAGE_FIELDS (list): Fields rendered for image blocks only.
     """
 
-    slider_images = SliderImageSerializer(many=True, read_only=True)
+    IMAGE_FIELDS = ["image", "image_width", "image_height", "image_srcset", "image_placeholder"]
+
+    image_width = serializers.IntegerField(source="width", read_only=True)
+    image_height = serializers.IntegerField(source="height", read_only=True)
+    image_srcset = SrcsetField(source="renditions")
+    image_placeholder = serializers.CharField(source="placeholder", read_only=True)
+    slider_images = SliderImageSerializer(
+        many=True,
+        read_only=True,
+        source="block_slider_images",
+    )
 
     class Meta:
         """
@@ -31,6 +46,10 @@ class BlockSerializer(serializers.ModelSerializer):
             "block_type",
             "content",
             "image",
+            "image_width",
+            "image_height",
+            "image_srcset",
+            "image_placeholder",
             "slider_images",
         ]
 
@@ -50,7 +69,8 @@ class BlockSerializer(serializers.ModelSerializer):
         if instance.block_type != "slider":
             representation.pop("slider_images", None)
         if instance.block_type != "image":
-            representation.pop("image", None)
+            for field_name in self.IMAGE_FIELDS:
+                representation.pop(field_name, None)
         if instance.block_type not in [
             "title",
             "paragraph",
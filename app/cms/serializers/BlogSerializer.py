@@ -7,6 +7,8 @@ from rest_framework import serializers
 from app.cms.models import Block
 from app.cms.models import Blog
 from app.cms.serializers.BlockSerializer import BlockSerializer
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
+from app.core.serializers.SrcsetField import SrcsetField
 
 
 class BlogInputSerializer(serializers.ModelSerializer):
@@ -71,11 +73,18 @@ class BlogInputSerializer(serializers.ModelSerializer):
         return instance
 
 
-class BlogOutputSerializer(serializers.ModelSerializer):
+class BlogOutputSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for retrieving Blog instances with read-only Blocks data.
+
+    The cover photo is rendered with its dimensions, srcset and placeholder, empty until the
+    background worker has processed it.
     """
 
+    cover_photo_width = serializers.IntegerField(source="width", read_only=True)
+    cover_photo_height = serializers.IntegerField(source="height", read_only=True)
+    cover_photo_srcset = SrcsetField(source="renditions")
+    cover_photo_placeholder = serializers.CharField(source="placeholder", read_only=True)
     blog_blocks = BlockSerializer(many=True, read_only=True)
 
     class Meta:
@@ -88,6 +97,10 @@ class BlogOutputSerializer(serializers.ModelSerializer):
             "id",
             "title",
             "cover_photo",
+            "cover_photo_width",
+            "cover_photo_height",
+            "cover_photo_srcset",
+            "cover_photo_placeholder",
             "blog_blocks",
         ]
 
@@ -121,7 +134,7 @@ class BlogSerializer(serializers.ModelSerializer):
         Returns:
             dict: Represented data of Blog instance.
         """
-        serializer = BlogOutputSerializer(instance)
+        serializer = BlogOutputSerializer(instance, context=self.context)
         return serializer.data
 
     def to_internal_value(self, data):
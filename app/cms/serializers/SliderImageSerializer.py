@@ -5,17 +5,33 @@ Module for serializing SliderImage instances using Django REST Framework seriali
 from rest_framework import serializers
 
 from app.cms.models import SliderImage
+from app.core.serializers.SrcsetField import SrcsetField
 
 
 class SliderImageSerializer(serializers.ModelSerializer):
     """
     Serializer for SliderImage instances.
+
+    The srcset and placeholder are empty until the background worker has processed the image;
+    clients fall back to the original image meanwhile.
     """
 
+    image_width = serializers.IntegerField(source="width", read_only=True)
+    image_height = serializers.IntegerField(source="height", read_only=True)
+    image_srcset = SrcsetField(source="renditions")
+    image_placeholder = serializers.CharField(source="placeholder", read_only=True)
+
     class Meta:
         """
         Meta class specifying the model and fields for the serializer.
         """
 
         model = SliderImage
-        fields = ["id", "image"]
+        fields = [
+            "id",
+            "image",
+            "image_width",
+            "image_height",
+            "image_srcset",
+            "image_placeholder",
+        ]
@@ -0,0 +1,238 @@
+"""
+Module: CMS image rendition Service
+
+This module defines the CmsImageRenditionService class that generates the responsive
+renditions of blog cover photos, block images and slider images, along with a tiny blurred
+placeholder shown while they load.
+
+Classes:
+    CmsImageRenditionService: Service class generating CMS image renditions.
+
+"""
+
+import base64
+
+from collections import Counter
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import F
+from django.db.models import Q
+
+from PIL import Image
+from PIL import ImageFilter
+
+from app.cms import BLOGS_TABLE_VERSION
+from app.cms.models import Block
+from app.cms.models import Blog
+from app.cms.models import SliderImage
+from app.core.models import TableVersion
+from app.core.services.ImageRenditionService import ImageRenditionService
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
+
+
+class CmsImageRenditionService(ImageRenditionService):
+    """
+    Service class generating the renditions of CMS images.
+
+    Each width of CMS_IMAGE_RENDITION_WIDTHS is encoded in every format of
+    CMS_IMAGE_RENDITION_FORMATS, forming the srcset of the image. Images are never upscaled: the
+    widths reaching the original width are replaced by one rendition at the original width.
+
+    Renditions are stored in the content-addressed storage, so that they are served as
+    immutable files and shared between identical images. Replaced renditions are left to the
+    orphaned media collector, since other rows may share them.
+
+    Attributes:
+        models (list): CMS models holding a responsive image.
+        storage (ContentAddressedStorage): Storage of the rendition files.
+        batch_size (int): Number of rows loaded per query.
+    """
+
+    models = [Blog, Block, SliderImage]
+    storage = ContentAddressedStorage()
+    batch_size = 100
+
+    @classmethod
+    def process(cls, model, ids=None, force=False):
+        """
+        Generates the renditions of the images of a CMS model.
+
+        Args:
+            model (Model): CMS model holding a responsive image.
+            ids (iterable): Ids of the rows to process, every row when None.
+            force (bool): Regenerate the renditions of images already processed.
+
+        Returns:
+            int: Number of rows processed.
+        """
+        field_name = model.responsive_image_field
+        queryset = model.objects.order_by("pk")
+        if ids is not None:
+            queryset = queryset.filter(pk__in=ids)
+        if not force:
+            queryset = queryset.exclude(processed_image=F(field_name)).exclude(
+                Q(**{f"{field_name}__isnull": True}) & Q(processed_image="")
+            )
+
+        count = 0
+        for instance in queryset.iterator(chunk_size=cls.batch_size):
+            if cls.process_instance(instance):
+                count += 1
+        return count
+
+    @classmethod
+    def process_all(cls, force=False):
+        """
+        Generates the renditions of the images of every CMS model.
+
+        Args:
+            force (bool): Regenerate the renditions of images already processed.
+
+        Returns:
+            Counter: Number of rows processed, keyed by model name.
+        """
+        return Counter({model.__name__: cls.process(model, force=force) for model in cls.models})
+
+    @classmethod
+    def process_instance(cls, instance):
+        """
+        Generates and records the renditions and placeholder of the image of one row.
+
+        Rows without image, or whose file cannot be decoded, are marked as processed without
+        renditions. The results are written with an update query, which leaves rows deleted
+        meanwhile, such as the blocks replaced by a blog edit, deleted; their renditions, which
+        other rows may share, are left to the orphaned media collector. The published blogs
+        version is bumped, as the save signal would.
+
+        Args:
+            instance (ResponsiveImage): Row to process.
+
+        Returns:
+            bool: False when the row was deleted before its renditions were recorded.
+        """
+        field_file = getattr(instance, instance.responsive_image_field)
+        image = cls.open(field_file) if field_file else None
+
+        if image is None:
+            instance.width = instance.height = None
+            instance.renditions = {}
+            instance.placeholder = ""
+        else:
+            instance.width, instance.height = image.size
+            instance.renditions = cls.render(image)
+            instance.placeholder = cls.render_placeholder(image)
+        instance.processed_image = field_file.name or ""
+        updated = (
+            type(instance)
+            .objects.filter(pk=instance.pk)
+            .update(
+                width=instance.width,
+                height=instance.height,
+                renditions=instance.renditions,
+                placeholder=instance.placeholder,
+                processed_image=instance.processed_image,
+            )
+        )
+        if not updated:
+            return False
+        TableVersion.bump(BLOGS_TABLE_VERSION)
+        return True
+
+    @classmethod
+    def is_processed(cls, instance):
+        """
+        Checks whether the renditions of a row match its current image.
+
+        Args:
+            instance (ResponsiveImage): Row holding a responsive image.
+
+        Returns:
+            bool: True when the renditions were generated from the current image.
+        """
+        field_file = getattr(instance, instance.responsive_image_field)
+        return (field_file.name or "") == instance.processed_image
+
+    @classmethod
+    def render(cls, image):
+        """
+        Encodes and stores the renditions of an image.
+
+        Args:
+            image (Image): Normalized image.
+
+        Returns:
+            dict: For each format, the rendition entries by increasing width.
+        """
+        renditions = {extension: [] for extension in settings.CMS_IMAGE_RENDITION_FORMATS}
+        for width in sorted(settings.CMS_IMAGE_RENDITION_WIDTHS):
+            resized = cls.resize(image, width)
+            for extension, options in settings.CMS_IMAGE_RENDITION_FORMATS.items():
+                content = cls.encode(resized, options)
+                renditions[extension].append(
+                    {
+                        "name": cls.storage.save(f"rendition.{extension}", ContentFile(content)),
+                        "width": resized.width,
+                        "height": resized.height,
+                        "bytes": len(content),
+                    }
+                )
+            if resized.width == image.width:
+                break
+        return renditions
+
+    @classmethod
+    def render_placeholder(cls, image):
+        """
+        Encodes a tiny blurred copy of an image as a data URI.
+
+        Args:
+            image (Image): Normalized image.
+
+        Returns:
+            str: The data URI, small enough to be inlined in API responses.
+        """
+        placeholder = cls.resize(image, settings.CMS_IMAGE_PLACEHOLDER_WIDTH)
+        placeholder = placeholder.filter(
+            ImageFilter.GaussianBlur(settings.CMS_IMAGE_PLACEHOLDER_BLUR_RADIUS)
+        )
+        content = cls.encode(placeholder, settings.CMS_IMAGE_PLACEHOLDER_FORMAT)
+        mime_type = Image.MIME[settings.CMS_IMAGE_PLACEHOLDER_FORMAT["format"]]
+        return f"data:{mime_type};base64,{base64.b64encode(content).decode('ascii')}"
+
+    @classmethod
+    def resize(cls, image, width):
+        """
+        Scales an image down to a width, keeping its aspect ratio.
+
+        Args:
+            image (Image): Normalized image.
+            width (int): Target width.
+
+        Returns:
+            Image: The scaled image, or the image itself when it is not wider than the width.
+        """
+        if image.width <= width:
+            return image
+        height = max(1, round(image.height * width / image.width))
+        return image.resize((width, height), Image.Resampling.LANCZOS)
+
+    @classmethod
+    def get_file_names(cls):
+        """
+        Lists the rendition files of every CMS image, for the orphaned media collector.
+
+        Yields:
+            str: Storage name of each rendition file.
+        """
+        for model in cls.models:
+            renditions = (
+                model.objects.exclude(renditions={})
+                .order_by()
+                .values_list("renditions", flat=True)
+                .iterator(chunk_size=cls.batch_size)
+            )
+            for entries in renditions:
+                for files in entries.values():
+                    for entry in files:
+                        yield entry["name"]
@@ -0,0 +1,31 @@
+"""
+Module defining the signal receivers of the cms application.
+
+Blog cover photos, block images and slider images are queued for the generation of their
+renditions whenever they differ from the image the renditions were generated from.
+"""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from app.cms.models import Block
+from app.cms.models import Blog
+from app.cms.models import SliderImage
+from app.cms.services.CmsImageRenditionService import CmsImageRenditionService
+from app.cms.tasks import schedule_image_processing
+
+
+@receiver(post_save, sender=Blog)
+@receiver(post_save, sender=Block)
+@receiver(post_save, sender=SliderImage)
+def process_image_on_change(sender, instance, raw=False, **kwargs):
+    """
+    Schedules the generation of the renditions of a saved CMS row whose image changed.
+
+    Args:
+        sender (Model): Model of the saved row.
+        instance (ResponsiveImage): The saved row.
+        raw (bool): True when the row is loaded from a fixture.
+    """
+    if not raw and not CmsImageRenditionService.is_processed(instance):
+        schedule_image_processing(instance)
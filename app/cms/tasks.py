@@ -0,0 +1,60 @@
+"""
+Module defining the background tasks of the cms application.
+
+The renditions of uploaded blog cover photos, block images and slider images are generated by
+a background worker (python manage.py process_tasks). Images changed during a transaction are
+collected and scheduled as one task per model once the transaction commits.
+
+Functions:
+    schedule_image_processing: Collects the CMS rows whose image changed.
+    process_cms_images: Task generating the renditions of CMS images.
+"""
+
+import threading
+
+from django.apps import apps
+from django.db import transaction
+
+from background_task import background
+
+from app.cms.services.CmsImageRenditionService import CmsImageRenditionService
+
+
+_pending = threading.local()
+
+
+@background(schedule=0)
+def process_cms_images(model_label, ids):
+    """
+    Generates the renditions of the images of CMS rows.
+
+    Args:
+        model_label (str): Label of the model of the rows, such as cms.Blog.
+        ids (list): Ids of the rows.
+    """
+    CmsImageRenditionService.process(apps.get_model(model_label), ids)
+
+
+def schedule_image_processing(instance):
+    """
+    Schedules the generation of the renditions of the image of a CMS row after commit.
+
+    Args:
+        instance (ResponsiveImage): Row whose image changed.
+    """
+    if not hasattr(_pending, "ids"):
+        _pending.ids = {}
+    _pending.ids.setdefault(instance._meta.label, set()).add(instance.pk)
+    transaction.on_commit(_flush_pending)
+
+
+def _flush_pending():
+    """
+    Schedules the tasks of the rows collected in the current thread.
+    """
+    pending = getattr(_pending, "ids", {})
+    for model_label in sorted(pending):
+        ids = sorted(pending[model_label])
+        pending[model_label].clear()
+        if ids:
+            process_cms_images(model_label, ids)
@@ -15,3 +15,24 @@ class CoreConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.core"
+
+    def ready(self):
+        """
+        Registers the reference tables of the 'core' application and the file fields of the
+        content-addressed storage.
+        """
+        from app.core.models.ArchitectSpeciality import ArchitectSpeciality
+        from app.core.models.ArchitecturalStyle import ArchitecturalStyle
+        from app.core.models.ProjectCategory import ProjectCategory
+        from app.core.models.PropertyType import PropertyType
+        from app.core.models.WorkType import WorkType
+        from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+        from app.core.services.StoredFileService import StoredFileService
+
+        ReferenceDataRegistry.register(ArchitectSpeciality)
+        ReferenceDataRegistry.register(ArchitecturalStyle)
+        ReferenceDataRegistry.register(ProjectCategory)
+        ReferenceDataRegistry.register(PropertyType, parents=["project_category"])
+        ReferenceDataRegistry.register(WorkType)
+
+        StoredFileService.register_content_addressed_fields()
@@ -0,0 +1,113 @@
+"""
+Module for the BoundedUploadHandler class.
+
+This module provides a file upload handler enforcing per-request budgets on the multipart
+image uploads streamed by Django, before the files reach the views.
+"""
+
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler
+
+from app.core.validation.exceptions import UploadTooLargeException
+
+
+class BoundedUploadHandler(FileUploadHandler):
+    """
+    Upload handler rejecting requests whose files exceed the upload budgets.
+
+    BoundedUploadMixin places it before the handlers of FILE_UPLOAD_HANDLERS for the actions
+    receiving image uploads. It passes the chunks through unchanged to the handler storing
+    them, TemporaryFileUploadHandler, which streams every file to disk so that the memory used
+    by an upload does not depend on its size. The request is rejected with a
+    413 as soon as it announces or streams more than UPLOAD_MAX_REQUEST_SIZE bytes, a file
+    exceeds UPLOAD_MAX_FILE_SIZE bytes or more than UPLOAD_MAX_FILES files are sent.
+    """
+
+    def __init__(self, request=None):
+        """
+        Initializes the counters of the request.
+
+        Args:
+            request (HttpRequest): Request whose uploads are handled.
+        """
+        super().__init__(request)
+        self.request_size = 0
+        self.file_size = 0
+        self.file_count = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        """
+        Rejects the request when its announced length exceeds the request budget.
+
+        Args:
+            input_data (file): Raw request body.
+            META (dict): Request metadata.
+            content_length (int): Announced length of the body.
+            boundary (bytes): Multipart boundary.
+            encoding (str): Request encoding.
+
+        Raises:
+            UploadTooLargeException: If the body is larger than UPLOAD_MAX_REQUEST_SIZE.
+        """
+        if content_length > settings.UPLOAD_MAX_REQUEST_SIZE:
+            self.reject_request_size()
+
+    def new_file(self, *args, **kwargs):
+        """
+        Counts a new file of the request.
+
+        Raises:
+            UploadTooLargeException: If the request holds more than UPLOAD_MAX_FILES files.
+        """
+        super().new_file(*args, **kwargs)
+        self.file_count += 1
+        self.file_size = 0
+        if self.file_count > settings.UPLOAD_MAX_FILES:
+            raise UploadTooLargeException(
+                f"At most {settings.UPLOAD_MAX_FILES} files can be uploaded at once."
+            )
+
+    def receive_data_chunk(self, raw_data, start):
+        """
+        Counts a chunk of the current file and passes it to the next handler.
+
+        Args:
+            raw_data (bytes): Chunk of the file.
+            start (int): Position of the chunk in the file.
+
+        Raises:
+            UploadTooLargeException: If the file or the request exceeds its budget.
+
+        Returns:
+            bytes: The chunk, unchanged.
+        """
+        self.file_size += len(raw_data)
+        self.request_size += len(raw_data)
+        if self.file_size > settings.UPLOAD_MAX_FILE_SIZE:
+            raise UploadTooLargeException(
+                f'The file "{self.file_name}" exceeds '
+                f"{settings.UPLOAD_MAX_FILE_SIZE // 2**20} MB."
+            )
+        if self.request_size > settings.UPLOAD_MAX_REQUEST_SIZE:
+            self.reject_request_size()
+        return raw_data
+
+    def file_complete(self, file_size):
+        """
+        Leaves the creation of the uploaded file to the next handler.
+
+        Args:
+            file_size (int): Size of the file.
+        """
+        return None
+
+    def reject_request_size(self):
+        """
+        Rejects the request for exceeding the request budget.
+
+        Raises:
+            UploadTooLargeException: Always.
+        """
+        raise UploadTooLargeException(
+            f"The uploaded files exceed {settings.UPLOAD_MAX_REQUEST_SIZE // 2**20} MB."
+        )
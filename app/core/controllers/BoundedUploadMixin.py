@@ -0,0 +1,38 @@
+"""
+Module for the BoundedUploadMixin.
+
+This module provides a ViewSet mixin installing the BoundedUploadHandler on the requests of
+the actions receiving image uploads, so that the image budgets do not apply to the other
+multipart endpoints, such as presentation video uploads.
+"""
+
+from app.core.controllers.BoundedUploadHandler import BoundedUploadHandler
+
+
+class BoundedUploadMixin:
+    """
+    ViewSet mixin bounding the multipart uploads of some actions.
+
+    Attributes:
+        bounded_upload_actions (tuple): Actions whose uploads are bounded.
+    """
+
+    bounded_upload_actions = ()
+
+    def initialize_request(self, request, *args, **kwargs):
+        """
+        Places the BoundedUploadHandler before the configured upload handlers.
+
+        The handlers are set before the body is parsed, the action being known once the
+        request is initialized.
+
+        Args:
+            request (HttpRequest): Incoming request.
+
+        Returns:
+            Request: The DRF request.
+        """
+        drf_request = super().initialize_request(request, *args, **kwargs)
+        if self.action in self.bounded_upload_actions:
+            request.upload_handlers = [BoundedUploadHandler(request), *request.upload_handlers]
+        return drf_request
@@ -0,0 +1,301 @@
+"""
+Module for the KeysetCursorPagination class.
+
+This module provides the default pagination of list endpoints: a keyset (seek) pagination
+ordered on created_at with the primary key as tie-breaker, so that the cost of fetching a page
+does not depend on how deep into the result set it is.
+"""
+
+import datetime
+import decimal
+
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination over (ordering_field, tiebreak_field) in descending order.
+
+    Cursors are signed, opaque tokens holding the position of the first or last row of the
+    current page, so each page is fetched with an index range scan instead of an OFFSET.
+
+    Attributes:
+        ordering_field (str): Field the pages are ordered on, newest first. Views may override
+        it with a `keyset_ordering_field` attribute; models without this field are ordered on
+        their primary key only.
+        tiebreak_field (str): Unique field breaking ties between equal ordering values.
+        page_size (int): Default number of rows per page.
+        max_page_size (int): Hard cap on the page size a client can request.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering_field = "created_at"
+    tiebreak_field = "id"
+    page_size = settings.PAGINATION_PAGE_SIZE
+    max_page_size = settings.PAGINATION_MAX_PAGE_SIZE
+    invalid_cursor_message = _("Invalid cursor")
+    cursor_salt = "keyset-cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns the rows of the page designated by the request cursor.
+
+        Args:
+            queryset (QuerySet): Queryset to paginate.
+            request (Request): Current request.
+            view (APIView): View being paginated.
+
+        Returns:
+            list: Rows of the current page.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.current_page_size = self.get_page_size(request)
+        self.fields = self.get_ordering_fields(queryset, view)
+        position, reverse = self.decode_cursor(request)
+
+        ordering = [f"-{field}" if not reverse else field for field in self.fields]
+        queryset = self.load_ordering_fields(queryset).order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position, reverse))
+
+        results = list(queryset[: self.current_page_size + 1])
+        has_following = len(results) > self.current_page_size
+        results = results[: self.current_page_size]
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_following if not reverse else True
+        self.has_previous = position is not None if not reverse else has_following
+        if not results:
+            self.has_next = self.has_previous = False
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        """
+        Wraps a page of serialized rows with its navigation links.
+
+        Args:
+            data (list): Serialized rows of the current page.
+
+        Returns:
+            Response: The paginated response.
+        """
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        """
+        Describes the paginated response for schema generators.
+
+        Args:
+            schema (dict): Schema of the results list.
+
+        Returns:
+            dict: Schema of the paginated response.
+        """
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """
+        Returns the page size requested by the client, capped to max_page_size.
+
+        Args:
+            request (Request): Current request.
+
+        Returns:
+            int: Number of rows per page.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_ordering_fields(self, queryset, view):
+        """
+        Returns the fields the queryset is ordered on.
+
+        Args:
+            queryset (QuerySet): Queryset to paginate.
+            view (APIView): View being paginated.
+
+        Returns:
+            list: Ordering field names, the tie-breaker last.
+        """
+        ordering_field = getattr(view, "keyset_ordering_field", self.ordering_field)
+        model_fields = {field.name for field in queryset.model._meta.get_fields()}
+        if ordering_field in model_fields or ordering_field in queryset.query.annotations:
+            return [ordering_field, self.tiebreak_field]
+        return [self.tiebreak_field]
+
+    def load_ordering_fields(self, queryset):
+        """
+        Adds the ordering fields to the columns of a queryset restricted with only().
+
+        The cursors are built from the ordering values of the first and last rows, which would
+        otherwise be fetched with one query each.
+
+        Args:
+            queryset (QuerySet): Queryset to paginate.
+
+        Returns:
+            QuerySet: The queryset, loading the ordering fields.
+        """
+        loaded, deferred = queryset.query.deferred_loading
+        if deferred or not loaded:
+            return queryset
+        missing = [
+            field
+            for field in self.fields
+            if field not in loaded and field not in queryset.query.annotations
+        ]
+        if not missing:
+            return queryset
+        return queryset.only(*loaded, *missing)
+
+    def get_seek_filter(self, position, reverse):
+        """
+        Builds the filter selecting the rows after a position in the current ordering.
+
+        Args:
+            position (list): Values of the ordering fields at the cursor.
+            reverse (bool): True when paging backwards.
+
+        Returns:
+            Q: The seek condition.
+        """
+        lookup = "gt" if reverse else "lt"
+        condition = Q()
+        for index, field in enumerate(self.fields):
+            equal = {name: value for name, value in zip(self.fields[:index], position)}
+            condition |= Q(**equal, **{f"{field}__{lookup}": position[index]})
+        return condition
+
+    def get_next_link(self):
+        """
+        Returns the URL of the next page.
+
+        Returns:
+            str or None: URL of the next page, or None on the last page.
+        """
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        """
+        Returns the URL of the previous page.
+
+        Returns:
+            str or None: URL of the previous page, or None on the first page.
+        """
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        """
+        Builds the URL of the page starting after an instance.
+
+        Args:
+            instance (Model): First or last row of the current page.
+            reverse (bool): True for a link to the previous page.
+
+        Returns:
+            str: Absolute URL carrying the signed cursor.
+        """
+        position = [self._dump_value(getattr(instance, field)) for field in self.fields]
+        token = signing.dumps(
+            {"p": position, "r": reverse},
+            salt=self.cursor_salt,
+            compress=True,
+        )
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        """
+        Reads the position and direction carried by the request cursor.
+
+        Args:
+            request (Request): Current request.
+
+        Raises:
+            NotFound: If the cursor is malformed or was not issued by this paginator.
+
+        Returns:
+            tuple: (position list or None, reverse flag).
+        """
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            cursor = signing.loads(token, salt=self.cursor_salt)
+            position = [self._load_value(value) for value in cursor["p"]]
+            reverse = bool(cursor["r"])
+        except (signing.BadSignature, KeyError, TypeError, ValueError, decimal.InvalidOperation):
+            raise NotFound(self.invalid_cursor_message)
+        if len(position) != len(self.fields):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    @staticmethod
+    def _dump_value(value):
+        """
+        Converts an ordering value to a JSON-compatible cursor entry.
+
+        Args:
+            value: Value of an ordering field.
+
+        Returns:
+            list: (kind, value) pair.
+        """
+        if isinstance(value, datetime.datetime):
+            return ["dt", value.isoformat()]
+        if isinstance(value, decimal.Decimal):
+            return ["dec", str(value)]
+        return ["v", value]
+
+    @staticmethod
+    def _load_value(entry):
+        """
+        Converts a cursor entry back to an ordering value.
+
+        Args:
+            entry (list): (kind, value) pair produced by _dump_value.
+
+        Returns:
+            The ordering value.
+        """
+        kind, value = entry
+        if kind == "dt":
+            return datetime.datetime.fromisoformat(value)
+        if kind == "dec":
+            return decimal.Decimal(value)
+        return value
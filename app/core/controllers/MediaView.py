@@ -0,0 +1,282 @@
+"""
+Module for the MediaView class.
+
+This module serves the files of MEDIA_ROOT. The view checks the requested path and the
+conditional headers, then hands the transfer to the front proxy with X-Accel-Redirect (nginx)
+or X-Sendfile (Apache) when MEDIA_SENDFILE_BACKEND is set. Otherwise it streams the file itself,
+honouring single byte ranges so that videos can be seeked without reading the whole file.
+"""
+
+import mimetypes
+import os
+import re
+
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse
+from django.http import Http404
+from django.http import HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.http import parse_http_date_safe
+from django.views import View
+
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
+
+
+class FileRange:
+    """
+    File-like object reading a byte range of a file.
+
+    Attributes:
+        file (file): Open binary file.
+        remaining (int): Number of bytes left to read.
+    """
+
+    def __init__(self, file, start, length):
+        """
+        Positions the file at the start of the range.
+
+        Args:
+            file (file): Open binary file.
+            start (int): Offset of the first byte.
+            length (int): Number of bytes of the range.
+        """
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        """
+        Reads bytes without going past the end of the range.
+
+        Args:
+            size (int): Maximum number of bytes, the rest of the range when negative.
+
+        Returns:
+            bytes: The bytes read.
+        """
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        """
+        Closes the underlying file.
+        """
+        self.file.close()
+
+
+class MediaView(View):
+    """
+    View serving uploaded media files.
+
+    Media files are public, as they are referenced by URL from img and video elements, which
+    send no credentials. Hidden paths, such as the quarantine directory of the orphaned media
+    collector, and partially written files are not served.
+
+    Attributes:
+        http_method_names (list): Allowed HTTP methods.
+        range_pattern (Pattern): Pattern of a single byte range.
+        storage (ContentAddressedStorage): Storage recognizing content-addressed names.
+    """
+
+    http_method_names = ["get", "head"]
+    range_pattern = re.compile(r"^bytes=(\d*)-(\d*)$")
+    storage = ContentAddressedStorage()
+
+    def get(self, request, path):
+        """
+        Serves a media file.
+
+        Args:
+            request (HttpRequest): HTTP request object.
+            path (str): Path of the file relative to MEDIA_ROOT.
+
+        Raises:
+            Http404: If the path is not allowed or the file does not exist.
+
+        Returns:
+            HttpResponse: The file, a partial content, a 304 or a 416 response.
+        """
+        if not self.has_permission(request, path):
+            raise Http404("File not found.")
+        try:
+            full_path = safe_join(settings.MEDIA_ROOT, path)
+            stat = os.stat(full_path)
+        except (SuspiciousFileOperation, OSError):
+            raise Http404("File not found.")
+        if not os.path.isfile(full_path):
+            raise Http404("File not found.")
+
+        etag = self.get_etag(path, stat)
+        last_modified = int(stat.st_mtime)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            if settings.MEDIA_SENDFILE_BACKEND:
+                response = self.sendfile(path, full_path)
+            else:
+                response = self.stream(request, full_path, stat.st_size, etag, last_modified)
+        if response.status_code in (200, 206, 304):
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            response["Cache-Control"] = self.get_cache_control(path)
+        return response
+
+    def has_permission(self, request, path):
+        """
+        Checks whether a media path may be served.
+
+        Args:
+            request (HttpRequest): HTTP request object.
+            path (str): Path of the file relative to MEDIA_ROOT.
+
+        Returns:
+            bool: False for hidden paths and partially written files.
+        """
+        parts = path.split("/")
+        return not path.endswith(".part") and not any(part.startswith(".") for part in parts)
+
+    def sendfile(self, path, full_path):
+        """
+        Builds an empty response delegating the transfer to the front proxy.
+
+        The proxy handles the Range header itself.
+
+        Args:
+            path (str): Path of the file relative to MEDIA_ROOT.
+            full_path (str): Absolute path of the file.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        response = HttpResponse(content_type=self.get_content_type(full_path))
+        if settings.MEDIA_SENDFILE_BACKEND == "x-accel-redirect":
+            response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_REDIRECT_LOCATION + quote(path)
+        else:
+            response["X-Sendfile"] = full_path
+        return response
+
+    def stream(self, request, full_path, size, etag, last_modified):
+        """
+        Streams a file, or the byte range requested by the Range header.
+
+        Args:
+            request (HttpRequest): HTTP request object.
+            full_path (str): Absolute path of the file.
+            size (int): Size of the file in bytes.
+            etag (str): ETag of the file.
+            last_modified (int): Modification timestamp of the file.
+
+        Returns:
+            HttpResponse: The file, its requested range or a 416 response.
+        """
+        content_type = self.get_content_type(full_path)
+        byte_range = self.get_range(request, size, etag, last_modified)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+        file = open(full_path, "rb")
+        if byte_range is None:
+            response = FileResponse(file, content_type=content_type)
+        else:
+            start, end = byte_range
+            response = FileResponse(
+                FileRange(file, start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Length"] = end - start + 1
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Accept-Ranges"] = "bytes"
+        return response
+
+    def get_range(self, request, size, etag, last_modified):
+        """
+        Reads the byte range requested by a request.
+
+        Multiple ranges, malformed ranges and ranges conditioned by a stale If-Range are
+        ignored, the whole file being served instead.
+
+        Args:
+            request (HttpRequest): HTTP request object.
+            size (int): Size of the file in bytes.
+            etag (str): ETag of the file.
+            last_modified (int): Modification timestamp of the file.
+
+        Returns:
+            tuple or None or bool: Inclusive (start, end) offsets, None to serve the whole
+            file, or False when the range cannot be satisfied.
+        """
+        match = self.range_pattern.match(request.headers.get("Range", "").strip())
+        if match is None or match.group(1) == match.group(2) == "":
+            return None
+        if_range = request.headers.get("If-Range", "").strip()
+        if if_range and if_range != etag and parse_http_date_safe(if_range) != last_modified:
+            return None
+
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if start > end:
+                return None if last and int(last) < start else False
+        else:
+            if not int(last) or not size:
+                return False
+            start, end = max(size - int(last), 0), size - 1
+        return start, end
+
+    def get_etag(self, path, stat):
+        """
+        Builds the ETag of a file.
+
+        Content-addressed files are tagged with their digest, the others with their
+        modification time and size.
+
+        Args:
+            path (str): Path of the file relative to MEDIA_ROOT.
+            stat (stat_result): Status of the file.
+
+        Returns:
+            str: The quoted strong ETag.
+        """
+        if self.storage.is_content_addressed(path):
+            return f'"{os.path.splitext(os.path.basename(path))[0]}"'
+        return f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+
+    def get_cache_control(self, path):
+        """
+        Builds the Cache-Control header of a file.
+
+        Content-addressed files never change, so they are cached for a year.
+
+        Args:
+            path (str): Path of the file relative to MEDIA_ROOT.
+
+        Returns:
+            str: The header value.
+        """
+        if self.storage.is_content_addressed(path):
+            return f"public, max-age={settings.MEDIA_IMMUTABLE_MAX_AGE}, immutable"
+        return f"public, max-age={settings.MEDIA_MAX_AGE}"
+
+    def get_content_type(self, full_path):
+        """
+        Guesses the content type of a file from its extension.
+
+        Args:
+            full_path (str): Path of the file.
+
+        Returns:
+            str: The content type, application/octet-stream when unknown.
+        """
+        content_type, _ = mimetypes.guess_type(full_path)
+        return content_type or "application/octet-stream"
@@ -0,0 +1,78 @@
+"""
+Module for the OptimizedQuerySetMixin.
+
+This module provides a ViewSet mixin that applies the query plan derived from the
+serializer of the current action, and the field selection requested by the client, to the
+ViewSet queryset.
+"""
+
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
+from app.core.services.QueryPlanner import QueryPlanner
+
+
+class OptimizedQuerySetMixin:
+    """
+    ViewSet mixin applying QueryPlanner plans to read actions.
+
+    Attributes:
+        optimized_actions (tuple): Actions whose queryset is optimized.
+        plan_serializer_class (type): Serializer the plan is derived from, for ViewSets whose
+        serializer delegates its representation to another serializer. Defaults to the
+        serializer class of the current action.
+    """
+
+    optimized_actions = ("list", "retrieve")
+    plan_serializer_class = None
+
+    def get_plan_serializer_class(self):
+        """
+        Returns the serializer class used to derive the query plan.
+
+        Returns:
+            type: Serializer class rendering the queryset rows.
+        """
+        return self.plan_serializer_class or self.get_serializer_class()
+
+    def get_fieldset(self):
+        """
+        Returns the field selection requested for the rows of the current action.
+
+        Only read actions honor the selection, write actions render every field.
+
+        Returns:
+            dict: Fields, exclusions and expansions, empty when the action or its serializer
+            does not support sparse fieldsets.
+        """
+        if getattr(self, "action", None) not in self.optimized_actions:
+            return {}
+        serializer_class = self.get_plan_serializer_class()
+        if not issubclass(serializer_class, SparseFieldsetsMixin):
+            return {}
+        return serializer_class.get_fieldset(self.request)
+
+    def get_serializer_context(self):
+        """
+        Returns the serializer context, with the requested field selection.
+
+        Returns:
+            dict: The serializer context.
+        """
+        context = super().get_serializer_context()
+        context.update(self.get_fieldset())
+        return context
+
+    def get_queryset(self):
+        """
+        Returns the ViewSet queryset, optimized for the serializer of read actions.
+
+        Returns:
+            QuerySet: The queryset of the current action.
+        """
+        queryset = super().get_queryset()
+        if getattr(self, "action", None) in self.optimized_actions:
+            queryset = QueryPlanner.optimize(
+                queryset,
+                self.get_plan_serializer_class(),
+                **self.get_fieldset(),
+            )
+        return queryset
@@ -0,0 +1,132 @@
+"""
+Module providing conditional GET support for ViewSet actions.
+
+The conditional_response decorator computes the validators (ETag and Last-Modified) of a read
+action from cheap sources such as table versions or updated_at columns, and answers with a 304
+before the action renders its body when the client copy is current.
+
+The helpers of this module build validator functions for the common sources: tables of the
+ReferenceDataRegistry, TableVersion labels and constant data.
+"""
+
+import functools
+import hashlib
+import json
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from app.core.models.TableVersion import TableVersion
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+
+
+def make_etag(*parts):
+    """
+    Builds a weak ETag from the values identifying a version of a resource.
+
+    Args:
+        *parts: Values identifying the resource version.
+
+    Returns:
+        str: The quoted weak ETag.
+    """
+    digest = hashlib.md5(
+        json.dumps(parts, default=str).encode("utf-8"),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def conditional_response(validators):
+    """
+    Decorates a ViewSet action to support If-None-Match and If-Modified-Since.
+
+    The computed validators are stored in the response_validators attribute of the view, so
+    that the action can key caches on them.
+
+    Args:
+        validators (callable): Called with the view, the request and the action arguments, it
+        returns an (etag, last_modified) pair, either of which may be None.
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return method(view, request, *args, **kwargs)
+
+            etag, last_modified = validators(view, request, *args, **kwargs)
+            view.response_validators = (etag, last_modified)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                if etag and not response.has_header("ETag"):
+                    response["ETag"] = etag
+                if timestamp and not response.has_header("Last-Modified"):
+                    response["Last-Modified"] = http_date(timestamp)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def reference_data_validators(*models):
+    """
+    Builds validators changing with the versions of ReferenceDataRegistry tables.
+
+    Args:
+        *models (Model): Registered models the response is built from.
+
+    Returns:
+        callable: Validators function for conditional_response.
+    """
+
+    def validators(view, request, *args, **kwargs):
+        versions = [
+            (model._meta.label_lower, ReferenceDataRegistry.version(model)) for model in models
+        ]
+        return make_etag(versions), None
+
+    return validators
+
+
+def table_version_validators(label):
+    """
+    Builds validators changing with a TableVersion label.
+
+    Args:
+        label (str): Label of the TableVersion the response depends on.
+
+    Returns:
+        callable: Validators function for conditional_response.
+    """
+
+    def validators(view, request, *args, **kwargs):
+        version = TableVersion.current([label])[label]
+        return make_etag(label, version), None
+
+    return validators
+
+
+def constant_validators(data):
+    """
+    Builds validators for a response built from constant data.
+
+    Args:
+        data: JSON-serializable data the response is built from.
+
+    Returns:
+        callable: Validators function for conditional_response.
+    """
+    etag = make_etag(data)
+
+    def validators(view, request, *args, **kwargs):
+        return etag, None
+
+    return validators
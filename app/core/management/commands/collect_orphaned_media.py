@@ -0,0 +1,77 @@
+"""
+Management command removing the media files referenced by no row.
+
+Usage:
+    python manage.py collect_orphaned_media [--quarantine] [--dry-run] [--restart] [--background]
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.core.services.MediaGarbageCollector import MediaGarbageCollector
+from app.core.tasks import collect_orphaned_media
+
+
+class Command(BaseCommand):
+    """
+    Deletes or quarantines the files of MEDIA_ROOT left behind by deleted or replaced rows,
+    resuming from the checkpoint of an interrupted run.
+    """
+
+    help = "Removes the media files referenced by no file field, after a grace period."
+
+    def add_arguments(self, parser):
+        """
+        Declares the options of the command.
+
+        Args:
+            parser (ArgumentParser): Parser of the command line.
+        """
+        parser.add_argument(
+            "--quarantine",
+            action="store_true",
+            help="Move the orphaned files to the quarantine directory instead of deleting them.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the orphaned files.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the checkpoint of an interrupted run.",
+        )
+        parser.add_argument(
+            "--background",
+            action="store_true",
+            help="Queue the collection for the background worker instead of running it.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MediaGarbageCollector.batch_size,
+            help="Number of files checked per batch.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Runs or queues the collection and reports its results.
+        """
+        if options["background"]:
+            collect_orphaned_media(quarantine=options["quarantine"])
+            self.stdout.write(self.style.SUCCESS("Queued the orphaned media collection."))
+            return
+
+        MediaGarbageCollector.batch_size = options["batch_size"]
+        stats = MediaGarbageCollector.collect(
+            quarantine=options["quarantine"],
+            dry_run=options["dry_run"],
+            restart=options["restart"],
+        )
+        action = "Found" if options["dry_run"] else "Removed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {stats['removed']} orphaned files ({stats['bytes']} bytes) "
+                f"out of {stats['scanned']} scanned."
+            )
+        )
@@ -0,0 +1,41 @@
+"""
+Management command recomputing the reference counts of content-addressed files.
+
+Usage:
+    python manage.py recount_stored_files
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.core.services.StoredFileService import StoredFileService
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the StoredFile reference counts from the file fields, correcting the drift left
+    by queryset updates or raw SQL, which bypass the signals maintaining them.
+    """
+
+    help = "Recomputes the reference counts of the content-addressed media files."
+
+    def add_arguments(self, parser):
+        """
+        Declares the options of the command.
+
+        Args:
+            parser (ArgumentParser): Parser of the command line.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=StoredFileService.batch_size,
+            help="Number of StoredFile rows written per query.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Recounts the references and reports the number of corrected files.
+        """
+        StoredFileService.batch_size = options["batch_size"]
+        count = StoredFileService.recount()
+        self.stdout.write(self.style.SUCCESS(f"Corrected {count} stored files."))
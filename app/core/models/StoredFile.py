@@ -0,0 +1,47 @@
+"""
+Module defining the StoredFile model.
+
+This module contains the StoredFile class, which counts the rows referencing each file of the
+content-addressed storage.
+"""
+
+from django.db import models
+
+
+class StoredFile(models.Model):
+    """
+    Model representing a file of the content-addressed storage.
+
+    Attributes:
+        name (CharField): Storage name of the file.
+        size (PositiveBigIntegerField): Size of the file in bytes.
+        reference_count (PositiveIntegerField): Number of file fields referencing the file.
+        created_at (DateTimeField): When the file was first referenced.
+        released_at (DateTimeField): When the last reference was dropped, None while the file
+        is referenced.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    reference_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    released_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        """
+        Return a string representation of the stored file.
+
+        Returns:
+            str: Name and reference count of the file.
+        """
+        return f"{self.name} ({self.reference_count} references)"
+
+    class Meta:
+        """
+        Meta class for Stored File model.
+
+        Provides verbose names for the model in the Django admin interface.
+        """
+
+        verbose_name = "Stored File"
+        verbose_name_plural = "Stored Files"
@@ -0,0 +1,71 @@
+"""
+Module defining the TableVersion model.
+
+This module contains the TableVersion class, which stores a version counter per label so that
+processes caching data in memory can detect changes made by other processes.
+"""
+
+from django.db import models
+from django.db.models import F
+
+
+class TableVersion(models.Model):
+    """
+    Model representing the version stamp of a cached table or document.
+
+    Attributes:
+        label (CharField): Unique label of the versioned data, usually a model label.
+        version (PositiveBigIntegerField): Counter incremented on every change of the data.
+    """
+
+    label = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        """
+        Return a string representation of the table version.
+
+        Returns:
+            str: Label and version of the versioned data.
+        """
+        return f"{self.label} (v{self.version})"
+
+    @classmethod
+    def bump(cls, label):
+        """
+        Increments the version of a label, creating it when it does not exist yet.
+
+        Args:
+            label (str): Label of the versioned data.
+        """
+        if not cls.objects.filter(label=label).update(version=F("version") + 1):
+            _, created = cls.objects.get_or_create(label=label, defaults={"version": 1})
+            if not created:
+                cls.objects.filter(label=label).update(version=F("version") + 1)
+
+    @classmethod
+    def current(cls, labels):
+        """
+        Returns the current versions of several labels with a single query.
+
+        Args:
+            labels (iterable): Labels of the versioned data.
+
+        Returns:
+            dict: Versions keyed by label, 0 for labels that were never bumped.
+        """
+        versions = dict.fromkeys(labels, 0)
+        versions.update(
+            cls.objects.filter(label__in=list(versions)).values_list("label", "version")
+        )
+        return versions
+
+    class Meta:
+        """
+        Meta class for Table Version model.
+
+        Provides verbose names for the model in the Django admin interface.
+        """
+
+        verbose_name = "Table Version"
+        verbose_name_plural = "Table Versions"
@@ -4,4 +4,6 @@ from app.core.models.BaseModel import BaseModel
 from app.core.models.LabeledIcon import LabeledIcon
 from app.core.models.ProjectCategory import ProjectCategory
 from app.core.models.PropertyType import PropertyType
+from app.core.models.StoredFile import StoredFile
+from app.core.models.TableVersion import TableVersion
 from app.core.models.WorkType import WorkType
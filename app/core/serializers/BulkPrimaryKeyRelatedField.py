@@ -0,0 +1,138 @@
+"""
+Module for the BulkPrimaryKeyRelatedField class.
+
+This module provides a PrimaryKeyRelatedField whose many=True variant resolves every submitted
+primary key of a field with a single `IN` query instead of one query per key. Fields over a
+table of the ReferenceDataRegistry are resolved from memory without any query.
+"""
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+
+
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    """
+    ManyRelatedField resolving all of its primary keys at once.
+
+    Unknown primary keys are reported together in a single validation error.
+    """
+
+    default_error_messages = {
+        "does_not_exist": _('Invalid pks "{pk_values}" - objects do not exist.'),
+    }
+
+    def to_internal_value(self, data):
+        """
+        Converts a list of primary keys to model instances.
+
+        Args:
+            data (list): Submitted primary keys.
+
+        Raises:
+            ValidationError: If the input is not a list, is empty while not allowed, contains
+            a value of the wrong type or references objects that do not exist.
+
+        Returns:
+            list: Model instances, in the order their keys were submitted.
+        """
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        pks = [self.child_relation.to_pk(item) for item in data]
+        objects = self.child_relation.get_objects(pks)
+        missing = [str(pk) for pk in dict.fromkeys(pks) if pk not in objects]
+        if missing:
+            self.fail("does_not_exist", pk_values=", ".join(missing))
+        return [objects[pk] for pk in dict.fromkeys(pks)]
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField whose many=True variant validates in a single query.
+
+    Querysets covering a whole table of the ReferenceDataRegistry are resolved from memory.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        """
+        Builds the BulkManyRelatedField wrapping this field for many=True.
+
+        Returns:
+            BulkManyRelatedField: The list field.
+        """
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+    def to_internal_value(self, data):
+        """
+        Converts a primary key to a model instance.
+
+        Args:
+            data: Submitted primary key.
+
+        Raises:
+            ValidationError: If the value is not a primary key or the object does not exist.
+
+        Returns:
+            Model: The referenced instance.
+        """
+        queryset = self.get_queryset()
+        if not ReferenceDataRegistry.covers(queryset):
+            return super().to_internal_value(data)
+        pk = self.to_pk(data)
+        instance = ReferenceDataRegistry.get(queryset.model, pk)
+        if instance is None:
+            self.fail("does_not_exist", pk_value=pk)
+        return instance
+
+    def to_pk(self, item):
+        """
+        Converts one submitted value to a primary key of the related model.
+
+        Args:
+            item: Submitted value.
+
+        Raises:
+            ValidationError: If the value cannot be a primary key.
+
+        Returns:
+            The primary key value.
+        """
+        pk_field = self.pk_field
+        if pk_field is not None:
+            item = pk_field.to_internal_value(item)
+        if isinstance(item, bool) or not isinstance(item, (str, int)):
+            self.fail("incorrect_type", data_type=type(item).__name__)
+        queryset = self.get_queryset()
+        try:
+            return queryset.model._meta.pk.to_python(item)
+        except DjangoValidationError:
+            self.fail("incorrect_type", data_type=type(item).__name__)
+
+    def get_objects(self, pks):
+        """
+        Fetches the objects matching a list of primary keys.
+
+        Args:
+            pks (list): Primary keys to resolve.
+
+        Returns:
+            dict: Objects keyed by primary key.
+        """
+        if not pks:
+            return {}
+        queryset = self.get_queryset()
+        if ReferenceDataRegistry.covers(queryset):
+            return ReferenceDataRegistry.in_bulk(queryset.model, pks)
+        return queryset.in_bulk(pks)
@@ -0,0 +1,52 @@
+"""
+Module for the ReferenceLabelField class.
+
+This module provides a read-only relation field rendering a reference row as its id and label,
+read from the ReferenceDataRegistry instead of a join.
+"""
+
+from rest_framework import serializers
+
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+
+
+class ReferenceLabelField(serializers.PrimaryKeyRelatedField):
+    """
+    Read-only field rendering a foreign key to a registered reference table.
+
+    Only the foreign key column is read from the database; the label comes from the
+    in-process copy of the table.
+
+    Attributes:
+        model (Model): Registered model of the reference table.
+        label_field (str): Attribute of the rows rendered as label.
+    """
+
+    def __init__(self, model, label_field="label", **kwargs):
+        """
+        Initializes the field.
+
+        Args:
+            model (Model): Registered model of the reference table.
+            label_field (str): Attribute of the rows rendered as label.
+        """
+        self.model = model
+        self.label_field = label_field
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """
+        Renders a reference row.
+
+        Args:
+            value: The related instance, or an object holding its primary key.
+
+        Returns:
+            dict: The id and label of the row.
+        """
+        row = ReferenceDataRegistry.get(self.model, value.pk)
+        return {
+            "id": value.pk,
+            "label": getattr(row, self.label_field) if row is not None else None,
+        }
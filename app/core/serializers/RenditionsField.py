@@ -0,0 +1,49 @@
+"""
+Module for the RenditionsField class.
+
+This module provides a read-only field rendering the renditions recorded for an image as the
+URLs of their files.
+"""
+
+from django.core.files.storage import default_storage
+
+from rest_framework import serializers
+
+
+class RenditionsField(serializers.Field):
+    """
+    Read-only field rendering rendition entries.
+
+    Entries are stored keyed by size name, each holding the width and height of the rendition
+    and its storage names keyed by format. They are rendered with the URLs of the files in
+    place of their names.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the field as read-only.
+        """
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """
+        Renders rendition entries.
+
+        Args:
+            value (dict): Rendition entries keyed by size name.
+
+        Returns:
+            dict: For each size name, the width, height and file URL of every format. URLs are
+            absolute when the request is known.
+        """
+        request = self.context.get("request")
+        representation = {}
+        for size_name, entry in (value or {}).items():
+            representation[size_name] = {"width": entry["width"], "height": entry["height"]}
+            for extension, file_name in entry["files"].items():
+                url = default_storage.url(file_name)
+                representation[size_name][extension] = (
+                    request.build_absolute_uri(url) if request is not None else url
+                )
+        return representation
@@ -0,0 +1,258 @@
+"""
+Module for the SparseFieldsetsMixin class.
+
+This module provides a serializer mixin rendering the subset of fields requested by the client
+with the fields, exclude and expand query parameters. The same selection is applied to the
+query plan of the serializer, so that pruned fields are neither fetched nor rendered.
+"""
+
+from django.utils.functional import cached_property
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsetsMixin:
+    """
+    Serializer mixin pruning its field tree to the fields requested by the client.
+
+    fields keeps only the listed fields and exclude drops them. Both accept dotted paths
+    reaching into nested serializers, such as fields=id,client.user.email. They are applied
+    by the root serializer of a tree to every nested serializer.
+
+    expand adds opt-in fields declared in Meta.expandable_fields, mapping field names to
+    (field class, keyword arguments) pairs. The expanded names are shared by every serializer
+    of a tree.
+
+    The selection is read from the "fields", "exclude" and "expand" entries of the serializer
+    context, as returned by get_fieldset.
+
+    Attributes:
+        fields_param (str): Query parameter listing the fields to keep.
+        exclude_param (str): Query parameter listing the fields to drop.
+        expand_param (str): Query parameter listing the fields to expand.
+    """
+
+    fields_param = "fields"
+    exclude_param = "exclude"
+    expand_param = "expand"
+
+    @cached_property
+    def fields(self):
+        """
+        Returns the bound fields of the serializer, pruned when it is the root of its tree.
+
+        Raises:
+            ValidationError: If a requested path does not match a field.
+
+        Returns:
+            BindingDict: Field instances keyed by name.
+        """
+        fields = super().fields
+        if self.is_fieldset_root():
+            errors = self.prune_fields(
+                fields,
+                dict(self.context.get("fields", ())),
+                dict(self.context.get("exclude", ())),
+            )
+            if errors:
+                raise ValidationError(errors)
+        return fields
+
+    def get_fields(self):
+        """
+        Returns the declared fields and the requested expandable fields.
+
+        Returns:
+            dict: Field instances keyed by name.
+        """
+        fields = super().get_fields()
+        expandable_fields = getattr(self.Meta, "expandable_fields", {})
+        for name in self.context.get("expand", ()):
+            if name in expandable_fields and name not in fields:
+                field_class, kwargs = expandable_fields[name]
+                fields[name] = field_class(**kwargs)
+        return fields
+
+    def is_fieldset_root(self):
+        """
+        Checks whether the serializer applies the requested fields and exclusions.
+
+        Returns:
+            bool: True for a top-level serializer or the child of a top-level list.
+        """
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    @classmethod
+    def prune_fields(cls, fields, include, exclude, prefix=""):
+        """
+        Removes the fields not requested from a field tree.
+
+        Args:
+            fields (BindingDict): Bound fields of a serializer.
+            include (dict): Names to keep, mapped to the subtree to keep, or None for the whole
+            field. Every field is kept when empty.
+            exclude (dict): Names to drop, mapped to the subtree to drop, or None for the whole
+            field.
+            prefix (str): Dotted path of the serializer, for error messages.
+
+        Returns:
+            dict: Errors keyed by query parameter, empty when every path is valid.
+        """
+        errors = {}
+        for param, tree in ((cls.fields_param, include), (cls.exclude_param, exclude)):
+            for name, subtree in tree.items():
+                if name not in fields:
+                    errors.setdefault(param, []).append(f"{prefix}{name}")
+                elif subtree is not None and cls.get_nested_fields(fields[name]) is None:
+                    errors.setdefault(param, []).extend(
+                        f"{prefix}{name}.{child}" for child, _ in subtree
+                    )
+
+        if include:
+            for name in list(fields):
+                if name not in include:
+                    del fields[name]
+        for name, subtree in exclude.items():
+            if subtree is None:
+                fields.pop(name, None)
+
+        for name, field in fields.items():
+            nested_include = include.get(name)
+            nested_exclude = exclude.get(name)
+            nested_fields = cls.get_nested_fields(field)
+            if nested_fields is None or (nested_include is None and nested_exclude is None):
+                continue
+            nested_errors = cls.prune_fields(
+                nested_fields,
+                dict(nested_include or ()),
+                dict(nested_exclude or ()),
+                prefix=f"{prefix}{name}.",
+            )
+            for param, paths in nested_errors.items():
+                errors.setdefault(param, []).extend(paths)
+
+        return {
+            param: [f'Invalid fields "{", ".join(sorted(paths))}".']
+            for param, paths in errors.items()
+        }
+
+    @classmethod
+    def get_nested_fields(cls, field):
+        """
+        Returns the fields of a nested serializer.
+
+        Args:
+            field (Field): Bound field of a serializer.
+
+        Returns:
+            BindingDict or None: Fields of the nested serializer, None for other fields.
+        """
+        if isinstance(field, serializers.ListSerializer):
+            field = field.child
+        if isinstance(field, serializers.Serializer):
+            return field.fields
+        return None
+
+    @classmethod
+    def get_fieldset(cls, request):
+        """
+        Reads the fields a request asks to keep, drop and expand.
+
+        Args:
+            request (Request): HTTP request object.
+
+        Raises:
+            ValidationError: If a requested field is not expandable.
+
+        Returns:
+            dict: "fields" and "exclude" path trees and "expand" names, hashable and
+            normalized so that equivalent requests share their query plan.
+        """
+        expand = set(cls.get_values(request, cls.expand_param))
+        unknown = sorted(expand - cls.get_expandable_names())
+        if unknown:
+            raise ValidationError({cls.expand_param: [f'Invalid fields "{", ".join(unknown)}".']})
+        return {
+            "fields": cls.parse_paths(cls.get_values(request, cls.fields_param)),
+            "exclude": cls.parse_paths(cls.get_values(request, cls.exclude_param)),
+            "expand": tuple(sorted(expand)),
+        }
+
+    @classmethod
+    def get_expandable_names(cls):
+        """
+        Lists the expandable fields of the serializer and of its declared nested serializers.
+
+        Returns:
+            set: Names accepted by the expand query parameter.
+        """
+        names = set(getattr(cls.Meta, "expandable_fields", {}))
+        for field in cls._declared_fields.values():
+            nested = getattr(field, "child", field)
+            if isinstance(nested, SparseFieldsetsMixin):
+                names |= type(nested).get_expandable_names()
+        return names
+
+    @classmethod
+    def get_values(cls, request, name):
+        """
+        Reads the values of a multi-valued query parameter.
+
+        Args:
+            request (Request): HTTP request object.
+            name (str): Name of the query parameter.
+
+        Returns:
+            list: Non-empty values, repeated parameters and comma-separated values combined.
+        """
+        return [
+            value.strip()
+            for raw in request.query_params.getlist(name)
+            for value in raw.split(",")
+            if value.strip()
+        ]
+
+    @classmethod
+    def parse_paths(cls, paths):
+        """
+        Builds the tree of a list of dotted field paths.
+
+        A path naming a whole field supersedes the paths reaching into it.
+
+        Args:
+            paths (list): Dotted field paths.
+
+        Returns:
+            tuple: Sorted (name, subtree) pairs, the subtree being None for whole fields.
+        """
+        tree = {}
+        for path in paths:
+            *parents, name = path.split(".")
+            node = tree
+            for parent in parents:
+                node = node.setdefault(parent, {})
+                if node is None:
+                    break
+            else:
+                node[name] = None
+        return cls._freeze(tree)
+
+    @classmethod
+    def _freeze(cls, tree):
+        """
+        Converts a path tree built from dicts into nested sorted tuples.
+
+        Args:
+            tree (dict): Names mapped to subtrees, or None for whole fields.
+
+        Returns:
+            tuple: Sorted (name, subtree) pairs.
+        """
+        return tuple(
+            (name, None if subtree is None else cls._freeze(subtree))
+            for name, subtree in sorted(tree.items())
+        )
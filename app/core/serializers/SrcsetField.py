@@ -0,0 +1,54 @@
+"""
+Module for the SrcsetField class.
+
+This module provides a read-only field rendering the responsive renditions recorded for an
+image as srcset candidates.
+"""
+
+from django.core.files.storage import default_storage
+
+from rest_framework import serializers
+
+
+class SrcsetField(serializers.Field):
+    """
+    Read-only field rendering responsive rendition entries.
+
+    Entries are stored keyed by format, each format listing its files by increasing width with
+    their storage name, width, height and size in bytes. They are rendered with the URLs of the
+    files in place of their names, ready to build the srcset of a picture source per format.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the field as read-only.
+        """
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """
+        Renders responsive rendition entries.
+
+        Args:
+            value (dict): Rendition entries keyed by format.
+
+        Returns:
+            dict: For each format, the URL, width, height and bytes of every rendition. URLs
+            are absolute when the request is known.
+        """
+        request = self.context.get("request")
+        representation = {}
+        for extension, entries in (value or {}).items():
+            representation[extension] = []
+            for entry in entries:
+                url = default_storage.url(entry["name"])
+                representation[extension].append(
+                    {
+                        "url": request.build_absolute_uri(url) if request is not None else url,
+                        "width": entry["width"],
+                        "height": entry["height"],
+                        "bytes": entry["bytes"],
+                    }
+                )
+        return representation
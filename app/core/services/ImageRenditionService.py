@@ -0,0 +1,87 @@
+"""
+Module: image rendition Service
+
+This module defines the ImageRenditionService class holding the image operations shared by the
+services generating renditions of uploaded images.
+
+Classes:
+    ImageRenditionService: Base service class decoding and encoding rendition images.
+
+"""
+
+import io
+
+from PIL import Image
+from PIL import ImageOps
+
+
+class ImageRenditionService:
+    """
+    Base service class decoding and encoding the images of renditions.
+
+    Images are rotated according to their EXIF orientation and re-encoded without metadata, so
+    renditions carry no EXIF data.
+
+    Attributes:
+        decoding_errors (tuple): Exceptions raised by Pillow for files it cannot decode.
+    """
+
+    decoding_errors = (OSError, SyntaxError, ValueError, Image.DecompressionBombError)
+
+    @classmethod
+    def open(cls, field_file):
+        """
+        Decodes and normalizes the image of a file field.
+
+        Args:
+            field_file (FieldFile): Uploaded image.
+
+        Returns:
+            Image or None: The normalized image, None when the file cannot be decoded.
+        """
+        try:
+            with field_file.open("rb") as file, Image.open(file) as original:
+                return cls.normalize(original)
+        except cls.decoding_errors:
+            return None
+
+    @classmethod
+    def normalize(cls, image):
+        """
+        Applies the EXIF orientation of an image and converts it to RGB or RGBA.
+
+        Args:
+            image (Image): Decoded image.
+
+        Returns:
+            Image: Upright copy of the image, without metadata.
+        """
+        image = ImageOps.exif_transpose(image)
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        mode = "RGBA" if has_alpha else "RGB"
+        if image.mode != mode:
+            image = image.convert(mode)
+        image.info = {}
+        return image
+
+    @classmethod
+    def encode(cls, image, options):
+        """
+        Encodes an image, flattening transparency onto white for formats without alpha.
+
+        Args:
+            image (Image): Image to encode.
+            options (dict): Pillow format name and encoder options.
+
+        Returns:
+            bytes: The encoded image.
+        """
+        options = dict(options)
+        image_format = options.pop("format")
+        if image_format == "JPEG" and image.mode == "RGBA":
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, **options)
+        return buffer.getvalue()
@@ -0,0 +1,261 @@
+"""
+Module: MediaGarbageCollector
+
+This module deletes the files of MEDIA_ROOT that no row references anymore, such as the images
+of deleted ProjectImage rows or replaced profile pictures.
+
+The referenced names are read from every FileField column and from the sources registered by
+the applications, such as the rendition files of project images. MEDIA_ROOT is then walked in
+a stable order, in batches, and the unreferenced files older than MEDIA_GC_GRACE_PERIOD are
+deleted or moved to the quarantine directory. The position of the last processed batch is
+saved in MEDIA_GC_CHECKPOINT_FILE, so that an interrupted collection resumes where it stopped.
+
+The grace period must exceed the duration of a collection: files uploaded after the
+referenced names were read are recent, and the content-addressed storage refreshes the
+modification time of the files it reuses.
+
+Classes:
+    MediaGarbageCollector: Finds and removes the orphaned media files.
+"""
+
+import itertools
+import json
+import os
+import time
+
+from collections import Counter
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import FileField
+
+from app.core.models.StoredFile import StoredFile
+
+
+class MediaGarbageCollector:
+    """
+    Service class removing the media files referenced by no row.
+
+    Attributes:
+        batch_size (int): Number of files checked, and of column values loaded, per batch.
+    """
+
+    batch_size = 1000
+    _sources = []
+
+    @classmethod
+    def register_source(cls, source):
+        """
+        Registers a source of referenced names stored outside FileField columns.
+
+        Args:
+            source (callable): Called without arguments, it returns an iterable of storage
+            names.
+        """
+        if source not in cls._sources:
+            cls._sources.append(source)
+
+    @classmethod
+    def collect(cls, quarantine=False, dry_run=False, restart=False):
+        """
+        Removes the orphaned media files, resuming from the last checkpoint.
+
+        Args:
+            quarantine (bool): Move the files to the quarantine directory instead of deleting
+            them.
+            dry_run (bool): Only count the orphaned files, without removing them or saving
+            checkpoints.
+            restart (bool): Ignore the checkpoint and walk MEDIA_ROOT from the start.
+
+        Returns:
+            Counter: Numbers of scanned files, of removed files and of removed bytes.
+        """
+        position = None if restart else cls.load_checkpoint()
+        referenced = cls.get_referenced_names()
+        deadline = time.time() - settings.MEDIA_GC_GRACE_PERIOD
+        stats = Counter()
+
+        files = cls.iter_files(settings.MEDIA_ROOT, after=cls.split(position))
+        while True:
+            batch = list(itertools.islice(files, cls.batch_size))
+            if not batch:
+                break
+            stats["scanned"] += len(batch)
+            orphans = {
+                name: entry
+                for name, entry in batch
+                if name not in referenced and entry.stat().st_mtime < deadline
+            }
+            orphans = cls.exclude_stored_files(orphans)
+            if not dry_run:
+                cls.remove(orphans, quarantine)
+                cls.save_checkpoint(batch[-1][0])
+            stats["removed"] += len(orphans)
+            stats["bytes"] += sum(entry.stat().st_size for entry in orphans.values())
+
+        if not dry_run:
+            cls.clear_checkpoint()
+        return stats
+
+    @classmethod
+    def get_referenced_names(cls):
+        """
+        Reads the names of every referenced media file.
+
+        Returns:
+            set: Storage names found in the file columns and the registered sources.
+        """
+        names = set()
+        for model in apps.get_models():
+            for field in model._meta.concrete_fields:
+                if not isinstance(field, FileField):
+                    continue
+                names.update(
+                    model._base_manager.exclude(**{f"{field.attname}__isnull": True})
+                    .exclude(**{field.attname: ""})
+                    .order_by()
+                    .values_list(field.attname, flat=True)
+                    .iterator(chunk_size=cls.batch_size)
+                )
+        for source in cls._sources:
+            names.update(source())
+        return names
+
+    @classmethod
+    def iter_files(cls, directory, parts=(), after=()):
+        """
+        Walks a directory depth-first, in name order, skipping hidden entries.
+
+        Args:
+            directory (str): Path of the directory.
+            parts (tuple): Path components of the directory relative to MEDIA_ROOT.
+            after (tuple): Path components of the last processed file, whose predecessors are
+            skipped.
+
+        Yields:
+            tuple: Relative name and DirEntry of each file.
+        """
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            entry_parts = (*parts, entry.name)
+            depth = len(entry_parts)
+            if entry_parts < after[:depth]:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from cls.iter_files(entry.path, entry_parts, after)
+            elif entry.is_file(follow_symlinks=False) and entry_parts > after:
+                yield "/".join(entry_parts), entry
+
+    @classmethod
+    def exclude_stored_files(cls, orphans):
+        """
+        Keeps the content-addressed files referenced since the referenced names were read.
+
+        Args:
+            orphans (dict): DirEntry of the orphaned files keyed by name.
+
+        Returns:
+            dict: The orphaned files without a positive StoredFile reference count.
+        """
+        if not orphans:
+            return orphans
+        kept = set(
+            StoredFile.objects.filter(name__in=orphans, reference_count__gt=0).values_list(
+                "name",
+                flat=True,
+            )
+        )
+        return {name: entry for name, entry in orphans.items() if name not in kept}
+
+    @classmethod
+    def remove(cls, orphans, quarantine):
+        """
+        Deletes or quarantines orphaned files and drops their StoredFile rows.
+
+        Args:
+            orphans (dict): DirEntry of the orphaned files keyed by name.
+            quarantine (bool): Move the files to the quarantine directory instead of deleting
+            them.
+        """
+        for name, entry in orphans.items():
+            try:
+                if quarantine:
+                    target = os.path.join(
+                        settings.MEDIA_ROOT,
+                        settings.MEDIA_GC_QUARANTINE_DIRECTORY,
+                        name,
+                    )
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(entry.path, target)
+                else:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+        StoredFile.objects.filter(name__in=orphans, reference_count=0).delete()
+
+    @classmethod
+    def load_checkpoint(cls):
+        """
+        Reads the name of the last file processed by an interrupted collection.
+
+        Returns:
+            str or None: The name, or None when the last collection completed.
+        """
+        try:
+            with open(cls.get_checkpoint_path(), encoding="utf-8") as checkpoint:
+                return json.load(checkpoint).get("position")
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @classmethod
+    def save_checkpoint(cls, position):
+        """
+        Saves the name of the last processed file.
+
+        Args:
+            position (str): Name of the file.
+        """
+        path = cls.get_checkpoint_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as checkpoint:
+            json.dump({"position": position}, checkpoint)
+        os.replace(f"{path}.tmp", path)
+
+    @classmethod
+    def clear_checkpoint(cls):
+        """
+        Removes the checkpoint once a collection completed.
+        """
+        try:
+            os.remove(cls.get_checkpoint_path())
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def get_checkpoint_path(cls):
+        """
+        Returns the path of the checkpoint file.
+
+        Returns:
+            str: Path of MEDIA_GC_CHECKPOINT_FILE in MEDIA_ROOT.
+        """
+        return os.path.join(settings.MEDIA_ROOT, settings.MEDIA_GC_CHECKPOINT_FILE)
+
+    @classmethod
+    def split(cls, name):
+        """
+        Splits a relative name into path components.
+
+        Args:
+            name (str): Relative name, or None.
+
+        Returns:
+            tuple: The components, empty for None.
+        """
+        return tuple(name.split("/")) if name else ()
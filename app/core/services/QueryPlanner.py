@@ -0,0 +1,324 @@
+"""
+Module: QueryPlanner
+
+This module derives select_related/prefetch_related/only() plans from serializer field trees,
+so that querysets feeding nested serializers are fetched in a constant number of queries.
+
+Classes:
+    QueryPlan: Description of the loading strategy for one serializer.
+    QueryPlanner: Builds, caches and applies QueryPlan instances per serializer class.
+"""
+
+import threading
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+
+from rest_framework import serializers
+
+
+class QueryPlan:
+    """
+    Loading strategy derived from a serializer.
+
+    Attributes:
+        select_related (list): Single-valued relation paths joined in the main query.
+        prefetch_related (list): (lookup, QueryPlan or None, model) tuples for many-valued
+        relations, each one fetched with a single extra query.
+        only (list or None): Column paths to load, or None when every column is needed.
+    """
+
+    def __init__(self, select_related=None, prefetch_related=None, only=None):
+        """
+        Initializes the plan.
+
+        Args:
+            select_related (list): Relation paths to join.
+            prefetch_related (list): Prefetch descriptors.
+            only (list or None): Column paths to restrict the query to.
+        """
+        self.select_related = select_related or []
+        self.prefetch_related = prefetch_related or []
+        self.only = only
+
+    def apply(self, queryset, columns=()):
+        """
+        Applies the plan to a queryset.
+
+        Args:
+            queryset (QuerySet): Queryset over the serializer's model.
+            columns (iterable): Extra column paths the caller reads, such as ordering fields.
+
+        Returns:
+            QuerySet: The optimized queryset.
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        prefetches = [
+            Prefetch(
+                lookup,
+                queryset=plan.apply(model._default_manager.all()) if plan else None,
+            )
+            for lookup, plan, model in self.prefetch_related
+        ]
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        if self.only is not None:
+            queryset = queryset.only(*self.only, *columns)
+        return queryset
+
+
+class QueryPlanner:
+    """
+    Builds query plans by walking serializer field trees.
+
+    Plans are computed once per serializer class and field selection, and cached for the
+    lifetime of the process, since serializer declarations do not change at runtime. The cache
+    is emptied when it holds max_plans plans, as field selections come from the clients.
+
+    Attributes:
+        max_plans (int): Number of cached plans above which the cache is emptied.
+    """
+
+    max_plans = 1024
+    _plans = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def optimize(cls, queryset, serializer_class, columns=(), **fieldset):
+        """
+        Applies the cached plan of a serializer class to a queryset.
+
+        Args:
+            queryset (QuerySet): Queryset to optimize.
+            serializer_class (type): Serializer used to render the queryset rows.
+            columns (iterable): Extra column paths the caller reads, such as ordering fields.
+            **fieldset: Field selection of the serializer, as returned by
+            SparseFieldsetsMixin.get_fieldset.
+
+        Returns:
+            QuerySet: The optimized queryset.
+        """
+        return cls.get_plan(serializer_class, **fieldset).apply(queryset, columns)
+
+    @classmethod
+    def get_plan(cls, serializer_class, fields=(), exclude=(), expand=()):
+        """
+        Returns the plan for a serializer class, building it on first use.
+
+        Args:
+            serializer_class (type): A ModelSerializer subclass.
+            fields (tuple): Tree of the field paths the serializer keeps.
+            exclude (tuple): Tree of the field paths the serializer drops.
+            expand (tuple): Names of the expandable fields the serializer renders.
+
+        Raises:
+            ValidationError: If the field selection does not match the serializer.
+
+        Returns:
+            QueryPlan: The cached plan.
+        """
+        fieldset = {"fields": fields, "exclude": exclude, "expand": tuple(expand)}
+        key = (serializer_class, fields, exclude, fieldset["expand"])
+        plan = cls._plans.get(key)
+        if plan is None:
+            with cls._lock:
+                plan = cls._plans.get(key)
+                if plan is None:
+                    plan = cls.build_plan(serializer_class(context=fieldset))
+                    if len(cls._plans) >= cls.max_plans:
+                        cls._plans = {}
+                    cls._plans[key] = plan
+        return plan
+
+    @classmethod
+    def build_plan(cls, serializer, model=None):
+        """
+        Walks the fields of a serializer instance and derives its plan.
+
+        Args:
+            serializer (Serializer): Serializer instance whose fields are inspected.
+            model (Model): Model rendered by the serializer, defaults to its Meta.model.
+
+        Returns:
+            QueryPlan: The derived plan.
+        """
+        model = model or serializer.Meta.model
+        select_related, prefetch_related, columns = [], [], set()
+        restrict = cls._renders_declared_fields_only(serializer)
+
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            if field.source == "*" or isinstance(field, serializers.SerializerMethodField):
+                restrict = False
+                continue
+            if not cls._plan_field(
+                field,
+                model,
+                select_related,
+                prefetch_related,
+                columns,
+            ):
+                restrict = False
+
+        return QueryPlan(
+            select_related=list(dict.fromkeys(select_related)),
+            prefetch_related=prefetch_related,
+            only=sorted(columns) if restrict else None,
+        )
+
+    @classmethod
+    def _plan_field(cls, field, model, select_related, prefetch_related, columns):
+        """
+        Adds the loading requirements of one serializer field to the plan being built.
+
+        Args:
+            field (Field): Bound serializer field.
+            model (Model): Model the field reads from.
+            select_related (list): Accumulated select_related paths.
+            prefetch_related (list): Accumulated prefetch descriptors.
+            columns (set): Accumulated column paths.
+
+        Returns:
+            bool: False when the field reads data the planner cannot map to columns.
+        """
+        path = []
+        current = model
+        attrs = field.source_attrs
+
+        for index, attr in enumerate(attrs):
+            model_field = cls._get_model_field(current, attr)
+            if model_field is None:
+                # Unknown attributes are skipped by DRF, properties need the full row.
+                return not hasattr(current, attr)
+
+            is_last = index == len(attrs) - 1
+            prefix = "__".join(path + [attr])
+
+            if model_field.many_to_many or model_field.one_to_many:
+                if not is_last:
+                    return False
+                related_model = model_field.related_model
+                child_plan = cls._build_child_plan(field, related_model, model_field)
+                prefetch_related.append((prefix, child_plan, related_model))
+                return True
+
+            if not model_field.is_relation:
+                columns.add(prefix)
+                return True
+
+            if model_field.concrete:
+                columns.add(prefix)
+
+            if is_last:
+                if isinstance(field, serializers.BaseSerializer):
+                    select_related.append(prefix)
+                    nested_plan = cls.build_plan(field, model_field.related_model)
+                    cls._merge_nested_plan(
+                        prefix,
+                        nested_plan,
+                        select_related,
+                        prefetch_related,
+                        columns,
+                    )
+                    return True
+                if model_field.concrete and isinstance(field, serializers.PrimaryKeyRelatedField):
+                    # Primary keys are read from the foreign key column without a join.
+                    return True
+                select_related.append(prefix)
+                return False
+
+            select_related.append(prefix)
+            path.append(attr)
+            current = model_field.related_model
+
+        return True
+
+    @classmethod
+    def _build_child_plan(cls, field, related_model, model_field):
+        """
+        Builds the plan of the queryset prefetched for a many-valued relation.
+
+        Args:
+            field (Field): Serializer field rendering the relation.
+            related_model (Model): Model on the other side of the relation.
+            model_field (Field): Model field or reverse relation being prefetched.
+
+        Returns:
+            QueryPlan or None: Plan for the prefetch queryset, None for the default one.
+        """
+        if isinstance(field, serializers.ManyRelatedField):
+            child = field.child_relation
+            if isinstance(child, serializers.PrimaryKeyRelatedField):
+                return QueryPlan(only=[related_model._meta.pk.name])
+            return None
+        if not isinstance(field, serializers.ListSerializer):
+            return None
+        if not isinstance(field.child, serializers.BaseSerializer):
+            return None
+
+        plan = cls.build_plan(field.child, related_model)
+        if plan.only is not None and model_field.one_to_many:
+            # The reverse foreign key must be loaded to attach rows to their parents.
+            plan.only = sorted(set(plan.only) | {model_field.field.attname})
+        return plan
+
+    @classmethod
+    def _merge_nested_plan(cls, prefix, plan, select_related, prefetch_related, columns):
+        """
+        Merges the plan of a nested single-object serializer into its parent's plan.
+
+        Args:
+            prefix (str): Relation path from the parent model to the nested model.
+            plan (QueryPlan): Plan of the nested serializer.
+            select_related (list): Parent select_related paths.
+            prefetch_related (list): Parent prefetch descriptors.
+            columns (set): Parent column paths.
+        """
+        select_related.extend(f"{prefix}__{path}" for path in plan.select_related)
+        prefetch_related.extend(
+            (f"{prefix}__{lookup}", child_plan, model)
+            for lookup, child_plan, model in plan.prefetch_related
+        )
+        columns.update(f"{prefix}__{column}" for column in plan.only or [])
+
+    @classmethod
+    def _get_model_field(cls, model, attr):
+        """
+        Resolves an attribute name to a model field or relation.
+
+        Args:
+            model (Model): Model class to inspect.
+            attr (str): Attribute name from a serializer source.
+
+        Returns:
+            Field or None: The matching field, or None when the attribute is not a field.
+        """
+        try:
+            return model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            for relation in model._meta.related_objects:
+                if relation.get_accessor_name() == attr:
+                    return relation
+            return None
+
+    @classmethod
+    def _renders_declared_fields_only(cls, serializer):
+        """
+        Checks whether a serializer only reads the fields it declares.
+
+        Serializers overriding to_representation may read any attribute of the instance, so
+        their rows are loaded in full.
+
+        Args:
+            serializer (Serializer): Serializer instance to inspect.
+
+        Returns:
+            bool: True when column restriction is safe.
+        """
+        to_representation = type(serializer).to_representation
+        return to_representation in (
+            serializers.ModelSerializer.to_representation,
+            serializers.Serializer.to_representation,
+        )
@@ -0,0 +1,264 @@
+"""
+Module: ReferenceDataRegistry
+
+This module keeps small, rarely modified reference tables in process memory, so that lookups
+by id or by parent do not hit the database.
+
+Every registered table has a TableVersion stamp bumped whenever one of its rows is saved or
+deleted. Processes compare their loaded versions with the stored ones at most once per
+REFERENCE_DATA_CHECK_INTERVAL seconds and reload the tables that changed.
+
+Classes:
+    TableSnapshot: Rows of one reference table loaded at a given version.
+    ReferenceDataRegistry: Registers, loads and serves reference tables.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+
+from app.core.models.TableVersion import TableVersion
+
+
+class TableSnapshot:
+    """
+    Rows of one reference table loaded at a given version.
+
+    Attributes:
+        version (int): TableVersion of the table when the rows were loaded.
+        rows (list): All rows of the table.
+        by_id (dict): Rows keyed by primary key.
+        by_parent (dict): For each parent foreign key name, lists of rows keyed by parent id.
+    """
+
+    def __init__(self, model, parents, version):
+        """
+        Loads the rows of a table.
+
+        Args:
+            model (Model): Model of the reference table.
+            parents (tuple): Foreign key names the rows are indexed by.
+            version (int): Current TableVersion of the table.
+        """
+        queryset = model._default_manager.all()
+        if not model._meta.ordering:
+            queryset = queryset.order_by("pk")
+
+        self.version = version
+        self.rows = list(queryset)
+        self.by_id = {row.pk: row for row in self.rows}
+        self.by_parent = {}
+        for parent in parents:
+            attname = model._meta.get_field(parent).attname
+            index = self.by_parent[parent] = {}
+            for row in self.rows:
+                index.setdefault(getattr(row, attname), []).append(row)
+
+
+class ReferenceDataRegistry:
+    """
+    In-process cache of reference tables, invalidated across processes by version stamps.
+
+    The cached instances are shared between requests and must be treated as read-only.
+    """
+
+    _registrations = {}
+    _snapshots = {}
+    _checked_at = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def register(cls, model, parents=()):
+        """
+        Registers a reference table and connects the signals bumping its version.
+
+        Args:
+            model (Model): Model of the reference table.
+            parents (tuple): Foreign key names rows can be looked up by.
+        """
+        label = model._meta.label_lower
+        cls._registrations[label] = (model, tuple(parents))
+        post_save.connect(
+            cls._on_change,
+            sender=model,
+            dispatch_uid=f"reference_data_save_{label}",
+        )
+        post_delete.connect(
+            cls._on_change,
+            sender=model,
+            dispatch_uid=f"reference_data_delete_{label}",
+        )
+
+    @classmethod
+    def is_registered(cls, model):
+        """
+        Checks whether a model is served by the registry.
+
+        Args:
+            model (Model): Model class to check.
+
+        Returns:
+            bool: True when the model is registered.
+        """
+        return model._meta.label_lower in cls._registrations
+
+    @classmethod
+    def covers(cls, queryset):
+        """
+        Checks whether a queryset returns a whole registered table.
+
+        Args:
+            queryset (QuerySet): Queryset to check.
+
+        Returns:
+            bool: True when the queryset can be answered from the registry.
+        """
+        return cls.is_registered(queryset.model) and not queryset.query.has_filters()
+
+    @classmethod
+    def all(cls, model):
+        """
+        Returns every row of a reference table.
+
+        Args:
+            model (Model): Model of the reference table.
+
+        Returns:
+            list: The rows, in primary key order unless the model defines an ordering.
+        """
+        return cls._snapshot(model).rows
+
+    @classmethod
+    def get(cls, model, pk):
+        """
+        Returns one row of a reference table.
+
+        Args:
+            model (Model): Model of the reference table.
+            pk: Primary key of the row.
+
+        Returns:
+            Model or None: The row, or None when it does not exist.
+        """
+        return cls._snapshot(model).by_id.get(pk)
+
+    @classmethod
+    def in_bulk(cls, model, pks):
+        """
+        Returns the rows of a reference table matching a list of primary keys.
+
+        Args:
+            model (Model): Model of the reference table.
+            pks (iterable): Primary keys to look up.
+
+        Returns:
+            dict: Found rows keyed by primary key.
+        """
+        by_id = cls._snapshot(model).by_id
+        return {pk: by_id[pk] for pk in pks if pk in by_id}
+
+    @classmethod
+    def filter_by(cls, model, parent, parent_id):
+        """
+        Returns the rows of a reference table attached to a parent.
+
+        Args:
+            model (Model): Model of the reference table.
+            parent (str): Foreign key name given at registration.
+            parent_id: Primary key of the parent.
+
+        Returns:
+            list: The matching rows.
+        """
+        return cls._snapshot(model).by_parent[parent].get(parent_id, [])
+
+    @classmethod
+    def version(cls, model):
+        """
+        Returns the version of the loaded rows of a reference table.
+
+        Args:
+            model (Model): Model of the reference table.
+
+        Returns:
+            int: The TableVersion the rows were loaded at.
+        """
+        return cls._snapshot(model).version
+
+    @classmethod
+    def invalidate(cls, model=None):
+        """
+        Drops the loaded rows of one or all reference tables from this process.
+
+        Args:
+            model (Model): Model of the table to drop, every table when omitted.
+        """
+        with cls._lock:
+            if model is None:
+                cls._snapshots = {}
+            else:
+                cls._snapshots.pop(model._meta.label_lower, None)
+
+    @classmethod
+    def _snapshot(cls, model):
+        """
+        Returns the up-to-date snapshot of a reference table, loading it when needed.
+
+        Args:
+            model (Model): Model of the reference table.
+
+        Raises:
+            KeyError: If the model is not registered.
+
+        Returns:
+            TableSnapshot: The snapshot.
+        """
+        label = model._meta.label_lower
+        registered_model, parents = cls._registrations[label]
+        cls._check_versions()
+        snapshot = cls._snapshots.get(label)
+        if snapshot is None:
+            with cls._lock:
+                snapshot = cls._snapshots.get(label)
+                if snapshot is None:
+                    version = TableVersion.current([label])[label]
+                    snapshot = TableSnapshot(registered_model, parents, version)
+                    cls._snapshots[label] = snapshot
+        return snapshot
+
+    @classmethod
+    def _check_versions(cls):
+        """
+        Drops the snapshots whose table version changed, at most once per check interval.
+        """
+        now = time.monotonic()
+        interval = settings.REFERENCE_DATA_CHECK_INTERVAL
+        if cls._checked_at is not None and now - cls._checked_at < interval:
+            return
+        with cls._lock:
+            if cls._checked_at is not None and now - cls._checked_at < interval:
+                return
+            cls._checked_at = now
+            if not cls._snapshots:
+                return
+            versions = TableVersion.current(cls._snapshots)
+            cls._snapshots = {
+                label: snapshot
+                for label, snapshot in cls._snapshots.items()
+                if snapshot.version == versions[label]
+            }
+
+    @classmethod
+    def _on_change(cls, sender, **kwargs):
+        """
+        Bumps the version of a reference table after one of its rows changed.
+
+        Args:
+            sender (Model): Model of the changed row.
+        """
+        TableVersion.bump(sender._meta.label_lower)
+        transaction.on_commit(lambda: cls.invalidate(sender))
@@ -0,0 +1,73 @@
+"""
+Module: SingleFlightCache
+
+This module provides a read-through cache computing each missing value once: concurrent
+misses on the same key, in any process sharing the cache backend, wait for the first one to
+store its result instead of computing it again.
+
+Classes:
+    SingleFlightCache: Read-through cache with single-flight protection.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+class SingleFlightCache:
+    """
+    Read-through cache with single-flight protection.
+
+    The computation of a missing value holds a lock entry in the cache, added atomically. Other
+    requests for the same key poll the cache until the value is stored, and compute it
+    themselves when the lock outlives lock_timeout.
+
+    Attributes:
+        lock_timeout (int): Seconds a computation may hold its lock.
+        poll_interval (float): Seconds between two reads of a waiting request.
+    """
+
+    lock_timeout = 10
+    poll_interval = 0.05
+
+    @classmethod
+    def get_or_set(cls, key, compute, timeout):
+        """
+        Returns the cached value of a key, computing and storing it when missing.
+
+        Args:
+            key (str): Cache key.
+            compute (callable): Called without arguments, it returns the value to cache, which
+            must not be None.
+            timeout (int): Seconds the computed value is kept.
+
+        Returns:
+            The cached or computed value.
+        """
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        lock_key = f"{key}:lock"
+        deadline = time.monotonic() + cls.lock_timeout
+        locked = cache.add(lock_key, 1, cls.lock_timeout)
+        waited = not locked
+        while not locked and time.monotonic() < deadline:
+            time.sleep(cls.poll_interval)
+            value = cache.get(key)
+            if value is not None:
+                return value
+            locked = cache.add(lock_key, 1, cls.lock_timeout)
+
+        try:
+            if waited:
+                # The previous holder may have stored the value right before releasing it.
+                value = cache.get(key)
+                if value is not None:
+                    return value
+            value = compute()
+            cache.set(key, value, timeout)
+        finally:
+            if locked:
+                cache.delete(lock_key)
+        return value
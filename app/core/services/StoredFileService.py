@@ -0,0 +1,258 @@
+"""
+Module: StoredFileService
+
+This module maintains the reference counts of the files of the content-addressed storage.
+
+Every file field using ContentAddressedStorage is registered when the applications are ready:
+the names loaded with a row are remembered, and saving or deleting the row adjusts the counts
+of the names it gained or released, within the transaction of the change. Rows inserted with
+bulk_create send no signal and must be passed to track.
+
+Classes:
+    StoredFileService: Registers content-addressed file fields and counts their references.
+"""
+
+from collections import Counter
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Case
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import FileField
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_init
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from app.core.models.StoredFile import StoredFile
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
+
+
+class StoredFileService:
+    """
+    Service class counting the rows referencing each content-addressed file.
+
+    Attributes:
+        storage (ContentAddressedStorage): Storage the counted files live in.
+        batch_size (int): Number of StoredFile rows written per query by recount.
+    """
+
+    storage = ContentAddressedStorage()
+    batch_size = 500
+    _fields = {}
+
+    @classmethod
+    def register_content_addressed_fields(cls):
+        """
+        Registers every file field of the installed models using ContentAddressedStorage.
+        """
+        for model in apps.get_models():
+            attnames = [
+                field.attname
+                for field in model._meta.concrete_fields
+                if isinstance(field, FileField)
+                and isinstance(field.storage, ContentAddressedStorage)
+            ]
+            if attnames:
+                cls.register(model, attnames)
+
+    @classmethod
+    def register(cls, model, attnames):
+        """
+        Registers file fields of a model and connects the signals counting their references.
+
+        Args:
+            model (Model): Model holding the file fields.
+            attnames (list): Names of the file fields.
+        """
+        label = model._meta.label_lower
+        cls._fields[model] = tuple(attnames)
+        post_init.connect(cls._on_init, sender=model, dispatch_uid=f"stored_file_init_{label}")
+        post_save.connect(cls._on_save, sender=model, dispatch_uid=f"stored_file_save_{label}")
+        post_delete.connect(
+            cls._on_delete,
+            sender=model,
+            dispatch_uid=f"stored_file_delete_{label}",
+        )
+
+    @classmethod
+    def get_names(cls, instance):
+        """
+        Reads the content-addressed file names held by an instance.
+
+        Args:
+            instance (Model): Instance of a registered model.
+
+        Returns:
+            dict: File names keyed by field name, fields without such a file omitted.
+        """
+        names = {}
+        for attname in cls._fields[type(instance)]:
+            value = instance.__dict__.get(attname)
+            name = getattr(value, "name", value)
+            if isinstance(name, str) and cls.storage.is_content_addressed(name):
+                names[attname] = name
+        return names
+
+    @classmethod
+    def track(cls, instances):
+        """
+        Counts the references of rows inserted without post_save, such as by bulk_create.
+
+        Args:
+            instances (iterable): Inserted instances of a registered model.
+        """
+        deltas = Counter()
+        for instance in instances:
+            names = cls.get_names(instance)
+            deltas.update(names.values())
+            instance._stored_file_names = names
+        cls.adjust(deltas)
+
+    @classmethod
+    def adjust(cls, deltas):
+        """
+        Adds reference count deltas, creating the StoredFile rows of newly referenced files.
+
+        Args:
+            deltas (dict): Reference count changes keyed by file name.
+        """
+        now = timezone.now()
+        for name, delta in sorted(deltas.items()):
+            if not delta:
+                continue
+            rows = StoredFile.objects.filter(name=name)
+            updated = rows.update(
+                reference_count=Greatest(F("reference_count") + delta, 0),
+                released_at=Case(
+                    When(reference_count__lte=-delta, then=Value(now)),
+                    default=None,
+                ),
+            )
+            if updated or delta < 0:
+                continue
+            _, created = StoredFile.objects.get_or_create(
+                name=name,
+                defaults={"size": cls.get_size(name), "reference_count": delta},
+            )
+            if not created:
+                rows.update(reference_count=F("reference_count") + delta, released_at=None)
+
+    @classmethod
+    def recount(cls):
+        """
+        Recomputes every reference count from the registered file fields.
+
+        Returns:
+            int: Number of StoredFile rows created or corrected.
+        """
+        counts = Counter()
+        prefix = f"{settings.CONTENT_ADDRESSED_STORAGE_DIRECTORY}/"
+        for model, attnames in cls._fields.items():
+            for attname in attnames:
+                rows = (
+                    model._default_manager.filter(**{f"{attname}__startswith": prefix})
+                    .order_by()
+                    .values_list(attname)
+                    .annotate(count=Count("pk"))
+                )
+                counts.update(dict(rows.iterator()))
+
+        now = timezone.now()
+        changed = []
+        for stored_file in StoredFile.objects.iterator():
+            count = counts.pop(stored_file.name, 0)
+            if stored_file.reference_count != count:
+                stored_file.reference_count = count
+                stored_file.released_at = None if count else now
+                changed.append(stored_file)
+        StoredFile.objects.bulk_update(
+            changed,
+            ["reference_count", "released_at"],
+            batch_size=cls.batch_size,
+        )
+        StoredFile.objects.bulk_create(
+            [
+                StoredFile(name=name, size=cls.get_size(name), reference_count=count)
+                for name, count in counts.items()
+            ],
+            batch_size=cls.batch_size,
+            ignore_conflicts=True,
+        )
+        return len(changed) + len(counts)
+
+    @classmethod
+    def get_size(cls, name):
+        """
+        Reads the size of a stored file.
+
+        Args:
+            name (str): Storage name of the file.
+
+        Returns:
+            int: Size in bytes, 0 when the file is missing.
+        """
+        try:
+            return cls.storage.size(name)
+        except OSError:
+            return 0
+
+    @classmethod
+    def _on_init(cls, sender, instance, **kwargs):
+        """
+        Remembers the file names an instance was loaded with.
+
+        Args:
+            sender (Model): Model of the instance.
+            instance (Model): Initialized instance.
+        """
+        instance._stored_file_names = cls.get_names(instance)
+
+    @classmethod
+    def _on_save(cls, sender, instance, created, update_fields=None, **kwargs):
+        """
+        Counts the files a saved instance gained and released.
+
+        Args:
+            sender (Model): Model of the instance.
+            instance (Model): Saved instance.
+            created (bool): Whether the row was inserted.
+            update_fields (frozenset): Fields written by the save, None for all of them.
+        """
+        previous = {} if created else getattr(instance, "_stored_file_names", {})
+        current = cls.get_names(instance)
+        deltas = Counter()
+        for attname in cls._fields[sender]:
+            if update_fields is not None and attname not in update_fields:
+                continue
+            old, new = previous.get(attname), current.get(attname)
+            if old == new:
+                continue
+            if old:
+                deltas[old] -= 1
+            if new:
+                deltas[new] += 1
+        cls.adjust(deltas)
+        if not created and update_fields is not None:
+            current = {
+                **{name: value for name, value in previous.items() if name not in update_fields},
+                **{name: value for name, value in current.items() if name in update_fields},
+            }
+        instance._stored_file_names = current
+
+    @classmethod
+    def _on_delete(cls, sender, instance, **kwargs):
+        """
+        Releases the files of a deleted instance.
+
+        Args:
+            sender (Model): Model of the instance.
+            instance (Model): Deleted instance.
+        """
+        deltas = Counter()
+        deltas.subtract(cls.get_names(instance).values())
+        cls.adjust(deltas)
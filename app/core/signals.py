@@ -0,0 +1,45 @@
+"""
+Module providing signal helpers shared by the applications.
+
+Functions:
+    track_table_version: Bumps a TableVersion label whenever rows of some models change.
+"""
+
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+
+from app.core.models.TableVersion import TableVersion
+
+
+def track_table_version(label, *models):
+    """
+    Connects the signals bumping a TableVersion label when rows of the given models change.
+
+    Auto-created many-to-many through models are tracked with m2m_changed, since adding or
+    removing relations does not send post_save or post_delete.
+
+    Args:
+        label (str): Label of the TableVersion to bump.
+        *models (Model): Models whose saves and deletions change the versioned data.
+    """
+
+    def bump(sender, **kwargs):
+        TableVersion.bump(label)
+
+    def bump_on_m2m_change(sender, action, **kwargs):
+        if action.startswith("post_"):
+            TableVersion.bump(label)
+
+    for model in models:
+        uid = f"track_table_version_{label}_{model._meta.label_lower}"
+        if model._meta.auto_created:
+            m2m_changed.connect(
+                bump_on_m2m_change,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"{uid}_m2m",
+            )
+            continue
+        post_save.connect(bump, sender=model, weak=False, dispatch_uid=f"{uid}_save")
+        post_delete.connect(bump, sender=model, weak=False, dispatch_uid=f"{uid}_delete")
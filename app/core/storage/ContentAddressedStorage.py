@@ -0,0 +1,122 @@
+"""
+Module for the ContentAddressedStorage class.
+
+This module provides a file system storage naming files after the digest of their content, so
+that identical uploads are written once and shared by every row referencing them.
+"""
+
+import hashlib
+import os
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage keeping every file under the SHA-256 digest of its content.
+
+    Files are stored as <directory>/<shard>/.../<digest><extension>, the shards being the
+    leading characters of the digest, which bounds the number of entries per directory. The
+    name given by the field only provides the extension, so identical files uploaded through
+    different fields share one file, and saving content whose digest is already stored does
+    not write anything.
+
+    Since files are shared, rows releasing a file must not delete it: StoredFile reference
+    counts tell which files are still used.
+
+    Attributes:
+        hash_algorithm (str): Name of the hashlib algorithm digesting the content.
+    """
+
+    hash_algorithm = "sha256"
+
+    def get_available_name(self, name, max_length=None):
+        """
+        Returns the name unchanged, the stored name being derived from the content.
+
+        Args:
+            name (str): Name generated by the field.
+            max_length (int): Maximum length of the name.
+
+        Returns:
+            str: The name.
+        """
+        return name
+
+    def _save(self, name, content):
+        """
+        Writes the content under its digest unless a file with the same digest exists.
+
+        The content is first written to a temporary file of the shard directory, then renamed,
+        so that concurrent uploads of the same content never expose a partial file. An existing
+        file gets its modification time refreshed instead, which protects it from the orphaned
+        media collector during its grace period.
+
+        Args:
+            name (str): Name generated by the field, only its extension is kept.
+            content (File): Content to store.
+
+        Returns:
+            str: The content-addressed name of the file.
+        """
+        name = self.get_hashed_name(self.get_digest(content), os.path.splitext(name)[1])
+        if self.exists(name):
+            os.utime(self.path(name))
+            return name
+        temporary_name = super()._save(f"{name}.{uuid.uuid4().hex}.part", content)
+        os.replace(self.path(temporary_name), self.path(name))
+        return name
+
+    def get_digest(self, content):
+        """
+        Digests the content of a file.
+
+        Files whose digest was already verified carry it in a content_digest attribute and
+        are not read again.
+
+        Args:
+            content (File): File to digest.
+
+        Returns:
+            str: Hexadecimal digest of the content.
+        """
+        if getattr(content, "content_digest", None):
+            return content.content_digest
+        digest = hashlib.new(self.hash_algorithm)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_hashed_name(self, digest, extension):
+        """
+        Builds the sharded name of a digest.
+
+        Args:
+            digest (str): Hexadecimal digest of the content.
+            extension (str): Extension of the file, with its leading dot.
+
+        Returns:
+            str: Name such as objects/ab/cd/abcd...ef.jpg.
+        """
+        width = settings.CONTENT_ADDRESSED_STORAGE_SHARD_WIDTH
+        offsets = range(0, width * settings.CONTENT_ADDRESSED_STORAGE_SHARD_DEPTH + 1, width)
+        shards = [digest[start:end] for start, end in zip(offsets, offsets[1:])]
+        return "/".join(
+            [settings.CONTENT_ADDRESSED_STORAGE_DIRECTORY, *shards, digest + extension.lower()]
+        )
+
+    def is_content_addressed(self, name):
+        """
+        Checks whether a stored name was produced by this storage.
+
+        Files uploaded before the storage was introduced keep their original names.
+
+        Args:
+            name (str): Stored file name.
+
+        Returns:
+            bool: True when the name lives under the content-addressed directory.
+        """
+        return bool(name) and name.startswith(f"{settings.CONTENT_ADDRESSED_STORAGE_DIRECTORY}/")
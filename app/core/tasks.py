@@ -0,0 +1,21 @@
+"""
+Module defining the background tasks of the core application.
+
+Functions:
+    collect_orphaned_media: Task removing the media files referenced by no row.
+"""
+
+from background_task import background
+
+from app.core.services.MediaGarbageCollector import MediaGarbageCollector
+
+
+@background(schedule=0)
+def collect_orphaned_media(quarantine=False):
+    """
+    Removes the orphaned media files, resuming an interrupted collection.
+
+    Args:
+        quarantine (bool): Move the files to the quarantine directory instead of deleting them.
+    """
+    MediaGarbageCollector.collect(quarantine=quarantine)
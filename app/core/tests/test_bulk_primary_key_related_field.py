@@ -0,0 +1,66 @@
+"""
+Tests for the BulkPrimaryKeyRelatedField class.
+"""
+
+from django.test import TestCase
+
+from rest_framework import serializers
+
+from app.announcement.models.Need import Need
+from app.core.models import ArchitectSpeciality
+from app.core.serializers.BulkPrimaryKeyRelatedField import BulkPrimaryKeyRelatedField
+
+
+class NeedsSerializer(serializers.Serializer):
+    """
+    Serializer validating needs from the whole table and from a filtered queryset.
+    """
+
+    needs = BulkPrimaryKeyRelatedField(many=True, queryset=Need.objects.all())
+    filtered_needs = BulkPrimaryKeyRelatedField(
+        many=True,
+        queryset=Need.objects.filter(label__startswith="need"),
+        required=False,
+    )
+
+
+class BulkPrimaryKeyRelatedFieldTest(TestCase):
+    """
+    Tests resolving many primary keys at once.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Creates the needs referenced by the tests.
+        """
+        speciality = ArchitectSpeciality.objects.create(label="speciality", icon="icon.png")
+        cls.needs = [
+            Need.objects.create(
+                label=f"need {index}", icon="icon.png", architect_speciality=speciality
+            )
+            for index in range(2)
+        ]
+
+    def test_resolves_primary_keys(self):
+        """
+        Known primary keys are resolved to instances, in submitted order.
+        """
+        pks = [self.needs[1].pk, self.needs[0].pk]
+        serializer = NeedsSerializer(data={"needs": pks, "filtered_needs": pks})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["needs"], self.needs[::-1])
+        self.assertEqual(serializer.validated_data["filtered_needs"], self.needs[::-1])
+
+    def test_reports_unknown_primary_keys(self):
+        """
+        Unknown primary keys are reported together as a validation error.
+        """
+        pks = [self.needs[0].pk, 998, 999]
+        serializer = NeedsSerializer(data={"needs": pks, "filtered_needs": pks})
+        self.assertFalse(serializer.is_valid())
+        for field_name in ("needs", "filtered_needs"):
+            self.assertEqual(
+                serializer.errors[field_name],
+                ['Invalid pks "998, 999" - objects do not exist.'],
+            )
@@ -46,3 +46,13 @@ class SMSException(Exception):
     """
 
     pass
+
+
+class UploadTooLargeException(APIException):
+    """
+    Exception raised when the files uploaded with a request exceed the upload budgets.
+    """
+
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "The uploaded files are too large."
+    default_code = "upload_too_large"
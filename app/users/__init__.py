@@ -24,3 +24,5 @@ APPEARANCES = [
     ("Petite", "Petite"),
     ("Grande", "Grande"),
 ]
+
+ARCHITECT_PREFERENCES_TABLE_VERSION = "users.architect_preferences"
@@ -16,3 +16,23 @@ class UsersConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.users"
+
+    def ready(self):
+        """
+        Registers the reference tables and connects the signals of the 'app.users' application.
+        """
+        from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
+        from app.core.signals import track_table_version
+        from app.users import ARCHITECT_PREFERENCES_TABLE_VERSION
+        from app.users.models.Architect import Architect
+        from app.users.models.SupplierSpeciality import SupplierSpeciality
+
+        ReferenceDataRegistry.register(SupplierSpeciality)
+        track_table_version(
+            ARCHITECT_PREFERENCES_TABLE_VERSION,
+            Architect,
+            Architect.project_categories.through,
+            Architect.property_types.through,
+            Architect.work_types.through,
+            Architect.architectural_styles.through,
+        )
@@ -8,6 +8,7 @@ Class: AdminViewSet
 from rest_framework import viewsets
 from rest_framework.decorators import action
 
+from app.core.controllers.OptimizedQuerySetMixin import OptimizedQuerySetMixin
 from app.users.controllers.utils.IsSuperUser import IsSuperUser
 from app.users.models import Admin
 from app.users.serializers.AdminSerializer import AdminSerializer
@@ -15,7 +16,7 @@ from app.users.serializers.UserAuthSerializer import UserAuthSerializer
 from app.users.services.AdminService import AdminService
 
 
-class AdminViewSet(viewsets.ModelViewSet):
+class AdminViewSet(OptimizedQuerySetMixin, viewsets.ModelViewSet):
     """
     ViewSet for Admin model, providing CRUD operations and additional actions.
 
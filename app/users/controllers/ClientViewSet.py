@@ -8,6 +8,7 @@ using Django REST Framework, including custom login actions.
 from rest_framework import viewsets
 from rest_framework.decorators import action
 
+from app.core.controllers.OptimizedQuerySetMixin import OptimizedQuerySetMixin
 from app.users.models import Client
 from app.users.serializers.ClientSerializer import ClientSerializer
 from app.users.serializers.UserAuthSerializer import UserAuthPhoneSerializer
@@ -16,7 +17,7 @@ from app.users.serializers.UserAuthSerializer import VerifyCodeSerializer
 from app.users.services.ClientService import ClientService
 
 
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(OptimizedQuerySetMixin, viewsets.ModelViewSet):
     """
     ViewSet for interacting with Client instances.
 
@@ -0,0 +1,99 @@
+"""
+Module for PresentationVideoUpload ViewSet.
+
+This module defines the PresentationVideoUploadViewSet class, which is a viewset for the
+resumable presentation video uploads of suppliers and architects using Django REST Framework.
+"""
+
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+
+from app.users.models.PresentationVideoUpload import PresentationVideoUpload
+from app.users.serializers.PresentationVideoUploadSerializer import (
+    PresentationVideoUploadSerializer,
+)
+from app.users.services.PresentationVideoUploadService import PresentationVideoUploadService
+
+
+class PresentationVideoUploadViewSet(viewsets.GenericViewSet):
+    """
+    ViewSet for PresentationVideoUpload model.
+
+    Provides endpoints for the authenticated user to upload a presentation video in chunks:
+    create the upload, send its chunks, then complete it.
+    """
+
+    queryset = PresentationVideoUpload.objects.all()
+    serializer_class = PresentationVideoUploadSerializer
+    permission_classes = [IsAuthenticated]
+
+    @action(detail=False, methods=["POST"], url_path="presentation-video-uploads")
+    def create_upload(self, request):
+        """
+        Starts the upload of a presentation video.
+
+        Args:
+            request (Request): HTTP request object announcing the target, file name, size and
+            SHA-256 checksum of the video.
+
+        Returns:
+            Response: Response containing the upload and the maximum chunk size.
+        """
+        return PresentationVideoUploadService.create_upload(request)
+
+    @action(detail=True, methods=["GET"], url_path="presentation-video-uploads")
+    def get_upload(self, request, pk=None):
+        """
+        Retrieves an upload, to resume it from its offset.
+
+        Args:
+            request (Request): HTTP request object.
+            pk (UUID): ID of the upload.
+
+        Returns:
+            Response: Response containing the upload.
+        """
+        return PresentationVideoUploadService.get_upload(request, pk)
+
+    @action(detail=True, methods=["PUT"], url_path="presentation-video-uploads")
+    def upload_chunk(self, request, pk=None):
+        """
+        Receives a chunk of the video, positioned by the Upload-Offset header.
+
+        Args:
+            request (Request): HTTP request object whose body is the chunk.
+            pk (UUID): ID of the upload.
+
+        Returns:
+            Response: Response containing the upload and its new offset.
+        """
+        return PresentationVideoUploadService.upload_chunk(request, pk)
+
+    @action(detail=True, methods=["DELETE"], url_path="presentation-video-uploads")
+    def delete_upload(self, request, pk=None):
+        """
+        Cancels an upload.
+
+        Args:
+            request (Request): HTTP request object.
+            pk (UUID): ID of the upload.
+
+        Returns:
+            Response: Response indicating whether the upload was deleted.
+        """
+        return PresentationVideoUploadService.delete_upload(request, pk)
+
+    @action(detail=True, methods=["POST"], url_path="presentation-video-uploads/complete")
+    def complete_upload(self, request, pk=None):
+        """
+        Verifies the checksum of the uploaded video and attaches it to the user profile.
+
+        Args:
+            request (Request): HTTP request object.
+            pk (UUID): ID of the upload.
+
+        Returns:
+            Response: Response containing the URL of the presentation video.
+        """
+        return PresentationVideoUploadService.complete_upload(request, pk)
@@ -9,13 +9,19 @@ and profile management.
 from rest_framework import viewsets
 from rest_framework.decorators import action
 
+from app.core.controllers.conditional_response import conditional_response
+from app.core.controllers.conditional_response import constant_validators
+from app.core.controllers.conditional_response import reference_data_validators
+from app.core.controllers.OptimizedQuerySetMixin import OptimizedQuerySetMixin
+from app.users import APPEARANCES
 from app.users.models.Supplier import Supplier
+from app.users.models.SupplierSpeciality import SupplierSpeciality
 from app.users.serializers.SupplierSerializer import SupplierSerializer
 from app.users.serializers.UserAuthSerializer import UserAuthSerializer
 from app.users.services.SupplierService import SupplierService
 
 
-class SupplierViewSet(viewsets.ModelViewSet):
+class SupplierViewSet(OptimizedQuerySetMixin, viewsets.ModelViewSet):
     """
     ViewSet for interacting with Supplier instances.
 
@@ -167,6 +173,7 @@ class SupplierViewSet(viewsets.ModelViewSet):
         permission_classes=[],
         url_path="speciality-types",
     )
+    @conditional_response(reference_data_validators(SupplierSpeciality))
     def get_speciality_types(self, request):
         """
         Retrieves all speciality types.
@@ -186,6 +193,7 @@ class SupplierViewSet(viewsets.ModelViewSet):
         permission_classes=[],
         url_path="appearances",
     )
+    @conditional_response(constant_validators(APPEARANCES))
     def get_appearances(self, request):
         """
         Retrieves all appearances.
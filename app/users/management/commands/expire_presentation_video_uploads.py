@@ -0,0 +1,26 @@
+"""
+Management command deleting abandoned presentation video uploads.
+
+Usage:
+    python manage.py expire_presentation_video_uploads
+"""
+
+from django.core.management.base import BaseCommand
+
+from app.users.services.PresentationVideoUploadService import PresentationVideoUploadService
+
+
+class Command(BaseCommand):
+    """
+    Deletes the presentation video uploads that received no chunk for VIDEO_UPLOAD_EXPIRATION
+    seconds, along with their partial files.
+    """
+
+    help = "Deletes the abandoned resumable presentation video uploads."
+
+    def handle(self, *args, **options):
+        """
+        Expires the uploads and reports their number.
+        """
+        count = PresentationVideoUploadService.expire_uploads()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} abandoned uploads."))
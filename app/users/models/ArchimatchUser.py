@@ -14,6 +14,7 @@ from django.contrib.auth.models import Permission
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
 from app.users import USER_TYPE_CHOICES
 
 
@@ -22,8 +23,8 @@ class ArchimatchUser(AbstractUser):
     Custom user model for the Archimatch application.
 
     Attributes:
-        image (ImageField): Optional profile image for the user. Stored in
-         'ProfileImages/' directory.
+        image (ImageField): Optional profile image for the user, stored in the
+         content-addressed storage.
         phone_number (CharField): Unique phone number of the user, maximum
          length of 20 characters.
         user_type (CharField): Type of the user, selected from choices defined
@@ -44,7 +45,7 @@ class ArchimatchUser(AbstractUser):
     image = models.ImageField(
         blank=True,
         null=True,
-        upload_to="ProfileImages/",
+        storage=ContentAddressedStorage(),
     )
     phone_number = models.CharField(max_length=20, unique=True, null=True)
     user_type = models.CharField(
@@ -16,6 +16,7 @@ from app.core.models.ArchitecturalStyle import ArchitecturalStyle
 from app.core.models.ProjectCategory import ProjectCategory
 from app.core.models.PropertyType import PropertyType
 from app.core.models.WorkType import WorkType
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
 from app.users.models.ArchimatchUser import ArchimatchUser
 
 
@@ -63,12 +64,12 @@ class Architect(BaseModel):
     company_logo = models.ImageField(
         blank=True,
         null=True,
-        upload_to="CompanyLogos/",
+        storage=ContentAddressedStorage(),
     )
     presentation_video = models.FileField(
-        upload_to="ArchitectVideos/",
         blank=True,
         null=True,
+        storage=ContentAddressedStorage(),
     )
 
     # preferences
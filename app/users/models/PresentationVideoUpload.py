@@ -0,0 +1,74 @@
+"""
+Module: PresentationVideoUpload Model
+
+This module defines the PresentationVideoUpload model, tracking a presentation video uploaded
+in chunks until it is attached to the profile of its user.
+
+Classes:
+    PresentationVideoUpload: Model representing a resumable video upload.
+"""
+
+import uuid
+
+from django.db import models
+
+from app.users.models.ArchimatchUser import ArchimatchUser
+
+
+class PresentationVideoUpload(models.Model):
+    """
+    Model representing a resumable upload of a presentation video.
+
+    The received bytes are appended to a file of VIDEO_UPLOAD_DIRECTORY named after the id of
+    the upload.
+
+    Attributes:
+        TARGETS (list): Profiles a presentation video can be attached to.
+        id (UUIDField): Unguessable identifier of the upload.
+        user (ForeignKey): User uploading the video.
+        target (CharField): Profile the video is attached to, selected from TARGETS.
+        filename (CharField): Name of the file on the client.
+        size (PositiveBigIntegerField): Total size of the video in bytes.
+        checksum (CharField): Hexadecimal SHA-256 digest of the whole video.
+        offset (PositiveBigIntegerField): Number of bytes received so far.
+        created_at (DateTimeField): When the upload started.
+        updated_at (DateTimeField): When the last chunk was received.
+    """
+
+    TARGETS = [
+        ("supplier", "Supplier"),
+        ("architect", "Architect"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        ArchimatchUser,
+        related_name="presentation_video_uploads",
+        on_delete=models.CASCADE,
+    )
+    target = models.CharField(max_length=10, choices=TARGETS)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    checksum = models.CharField(max_length=64)
+    offset = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """
+        Return a string representation of the upload.
+
+        Returns:
+            str: File name and progress of the upload.
+        """
+        return f"{self.filename} ({self.offset}/{self.size} bytes)"
+
+    class Meta:
+        """
+        Meta class for Presentation Video Upload model.
+
+        Provides verbose names for the model in the Django admin interface.
+        """
+
+        verbose_name = "Presentation Video Upload"
+        verbose_name_plural = "Presentation Video Uploads"
@@ -10,6 +10,7 @@ Classes:
 from django.db import models
 
 from app.core.models import BaseModel
+from app.core.storage.ContentAddressedStorage import ContentAddressedStorage
 from app.users import APPEARANCES
 from app.users.models import ArchimatchUser
 from app.users.models.SupplierSocialMedia import SupplierSocialMedia
@@ -29,7 +30,7 @@ class Supplier(BaseModel):
         company_name (CharField): Name of the company associated with the supplier,
         maximum length of 255 characters.
         presentation_video (FileField): Video presentation file uploaded by the supplier,
-        stored in 'SupplierVideos/' directory.
+        stored in the content-addressed storage.
         type (TextField): Type or category of the supplier, maximum length of
         1000 characters.
         social_links (OneToOneField): Associated SocialMedia instance for social
@@ -43,9 +44,9 @@ class Supplier(BaseModel):
     bio = models.TextField(max_length=1000, default="")
     company_name = models.CharField(max_length=255, default="")
     presentation_video = models.FileField(
-        upload_to="SupplierVideos/",
         blank=True,
         null=True,
+        storage=ContentAddressedStorage(),
     )
     speciality_type = models.ManyToManyField(
         SupplierSpeciality,
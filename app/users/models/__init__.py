@@ -3,5 +3,6 @@ from app.users.models.ArchimatchUser import ArchimatchUser
 from app.users.models.Architect import Architect
 from app.users.models.ArchitectType import ArchitectType
 from app.users.models.Client import Client
+from app.users.models.PresentationVideoUpload import PresentationVideoUpload
 from app.users.models.Supplier import Supplier
 from app.users.models.SupplierSpeciality import SupplierSpeciality
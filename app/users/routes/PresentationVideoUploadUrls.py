@@ -0,0 +1,29 @@
+"""
+exposed URLS for users app
+viewset : PresentationVideoUploadViewSet
+"""
+
+from django.urls import path
+
+from app.users.controllers.PresentationVideoUploadViewSet import PresentationVideoUploadViewSet
+
+
+presentation_video_upload_urlpatterns = [
+    path(
+        "presentation-video-uploads/",
+        PresentationVideoUploadViewSet.as_view({"post": "create_upload"}),
+        name="presentation-video-uploads",
+    ),
+    path(
+        "presentation-video-uploads/<uuid:pk>/",
+        PresentationVideoUploadViewSet.as_view(
+            {"get": "get_upload", "put": "upload_chunk", "delete": "delete_upload"}
+        ),
+        name="presentation-video-upload",
+    ),
+    path(
+        "presentation-video-uploads/<uuid:pk>/complete/",
+        PresentationVideoUploadViewSet.as_view({"post": "complete_upload"}),
+        name="presentation-video-upload-complete",
+    ),
+]
@@ -10,12 +10,13 @@ Classes:
 
 from rest_framework import serializers
 
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
 from app.users.models import Admin
 from app.users.models import ArchimatchUser
 from app.users.serializers.ArchimatchUserSerializer import ArchimatchUserSerializer
 
 
-class AdminSerializer(serializers.ModelSerializer):
+class AdminSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for the Admin model.
 
@@ -103,7 +104,8 @@ class AdminSerializer(serializers.ModelSerializer):
         Customize the representation of an Admin instance.
 
         This method customizes the serialized representation of an Admin instance,
-          including handling superuser rights.
+          including handling superuser rights. The rights are left out when a sparse
+          fieldset drops them.
 
         Args:
             instance (Admin): The admin instance to represent.
@@ -112,6 +114,8 @@ class AdminSerializer(serializers.ModelSerializer):
             dict: The customized serialized representation of the admin instance.
         """
         data = super().to_representation(instance)
+        if "rights" not in self.fields:
+            return data
         if instance.super_user:
             data["rights"] = ["__All__"]
         else:
@@ -15,11 +15,12 @@ from app.announcement.serializers.ArchitecturalStyleSerializer import Architectu
 from app.announcement.serializers.ProjectCategorySerializer import ProjectCategorySerializer
 from app.announcement.serializers.PropertyTypeSerializer import PropertyTypeSerializer
 from app.announcement.serializers.WorkTypeSerializer import WorkTypeSerializer
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
 from app.users.models import Architect
 from app.users.serializers.ArchimatchUserSerializer import ArchimatchUserSerializer
 
 
-class ArchitectSerializer(serializers.ModelSerializer):
+class ArchitectSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for the Architect model.
 
@@ -10,12 +10,13 @@ Classes:
 
 from rest_framework import serializers
 
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
 from app.users.models import ArchimatchUser
 from app.users.models import Client
 from app.users.serializers.ArchimatchUserSerializer import ArchimatchUserSerializer
 
 
-class ClientSerializer(serializers.ModelSerializer):
+class ClientSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for the Client model.
 
@@ -0,0 +1,110 @@
+"""
+Module containing PresentationVideoUploadSerializer class.
+
+This module provides a serializer for the PresentationVideoUpload model, validating the
+announced video before any byte is received.
+
+Classes:
+    PresentationVideoUploadSerializer: Serializer for the PresentationVideoUpload model.
+"""
+
+import os
+import re
+
+from django.conf import settings
+
+from rest_framework import serializers
+
+from app.users.models.PresentationVideoUpload import PresentationVideoUpload
+
+
+class PresentationVideoUploadSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the PresentationVideoUpload model.
+
+    The user is taken from the authenticated request, and the offset only advances as chunks
+    are received.
+
+    Attributes:
+        checksum_pattern (Pattern): Pattern of a hexadecimal SHA-256 digest.
+    """
+
+    checksum_pattern = re.compile(r"^[0-9a-f]{64}$")
+
+    class Meta:
+        """
+        Meta class for PresentationVideoUploadSerializer.
+
+        Specifies the model to be serialized and the fields to be included in the serialization.
+        """
+
+        model = PresentationVideoUpload
+        fields = [
+            "id",
+            "target",
+            "filename",
+            "size",
+            "checksum",
+            "offset",
+            "created_at",
+        ]
+        read_only_fields = ["id", "offset", "created_at"]
+
+    def validate_filename(self, value):
+        """
+        Checks that the file name has an accepted video extension.
+
+        Args:
+            value (str): Name of the file on the client.
+
+        Raises:
+            ValidationError: If the extension is not accepted.
+
+        Returns:
+            str: The base name of the file.
+        """
+        value = os.path.basename(value)
+        extension = os.path.splitext(value)[1].lstrip(".").lower()
+        if extension not in settings.VIDEO_UPLOAD_EXTENSIONS:
+            raise serializers.ValidationError(
+                f"Unsupported video format, expected one of "
+                f"{', '.join(settings.VIDEO_UPLOAD_EXTENSIONS)}."
+            )
+        return value
+
+    def validate_size(self, value):
+        """
+        Checks that the video is not empty and fits in VIDEO_UPLOAD_MAX_SIZE.
+
+        Args:
+            value (int): Total size of the video in bytes.
+
+        Raises:
+            ValidationError: If the size is out of bounds.
+
+        Returns:
+            int: The size.
+        """
+        if not 0 < value <= settings.VIDEO_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"Ensure the video size is between 1 and {settings.VIDEO_UPLOAD_MAX_SIZE} bytes."
+            )
+        return value
+
+    def validate_checksum(self, value):
+        """
+        Checks that the checksum is a hexadecimal SHA-256 digest.
+
+        Args:
+            value (str): Checksum announced by the client.
+
+        Raises:
+            ValidationError: If the checksum is malformed.
+
+        Returns:
+            str: The lower-cased checksum.
+        """
+        value = value.lower()
+        if not self.checksum_pattern.match(value):
+            raise serializers.ValidationError("Expected a hexadecimal SHA-256 digest.")
+        return value
@@ -11,13 +11,14 @@ Classes:
 
 from rest_framework import serializers
 
+from app.core.serializers.SparseFieldsetsMixin import SparseFieldsetsMixin
 from app.users.models import Supplier
 from app.users.serializers.ArchimatchUserSerializer import ArchimatchUserSerializer
 from app.users.serializers.SupplierSocialMediaSerializer import SupplierSocialMediaSerializer
 from app.users.serializers.SupplierSpecialitySerializer import SupplierSpecialitySerializer
 
 
-class SupplierSerializer(serializers.ModelSerializer):
+class SupplierSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for the Supplier model.
 
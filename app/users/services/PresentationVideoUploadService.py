@@ -0,0 +1,427 @@
+"""
+Module: presentation video upload Service
+
+This module defines the PresentationVideoUploadService class that receives presentation videos
+in chunks, so that large videos never hold a worker for a whole upload and resume after a
+network failure.
+
+The protocol has three steps: the client announces the video (name, size and SHA-256
+checksum), sends it in chunks of at most VIDEO_UPLOAD_CHUNK_SIZE bytes with PUT requests
+carrying their position in an Upload-Offset header, then completes the upload. Chunks are
+written straight to a file of VIDEO_UPLOAD_DIRECTORY. Completing verifies the checksum and
+moves the file into the media storage, attached to the supplier or architect profile of the
+user.
+
+Classes:
+    AssembledVideo: File assembled from the chunks of an upload.
+    PresentationVideoUploadService: Service class for resumable presentation video uploads.
+
+"""
+
+import datetime
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from app.core.validation.exceptions import UploadTooLargeException
+from app.users.models.Architect import Architect
+from app.users.models.PresentationVideoUpload import PresentationVideoUpload
+from app.users.models.Supplier import Supplier
+from app.users.serializers.PresentationVideoUploadSerializer import (
+    PresentationVideoUploadSerializer,
+)
+
+
+class AssembledVideo(File):
+    """
+    File assembled from the chunks of an upload.
+
+    The file system storage moves files providing temporary_file_path instead of copying them,
+    and the content-addressed storage reuses the verified content_digest instead of reading
+    the file again.
+
+    Attributes:
+        path (str): Path of the assembled file.
+        content_digest (str): Verified SHA-256 digest of the file.
+    """
+
+    def __init__(self, file, name, path, content_digest):
+        """
+        Wraps an assembled file.
+
+        Args:
+            file (file): Open binary file.
+            name (str): Name of the file on the client.
+            path (str): Path of the assembled file.
+            content_digest (str): Verified SHA-256 digest of the file.
+        """
+        super().__init__(file, name)
+        self.path = path
+        self.content_digest = content_digest
+
+    def temporary_file_path(self):
+        """
+        Returns the path of the assembled file.
+
+        Returns:
+            str: The path.
+        """
+        return self.path
+
+
+class PresentationVideoUploadService:
+    """
+    Service class for the resumable presentation video uploads of the authenticated user.
+
+    Attributes:
+        profiles (dict): Profile model of each upload target.
+        block_size (int): Number of bytes copied at once from requests and files.
+    """
+
+    profiles = {
+        "supplier": Supplier,
+        "architect": Architect,
+    }
+    block_size = 64 * 1024
+
+    @classmethod
+    def create_upload(cls, request):
+        """
+        Starts the upload of a presentation video.
+
+        Args:
+            request (Request): HTTP request object announcing the target, file name, size and
+            checksum of the video.
+
+        Returns:
+            Response: Response containing the upload and the maximum chunk size.
+        """
+        serializer = PresentationVideoUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        target = serializer.validated_data["target"]
+        if cls.get_profile(request.user, target) is None:
+            return cls.profile_required(target)
+        try:
+            upload = serializer.save(user=request.user)
+            path = cls.get_path(upload)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "wb").close()
+            return Response(
+                {
+                    "message": "Presentation video upload created successfully",
+                    "data": PresentationVideoUploadSerializer(upload).data,
+                    "chunk_size": settings.VIDEO_UPLOAD_CHUNK_SIZE,
+                },
+                status=status.HTTP_201_CREATED,
+            )
+        except Exception:
+            raise APIException("Error creating presentation video upload")
+
+    @classmethod
+    def get_upload(cls, request, upload_id):
+        """
+        Retrieves an upload of the current user, to resume it from its offset.
+
+        Args:
+            request (Request): HTTP request object.
+            upload_id (UUID): ID of the upload.
+
+        Returns:
+            Response: Response containing the upload.
+        """
+        upload = PresentationVideoUpload.objects.filter(pk=upload_id, user=request.user).first()
+        if upload is None:
+            return cls.upload_not_found()
+        return Response(
+            PresentationVideoUploadSerializer(upload).data,
+            status=status.HTTP_200_OK,
+        )
+
+    @classmethod
+    def upload_chunk(cls, request, upload_id):
+        """
+        Writes a chunk of the video at the offset given by the Upload-Offset header.
+
+        The body of the request is copied to the upload file as it is read. When the
+        connection breaks, the bytes received so far are kept and the offset tells the client
+        where to resume. Chunks must announce their Content-Length, chunked transfer encoding
+        is not accepted.
+
+        Args:
+            request (Request): HTTP request object whose body is the chunk.
+            upload_id (UUID): ID of the upload.
+
+        Raises:
+            UploadTooLargeException: If the chunk exceeds VIDEO_UPLOAD_CHUNK_SIZE.
+
+        Returns:
+            Response: Response containing the upload and its new offset, a 400 response when
+            a header is missing, or a 409 response holding the expected offset.
+        """
+        try:
+            offset = int(request.headers.get("Upload-Offset", ""))
+            length = int(request.headers.get("Content-Length", ""))
+        except ValueError:
+            return Response(
+                {"message": "Upload-Offset and Content-Length headers are required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if length > settings.VIDEO_UPLOAD_CHUNK_SIZE:
+            raise UploadTooLargeException(
+                f"Chunks cannot exceed {settings.VIDEO_UPLOAD_CHUNK_SIZE} bytes."
+            )
+
+        try:
+            with transaction.atomic():
+                upload = (
+                    PresentationVideoUpload.objects.select_for_update()
+                    .filter(pk=upload_id, user=request.user)
+                    .first()
+                )
+                if upload is None:
+                    return cls.upload_not_found()
+                if offset != upload.offset:
+                    return Response(
+                        {"message": "Unexpected upload offset", "offset": upload.offset},
+                        status=status.HTTP_409_CONFLICT,
+                    )
+                if offset + length > upload.size:
+                    return Response(
+                        {"message": "The chunk exceeds the announced video size"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if length:
+                    upload.offset += cls.write_chunk(
+                        cls.get_path(upload),
+                        offset,
+                        request.stream,
+                        length,
+                    )
+                    upload.save(update_fields=["offset", "updated_at"])
+            return Response(
+                PresentationVideoUploadSerializer(upload).data,
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error receiving presentation video chunk")
+
+    @classmethod
+    def complete_upload(cls, request, upload_id):
+        """
+        Verifies a fully received video and attaches it to the profile of the user.
+
+        Args:
+            request (Request): HTTP request object.
+            upload_id (UUID): ID of the upload.
+
+        Returns:
+            Response: Response containing the URL of the presentation video, or an error
+            response when the video is incomplete or does not match its checksum.
+        """
+        try:
+            with transaction.atomic():
+                upload = (
+                    PresentationVideoUpload.objects.select_for_update()
+                    .filter(pk=upload_id, user=request.user)
+                    .first()
+                )
+                if upload is None:
+                    return cls.upload_not_found()
+                if upload.offset != upload.size:
+                    return Response(
+                        {"message": "The video is not fully uploaded", "offset": upload.offset},
+                        status=status.HTTP_409_CONFLICT,
+                    )
+                profile = cls.get_profile(request.user, upload.target)
+                if profile is None:
+                    return cls.profile_required(upload.target)
+
+                path = cls.get_path(upload)
+                digest = cls.get_digest(path)
+                if digest != upload.checksum:
+                    cls.discard(upload)
+                    return Response(
+                        {"message": "The video does not match its checksum, upload it again"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                with open(path, "rb") as file:
+                    profile.presentation_video.save(
+                        upload.filename,
+                        AssembledVideo(file, upload.filename, path, digest),
+                        save=False,
+                    )
+                profile.save(update_fields=["presentation_video"])
+                cls.discard(upload)
+            return Response(
+                {
+                    "message": "Presentation video successfully updated",
+                    "data": {"presentation_video": profile.presentation_video.url},
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error completing presentation video upload")
+
+    @classmethod
+    def delete_upload(cls, request, upload_id):
+        """
+        Cancels an upload of the current user and deletes the received bytes.
+
+        Args:
+            request (Request): HTTP request object.
+            upload_id (UUID): ID of the upload.
+
+        Returns:
+            Response: Response indicating whether the upload was deleted.
+        """
+        upload = PresentationVideoUpload.objects.filter(pk=upload_id, user=request.user).first()
+        if upload is None:
+            return cls.upload_not_found()
+        try:
+            cls.discard(upload)
+            return Response(
+                {"message": "Presentation video upload deleted successfully"},
+                status=status.HTTP_200_OK,
+            )
+        except Exception:
+            raise APIException("Error deleting presentation video upload")
+
+    @classmethod
+    def expire_uploads(cls):
+        """
+        Deletes the uploads that received no chunk for VIDEO_UPLOAD_EXPIRATION seconds.
+
+        Returns:
+            int: Number of deleted uploads.
+        """
+        cutoff = timezone.now() - datetime.timedelta(seconds=settings.VIDEO_UPLOAD_EXPIRATION)
+        count = 0
+        for upload in PresentationVideoUpload.objects.filter(updated_at__lt=cutoff).iterator():
+            cls.discard(upload)
+            count += 1
+        return count
+
+    @classmethod
+    def write_chunk(cls, path, offset, stream, length):
+        """
+        Copies a chunk from the request stream into the upload file.
+
+        Args:
+            path (str): Path of the upload file.
+            offset (int): Position of the chunk in the video.
+            stream (file): Request body.
+            length (int): Announced length of the chunk.
+
+        Returns:
+            int: Number of bytes received, lower than the length when the connection broke.
+        """
+        received = 0
+        with open(path, "r+b") as file:
+            file.seek(offset)
+            while received < length:
+                try:
+                    data = stream.read(min(cls.block_size, length - received))
+                except OSError:
+                    break
+                if not data:
+                    break
+                file.write(data)
+                received += len(data)
+            file.truncate()
+        return received
+
+    @classmethod
+    def get_digest(cls, path):
+        """
+        Computes the SHA-256 digest of an upload file.
+
+        Args:
+            path (str): Path of the upload file.
+
+        Returns:
+            str: Hexadecimal digest of the file.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(cls.block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @classmethod
+    def discard(cls, upload):
+        """
+        Deletes an upload and its file, if the storage did not take it.
+
+        Args:
+            upload (PresentationVideoUpload): Upload to delete.
+        """
+        try:
+            os.remove(cls.get_path(upload))
+        except FileNotFoundError:
+            pass
+        upload.delete()
+
+    @classmethod
+    def get_path(cls, upload):
+        """
+        Returns the path of the file receiving the chunks of an upload.
+
+        Args:
+            upload (PresentationVideoUpload): Upload.
+
+        Returns:
+            str: Path of the file in VIDEO_UPLOAD_DIRECTORY.
+        """
+        return os.path.join(settings.MEDIA_ROOT, settings.VIDEO_UPLOAD_DIRECTORY, f"{upload.pk}")
+
+    @classmethod
+    def get_profile(cls, user, target):
+        """
+        Returns the supplier or architect profile of a user.
+
+        Args:
+            user (ArchimatchUser): Authenticated user.
+            target (str): Upload target, a key of profiles.
+
+        Returns:
+            Model or None: The profile, None when the user has no such profile.
+        """
+        return cls.profiles[target].objects.filter(user=user).first()
+
+    @classmethod
+    def profile_required(cls, target):
+        """
+        Builds the response returned to users without the profile targeted by an upload.
+
+        Args:
+            target (str): Upload target.
+
+        Returns:
+            Response: A 403 response.
+        """
+        return Response(
+            {"message": f"Only {target}s can upload this presentation video"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    @classmethod
+    def upload_not_found(cls):
+        """
+        Builds the response returned for unknown uploads.
+
+        Returns:
+            Response: A 404 response.
+        """
+        return Response(
+            {"message": "No presentation video upload found with the given ID"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
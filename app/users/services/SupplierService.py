@@ -12,6 +12,7 @@ from rest_framework import status
 from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 
+from app.core.services.ReferenceDataRegistry import ReferenceDataRegistry
 from app.core.validation.exceptions import UserDataException
 from app.users import APPEARANCES
 from app.users.models import ArchimatchUser
@@ -508,7 +509,7 @@ class SupplierService:
             Response: Response object containing the speciality types.
         """
         try:
-            speciality_types = SupplierSpeciality.objects.all()
+            speciality_types = ReferenceDataRegistry.all(SupplierSpeciality)
             speciality_types_data = SupplierSpecialitySerializer(speciality_types, many=True).data
 
             return Response(
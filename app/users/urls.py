@@ -20,6 +20,7 @@ from app.users.controllers.ArchimatchUserViewSet import PhoneTokenObtainPairView
 from app.users.routes.AdminUrls import admin_urlpatterns
 from app.users.routes.ArchimatchUserUrls import archimatch_user_urlpatterns
 from app.users.routes.ClientUrls import client_urlpatterns
+from app.users.routes.PresentationVideoUploadUrls import presentation_video_upload_urlpatterns
 from app.users.routes.SupplierUrls import supplier_urlpatterns
 
 
@@ -31,6 +32,7 @@ urlpatterns = [
     *admin_urlpatterns,
     *archimatch_user_urlpatterns,
     *client_urlpatterns,
+    *presentation_video_upload_urlpatterns,
     *supplier_urlpatterns,
     path(
         "login-email/",
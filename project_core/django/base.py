@@ -11,10 +11,17 @@ from pathlib import Path
 import environ
 
 from project_core.env import BASE_DIR
+from project_core.settings.cache import *
 from project_core.settings.cors import *
 from project_core.settings.email_sending import *
+from project_core.settings.images import *
 from project_core.settings.jwt import *
+from project_core.settings.pagination import *
+from project_core.settings.reference_data import *
+from project_core.settings.search import *
 from project_core.settings.sms_sending import *
+from project_core.settings.storage import *
+from project_core.settings.uploads import *
 
 
 env = environ.Env()
@@ -29,6 +36,7 @@ THIRD_PARTY_APPS = [
     "rest_framework_simplejwt",
     "djangorestframework_camel_case",
     "drf_standardized_errors",
+    "background_task",
 ]
 
 """
@@ -53,6 +61,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     *LOCAL_APPS,
     *THIRD_PARTY_APPS,
 ]
@@ -74,6 +83,10 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.MultiPartParser",
     ),
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
+    "DEFAULT_PAGINATION_CLASS": (
+        "app.core.controllers.KeysetCursorPagination.KeysetCursorPagination"
+    ),
+    "PAGE_SIZE": PAGINATION_PAGE_SIZE,
 }
 
 """
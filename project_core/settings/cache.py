@@ -0,0 +1,15 @@
+"""
+Module-level constants for cache configuration.
+"""
+
+import environ
+
+
+env = environ.Env()
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+ANNOUNCEMENT_FEED_CACHE_TIMEOUT = 60 * 5
+ANNOUNCEMENT_DETAIL_CACHE_TIMEOUT = 60 * 60
@@ -0,0 +1,19 @@
+"""
+Module-level constants for image processing configuration.
+"""
+
+PROJECT_IMAGE_RENDITIONS = {
+    "thumbnail": 320,
+    "medium": 1024,
+    "large": 2048,
+}
+PROJECT_IMAGE_RENDITION_FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+CMS_IMAGE_RENDITION_WIDTHS = [320, 640, 960, 1280, 1920]
+CMS_IMAGE_RENDITION_FORMATS = PROJECT_IMAGE_RENDITION_FORMATS
+CMS_IMAGE_PLACEHOLDER_WIDTH = 16
+CMS_IMAGE_PLACEHOLDER_BLUR_RADIUS = 1
+CMS_IMAGE_PLACEHOLDER_FORMAT = {"format": "WEBP", "quality": 40}
@@ -0,0 +1,6 @@
+"""
+Module-level constants for pagination configuration.
+"""
+
+PAGINATION_PAGE_SIZE = 20
+PAGINATION_MAX_PAGE_SIZE = 100
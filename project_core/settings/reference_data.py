@@ -0,0 +1,5 @@
+"""
+Module-level constants for reference data configuration.
+"""
+
+REFERENCE_DATA_CHECK_INTERVAL = 5
@@ -0,0 +1,6 @@
+"""
+Module-level constants for search configuration.
+"""
+
+ANNOUNCEMENT_SEARCH_CONFIGS = ["french", "arabic"]
+ANNOUNCEMENT_SEARCH_MAX_LENGTH = 200
@@ -0,0 +1,21 @@
+"""
+Module-level constants for media storage, serving and garbage collection configuration.
+"""
+
+import environ
+
+
+env = environ.Env()
+
+CONTENT_ADDRESSED_STORAGE_DIRECTORY = "objects"
+CONTENT_ADDRESSED_STORAGE_SHARD_DEPTH = 2
+CONTENT_ADDRESSED_STORAGE_SHARD_WIDTH = 2
+
+MEDIA_GC_GRACE_PERIOD = 60 * 60 * 24
+MEDIA_GC_QUARANTINE_DIRECTORY = ".quarantine"
+MEDIA_GC_CHECKPOINT_FILE = ".media-gc-checkpoint.json"
+
+MEDIA_SENDFILE_BACKEND = env("MEDIA_SENDFILE_BACKEND", default="")
+MEDIA_ACCEL_REDIRECT_LOCATION = env("MEDIA_ACCEL_REDIRECT_LOCATION", default="/protected-media/")
+MEDIA_MAX_AGE = 60 * 60
+MEDIA_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
@@ -0,0 +1,23 @@
+"""
+Module-level constants for upload configuration.
+"""
+
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
+# Budgets of the actions listed in the bounded_upload_actions of BoundedUploadMixin.
+UPLOAD_MAX_FILE_SIZE = 25 * 1024 * 1024
+UPLOAD_MAX_REQUEST_SIZE = 150 * 1024 * 1024
+UPLOAD_MAX_FILES = 20
+
+IMAGE_UPLOAD_FORMATS = ["JPEG", "PNG", "WEBP"]
+IMAGE_UPLOAD_MAX_PIXELS = 50_000_000
+IMAGE_UPLOAD_MAX_EDGE = 4096
+IMAGE_UPLOAD_QUALITY = 90
+
+VIDEO_UPLOAD_DIRECTORY = ".uploads"
+VIDEO_UPLOAD_EXTENSIONS = ["mp4", "m4v", "mov", "webm"]
+VIDEO_UPLOAD_MAX_SIZE = 2 * 1024 * 1024 * 1024
+VIDEO_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+VIDEO_UPLOAD_EXPIRATION = 60 * 60 * 24